@@ -1,3 +1,10 @@
+import copy
+import sys
+import threading
+import time
+
+_INICIO = time.perf_counter()  # Para medir el arranque con --medir-inicio
+
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -9,21 +16,115 @@ from PySide6.QtWidgets import (
     QLabel,
     QPushButton,
     QTextEdit,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
+    QSpinBox,
     QLineEdit,
-    QStyledItemDelegate,
+    QComboBox,
+    QCheckBox,
+    QFileDialog,
+    QDockWidget,
+    QTreeWidget,
+    QTreeWidgetItem,
 )
-from PySide6.QtGui import QFont
+from PySide6.QtGui import QAction, QFont
 import pyqtgraph as pg
-import sympy as sp
 import numpy as np
-from PySide6.QtCore import Qt
+from PySide6.QtCore import (
+    Qt,
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+
+from metodos.archivos import cargar_arreglo, guardar_arreglo
+from metodos.expresiones import compilar_expresion
+from metodos.reglaFalsa import regla_falsa, todas_las_raices
+from metodos.lagrange import InterpoladorLagrange, InterpoladorLocal
+from metodos.matrizDispersa import MatrizCSR, es_dispersa
+from metodos.muestreo import muestrear
+from metodos.perfil import Perfilador
+from metodos.resultados import CACHE_RESULTADOS
+
+# Con más puntos que esto no se construye la expresión simbólica del polinomio
+MAX_PUNTOS_SIMBOLICO = 30
+
+# Con más puntos que esto se interpola por tramos con polinomios de grado
+# GRADO_LOCAL en lugar de usar un único polinomio
+MAX_PUNTOS_GLOBAL = 50
+GRADO_LOCAL = 3
+
+# Tamaño máximo del sistema al redimensionar las tablas a mano
+MAX_TAMANO_MANUAL = 2000
+
+# Máximo de componentes de la solución que se escriben en la salida
+MAX_FILAS_SALIDA = 100
+
+FILTRO_ARCHIVOS = "Datos (*.csv *.txt *.npy *.npz *.mtx)"
 
-from metodos.gaussSeidel import gauss_seidel
-from metodos.reglaFalsa import regla_falsa
-from metodos.lagrange import lagrange
+# Nombre mostrado de cada variante de regla falsa
+METODOS_REGLA_FALSA = {
+    "Clásica": "clasica",
+    "Illinois": "illinois",
+    "Anderson-Björck": "anderson-bjorck",
+    "Brent": "brent",
+}
+
+# Mínimo de segundos entre dos avisos de progreso a la interfaz
+INTERVALO_PROGRESO = 0.1
+
+# Evaluaciones de la función por cada curva dibujada, y milisegundos sin
+# mover la vista antes de volver a muestrearla
+MAX_EVALUACIONES_GRAFICA = 2000
+ESPERA_REMUESTREO_MS = 150
+
+# Resoluciones que se conservan en el panel de rendimiento
+MAX_EJECUCIONES_PERFIL = 20
+
+
+class SenalesTrabajo(QObject):
+    progreso = Signal(object)
+    terminado = Signal(object)
+    fallo = Signal(str)
+
+
+class Trabajo(QRunnable):
+    """
+    Ejecuta una resolución fuera del hilo de la interfaz. funcion recibe el
+    callback que hay que pasarle al método: reenvía el progreso a la
+    interfaz (como mucho cada INTERVALO_PROGRESO segundos) y retorna True
+    cuando se pidió cancelar.
+    """
+
+    def __init__(self, funcion):
+        super().__init__()
+        self.funcion = funcion
+        self.senales = SenalesTrabajo()
+        self.corrida = None
+        self._cancelado = threading.Event()
+        self._ultimo_aviso = 0.0
+
+    def cancelar(self):
+        self._cancelado.set()
+
+    def reportar(self, paso):
+        ahora = time.monotonic()
+        if ahora - self._ultimo_aviso >= INTERVALO_PROGRESO:
+            self._ultimo_aviso = ahora
+            self.senales.progreso.emit(paso)
+        return self._cancelado.is_set()
+
+    def run(self):
+        try:
+            resultado = self.funcion(self.reportar)
+        except Exception as e:
+            self.senales.fallo.emit(str(e))
+        else:
+            self.senales.terminado.emit(resultado)
 
 
 class MainWindow(QMainWindow):
@@ -32,6 +133,31 @@ class MainWindow(QMainWindow):
 
         self.setWindowTitle("Solver de Métodos Numéricos")
 
+        # Interpolador de Lagrange que se actualiza entre cálculos
+        self.interpolador_lagrange = None
+
+        # Recuerda la última solución de Gauss-Seidel para reusarla al
+        # re-resolver (se crea al construir su página)
+        self.sesion_gauss_seidel = None
+
+        self.solucion_gauss_seidel = None
+
+        # Las resoluciones corren en un QThreadPool; un trabajo por página
+        self.pool = QThreadPool.globalInstance()
+        self.trabajos = {}
+        self.etiquetas_progreso = {}
+
+        # Tiempos por fase de las últimas resoluciones (panel Ver > Rendimiento,
+        # que se construye la primera vez que se abre)
+        self.perfilador = Perfilador(MAX_EJECUCIONES_PERFIL)
+        self.panel_perfil = None
+        menu_ver = self.menuBar().addMenu("Ver")
+        self.accion_perfil = QAction("Rendimiento", self)
+        self.accion_perfil.setCheckable(True)
+        self.accion_perfil.setShortcut("Ctrl+Shift+P")
+        self.accion_perfil.toggled.connect(self.mostrar_panel_perfil)
+        menu_ver.addAction(self.accion_perfil)
+
         # Layout principal
         layout_principal = QHBoxLayout()
 
@@ -45,11 +171,18 @@ class MainWindow(QMainWindow):
         self.lista_navegacion.currentRowChanged.connect(self.cambiar_pagina)
         layout_principal.addWidget(self.lista_navegacion)
 
-        # El orden importa
+        # Cada página se construye la primera vez que se visita; mientras
+        # tanto ocupa su lugar un widget vacío. El orden importa
+        self.constructores_paginas = [
+            self.pagina_regla_falsa,
+            self.pagina_gauss_seidel,
+            self.pagina_lagrange,
+        ]
+        self.paginas_construidas = set()
         self.widget_apilado = QStackedWidget()
-        self.widget_apilado.addWidget(self.pagina_regla_falsa())
-        self.widget_apilado.addWidget(self.pagina_gauss_seidel())
-        self.widget_apilado.addWidget(self.pagina_lagrange())
+        for _ in self.constructores_paginas:
+            self.widget_apilado.addWidget(QWidget())
+        self.cambiar_pagina(0)
         layout_principal.addWidget(self.widget_apilado)
 
         # Creamos nuestra ventana principal
@@ -58,9 +191,35 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(widget_central)
 
     def cambiar_pagina(self, indice):
+        if indice < 0:
+            return
+        if indice not in self.paginas_construidas:
+            self.paginas_construidas.add(indice)
+            provisional = self.widget_apilado.widget(indice)
+            self.widget_apilado.insertWidget(indice, self.constructores_paginas[indice]())
+            self.widget_apilado.removeWidget(provisional)
+            provisional.deleteLater()
         self.widget_apilado.setCurrentIndex(indice)
 
+    def controles_trabajo(self, pagina, boton_resolver):
+        """Fila con el botón de resolver, el de cancelar y el progreso de la página."""
+        layout = QHBoxLayout()
+        layout.addWidget(boton_resolver)
+
+        boton_cancelar = QPushButton("Cancelar")
+        boton_cancelar.clicked.connect(lambda: self.cancelar_trabajo(pagina))
+        layout.addWidget(boton_cancelar)
+
+        self.etiquetas_progreso[pagina] = QLabel("")
+        layout.addWidget(self.etiquetas_progreso[pagina])
+        return layout
+
     def pagina_gauss_seidel(self):
+        # Importa Numba (si está instalado), así que se carga hasta aquí
+        from metodos.gaussSeidel import SesionGaussSeidel
+
+        self.sesion_gauss_seidel = SesionGaussSeidel()
+
         pagina = QWidget()
         layout = QVBoxLayout()
 
@@ -77,37 +236,76 @@ class MainWindow(QMainWindow):
         # Layout horizontal para las tablas de la matriz A y el vector b
         layout_tablas = QHBoxLayout()
 
-        # Campos de entrada para la matriz A
-        etiqueta_matriz_a = QLabel("Matriz A:")
-        self.tabla_matriz_a = QTableWidget(3, 3)  # Tabla por defecto de 3x3
-        self.tabla_matriz_a.setFixedSize(300, 300)  # Tamaño más pequeño
-        self.tabla_matriz_a.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.tabla_matriz_a.verticalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.tabla_matriz_a.setItemDelegate(CenterAlignDelegate())
-        layout_tablas.addWidget(etiqueta_matriz_a)
-        layout_tablas.addWidget(self.tabla_matriz_a)
+        # Tamaño del sistema (filas de A y de b)
+        layout_tamano = QHBoxLayout()
+        layout_tamano.addWidget(QLabel("Tamaño del sistema (n):"))
+        self.spin_tamano_gauss_seidel = QSpinBox()
+        # Al redimensionar a mano A es densa; las importadas pueden ser mayores
+        self.spin_tamano_gauss_seidel.setRange(1, MAX_TAMANO_MANUAL)
+        self.spin_tamano_gauss_seidel.setValue(3)
+        self.spin_tamano_gauss_seidel.valueChanged.connect(
+            self.cambiar_tamano_gauss_seidel
+        )
+        layout_tamano.addWidget(self.spin_tamano_gauss_seidel)
+        layout_tamano.addStretch()
+        layout.addLayout(layout_tamano)
+
+        # Campos de entrada para la matriz A (las tablas solo dibujan las
+        # celdas visibles, así que sirven también para matrices grandes)
+        self.modelo_matriz_a = ModeloArreglo(np.zeros((3, 3)))
+        self.tabla_matriz_a = crear_vista_tabla(self.modelo_matriz_a)
+        layout_tablas.addWidget(QLabel("Matriz A:"))
+        layout_tablas.addWidget(self.tabla_matriz_a, stretch=3)
 
         # Campos de entrada para el vector b
-        etiqueta_vector_b = QLabel("Vector b:")
-        self.tabla_vector_b = QTableWidget(3, 1)  # Tabla por defecto de 3x1
-        self.tabla_vector_b.setFixedSize(300, 300)  # Tamaño más pequeño
-        self.tabla_vector_b.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.tabla_vector_b.verticalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.tabla_vector_b.setItemDelegate(CenterAlignDelegate())
-        layout_tablas.addWidget(etiqueta_vector_b)
-        layout_tablas.addWidget(self.tabla_vector_b)
+        self.modelo_vector_b = ModeloArreglo(np.zeros(3), encabezados=["b"])
+        self.tabla_vector_b = crear_vista_tabla(self.modelo_vector_b)
+        layout_tablas.addWidget(QLabel("Vector b:"))
+        layout_tablas.addWidget(self.tabla_vector_b, stretch=1)
 
         layout.addLayout(layout_tablas)
 
+        # Importar y exportar A, b y la solución
+        layout_archivos = QHBoxLayout()
+        for texto, accion in (
+            ("Importar A...", lambda: self.importar_gauss_seidel("A")),
+            ("Importar b...", lambda: self.importar_gauss_seidel("b")),
+            ("Exportar A...", lambda: self.exportar_gauss_seidel("A")),
+            ("Exportar b...", lambda: self.exportar_gauss_seidel("b")),
+            ("Exportar x...", lambda: self.exportar_gauss_seidel("x")),
+        ):
+            boton = QPushButton(texto)
+            boton.clicked.connect(accion)
+            layout_archivos.addWidget(boton)
+        layout.addLayout(layout_archivos)
+
+        # Selección del método (SOR y SSOR estiman omega automáticamente)
+        layout_metodo = QHBoxLayout()
+        layout_metodo.addWidget(QLabel("Método:"))
+        self.combo_metodo_gauss_seidel = QComboBox()
+        self.combo_metodo_gauss_seidel.addItems(["Gauss-Seidel", "SOR", "SSOR"])
+        layout_metodo.addWidget(self.combo_metodo_gauss_seidel)
+        layout.addLayout(layout_metodo)
+
         # Botón de resolver
         boton_resolver2 = QPushButton("Resolver")
         boton_resolver2.clicked.connect(self.resolver_gauss_seidel)
-        layout.addWidget(boton_resolver2)
+        layout.addLayout(self.controles_trabajo("gauss_seidel", boton_resolver2))
 
-        # Área de salida
+        # Área de salida y gráfica de convergencia (se llena mientras itera)
+        layout_resultados = QHBoxLayout()
         self.salida_gauss_seidel = QTextEdit()
         self.salida_gauss_seidel.setReadOnly(True)
-        layout.addWidget(self.salida_gauss_seidel)
+        layout_resultados.addWidget(self.salida_gauss_seidel)
+
+        self.grafico_convergencia = pg.PlotWidget()
+        self.grafico_convergencia.setBackground("w")
+        self.grafico_convergencia.showGrid(x=True, y=True)
+        self.grafico_convergencia.setLogMode(y=True)
+        self.grafico_convergencia.setLabel("left", "error")
+        self.grafico_convergencia.setLabel("bottom", "iteración")
+        layout_resultados.addWidget(self.grafico_convergencia)
+        layout.addLayout(layout_resultados)
 
         pagina.setLayout(layout)
         return pagina
@@ -139,23 +337,27 @@ class MainWindow(QMainWindow):
         boton_eliminar = QPushButton("- Eliminar punto")
         boton_eliminar.clicked.connect(self.eliminar_fila_lagrange)
         layout_controles.addWidget(boton_eliminar)
+
+        boton_importar = QPushButton("Importar puntos...")
+        boton_importar.clicked.connect(self.importar_puntos_lagrange)
+        layout_controles.addWidget(boton_importar)
+
+        boton_exportar = QPushButton("Exportar puntos...")
+        boton_exportar.clicked.connect(self.exportar_puntos_lagrange)
+        layout_controles.addWidget(boton_exportar)
         # TODO: Agregar refresh visual aqui
 
         layout.addLayout(layout_controles)
 
         # Tabla de datos
-        self.tabla_datos_lagrange = QTableWidget(3, 2)
-        self.tabla_datos_lagrange.setHorizontalHeaderLabels(["x", "y"])
-        self.tabla_datos_lagrange.horizontalHeader().setSectionResizeMode(
-            QHeaderView.Stretch
+        # Las celdas vacías son nan
+        self.modelo_puntos_lagrange = ModeloArreglo(
+            np.full((3, 2), np.nan), encabezados=["x", "y"], relleno=np.nan
         )
-        self.tabla_datos_lagrange.horizontalHeader().setDefaultAlignment(
-            Qt.AlignmentFlag.AlignCenter
-        )
-        self.tabla_datos_lagrange.verticalHeader().setSectionResizeMode(
-            QHeaderView.Stretch
+        self.tabla_datos_lagrange = crear_vista_tabla(self.modelo_puntos_lagrange)
+        self.tabla_datos_lagrange.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Stretch
         )
-        self.tabla_datos_lagrange.setItemDelegate(CenterAlignDelegate())
 
         layout.addWidget(self.tabla_datos_lagrange)
 
@@ -171,7 +373,7 @@ class MainWindow(QMainWindow):
         # Botón de resolver
         boton_resolver = QPushButton("Calcular Polinomio")
         boton_resolver.clicked.connect(self.resolver_lagrange)
-        layout.addWidget(boton_resolver)
+        layout.addLayout(self.controles_trabajo("lagrange", boton_resolver))
 
         # Gráfico y resultados
         layout_resultados = QHBoxLayout()
@@ -182,6 +384,7 @@ class MainWindow(QMainWindow):
         self.grafico_lagrange.showGrid(x=True, y=True)
         self.grafico_lagrange.setLabel("left", "y")
         self.grafico_lagrange.setLabel("bottom", "x")
+        self.curva_lagrange = CurvaAdaptativa(self.grafico_lagrange, pen="r")
         layout_resultados.addWidget(self.grafico_lagrange, stretch=2)
 
         # Resultados
@@ -199,13 +402,96 @@ class MainWindow(QMainWindow):
         return pagina
 
     def agregar_fila_lagrange(self):
-        current_rows = self.tabla_datos_lagrange.rowCount()
-        self.tabla_datos_lagrange.insertRow(current_rows)
+        self.modelo_puntos_lagrange.insertar_fila()
 
     def eliminar_fila_lagrange(self):
-        current_row = self.tabla_datos_lagrange.currentRow()
+        current_row = self.tabla_datos_lagrange.currentIndex().row()
         if current_row >= 0:
-            self.tabla_datos_lagrange.removeRow(current_row)
+            self.modelo_puntos_lagrange.eliminar_fila(current_row)
+
+    def cambiar_tamano_gauss_seidel(self, n):
+        """Redimensiona A a n x n y b a n, conservando los valores que caben."""
+        self.modelo_matriz_a.redimensionar(n, n)
+        self.modelo_vector_b.redimensionar(n)
+
+    def pedir_archivo(self, titulo, guardar=False, filtro=FILTRO_ARCHIVOS):
+        """Muestra el diálogo de archivos y retorna la ruta elegida (o None)."""
+        dialogo = QFileDialog.getSaveFileName if guardar else QFileDialog.getOpenFileName
+        ruta, _ = dialogo(self, titulo, "", filtro)
+        return ruta or None
+
+    def importar_gauss_seidel(self, clave):
+        try:
+            ruta = self.pedir_archivo(f"Importar {clave}")
+            if ruta is None:
+                return
+            valores = cargar_arreglo(ruta)
+            if clave == "b" and len(valores.shape) == 2 and 1 in valores.shape:
+                # Vector guardado como una columna o una fila
+                valores = np.asarray(valores).ravel()
+            forma = valores.shape
+            if len(forma) != (2 if clave == "A" else 1):
+                raise ValueError(
+                    "A debe ser una matriz" if clave == "A" else "b debe ser un vector"
+                )
+
+            # El modelo usa el arreglo tal cual (mapeado en memoria si viene
+            # de un .npy); solo se copia si se edita una celda
+            if clave == "A":
+                self.modelo_matriz_a.cambiar_arreglo(valores)
+                # Ajustar b al nuevo tamaño sin volver a redimensionar A
+                self.spin_tamano_gauss_seidel.blockSignals(True)
+                self.spin_tamano_gauss_seidel.setMaximum(
+                    max(MAX_TAMANO_MANUAL, forma[0])
+                )
+                self.spin_tamano_gauss_seidel.setValue(forma[0])
+                self.spin_tamano_gauss_seidel.blockSignals(False)
+                self.modelo_vector_b.redimensionar(forma[0])
+            else:
+                self.modelo_vector_b.cambiar_arreglo(valores)
+            self.salida_gauss_seidel.append(
+                f"{clave} de {' x '.join(map(str, forma))} importada de {ruta}."
+            )
+        except Exception as e:
+            self.fallo_gauss_seidel(str(e))
+
+    def exportar_gauss_seidel(self, clave):
+        try:
+            if clave == "x":
+                valores = self.solucion_gauss_seidel
+                if valores is None:
+                    raise ValueError("Todavía no hay una solución que exportar")
+            elif clave == "A":
+                valores = self.modelo_matriz_a.arreglo
+            else:
+                valores = self.modelo_vector_b.arreglo
+
+            ruta = self.pedir_archivo(f"Exportar {clave}", guardar=True)
+            if ruta is not None:
+                guardar_arreglo(ruta, valores)
+        except Exception as e:
+            self.fallo_gauss_seidel(str(e))
+
+    def importar_puntos_lagrange(self):
+        try:
+            ruta = self.pedir_archivo("Importar puntos")
+            if ruta is None:
+                return
+            puntos = np.asarray(cargar_arreglo(ruta))
+            if puntos.ndim != 2 or puntos.shape[1] != 2:
+                raise ValueError("Los puntos deben tener dos columnas (x, y)")
+            self.modelo_puntos_lagrange.cambiar_arreglo(puntos)
+        except Exception as e:
+            self.fallo_lagrange(str(e))
+
+    def exportar_puntos_lagrange(self):
+        try:
+            puntos = self.modelo_puntos_lagrange.arreglo
+            ruta = self.pedir_archivo("Exportar puntos", guardar=True)
+            if ruta is not None:
+                guardar_arreglo(ruta, puntos)
+        except Exception as e:
+            self.fallo_lagrange(str(e))
 
     def pagina_regla_falsa(self):
         pagina = QWidget()
@@ -246,10 +532,18 @@ class MainWindow(QMainWindow):
         self.entrada_maxiter.setText("1e5")
         layout.addWidget(self.entrada_maxiter)
 
+        layout.addWidget(QLabel("Variante del método:"))
+        self.combo_metodo_regla_falsa = QComboBox()
+        self.combo_metodo_regla_falsa.addItems(list(METODOS_REGLA_FALSA))
+        layout.addWidget(self.combo_metodo_regla_falsa)
+
+        self.casilla_todas_las_raices = QCheckBox("Buscar todas las raíces del intervalo")
+        layout.addWidget(self.casilla_todas_las_raices)
+
         # Botón de resolver
         boton_resolver1 = QPushButton("Resolver")
         boton_resolver1.clicked.connect(self.resolver_regla_falsa)
-        layout.addWidget(boton_resolver1)
+        layout.addLayout(self.controles_trabajo("regla_falsa", boton_resolver1))
 
         # Gráfico y área de salida
         layout_resultados = QHBoxLayout()
@@ -258,6 +552,7 @@ class MainWindow(QMainWindow):
         self.grafico = pg.PlotWidget()
         self.grafico.setBackground("w")
         self.grafico.showGrid(x=True, y=True)
+        self.curva_regla_falsa = CurvaAdaptativa(self.grafico, pen="b")
         layout_resultados.addWidget(self.grafico)
 
         layout_resultados2 = QVBoxLayout()
@@ -271,43 +566,288 @@ class MainWindow(QMainWindow):
         pagina.setLayout(layout)
         return pagina
 
-    def resolver_gauss_seidel(self):
-        try:
-            # Obtener la matriz A de la tabla
-            A = []
-            for i in range(self.tabla_matriz_a.rowCount()):
-                fila = []
-                for j in range(self.tabla_matriz_a.columnCount()):
-                    item = self.tabla_matriz_a.item(i, j)
-                    if item and item.text():
-                        fila.append(float(item.text()))
+    def lanzar_trabajo(
+        self, pagina, funcion, al_terminar, al_fallar, al_progresar=None, corrida=None
+    ):
+        """
+        Ejecuta funcion(callback) en el QThreadPool. Un trabajo nuevo de la
+        misma página reemplaza al que esté en curso: el anterior se cancela y
+        sus resultados se ignoran. al_progresar recibe los Iteracion que
+        llegan (espaciados al menos INTERVALO_PROGRESO segundos). corrida es
+        la Ejecucion del perfilador, que se termina después de al_terminar o
+        al_fallar (o al cancelar el trabajo).
+        """
+        self.cancelar_trabajo(pagina, aviso=False)
+
+        trabajo = Trabajo(funcion)
+        trabajo.corrida = corrida
+        self.trabajos[pagina] = trabajo
+        etiqueta = self.etiquetas_progreso[pagina]
+        etiqueta.setText("Resolviendo...")
+
+        def vigente(manejador):
+            # Solo se atiende al último trabajo lanzado en la página
+            def envoltura(valor):
+                if self.trabajos.get(pagina) is trabajo:
+                    manejador(valor)
+
+            return envoltura
+
+        def progreso(paso):
+            etiqueta.setText(f"Iteración {paso.iteracion} - error {paso.error:.3e}")
+            if al_progresar is not None:
+                al_progresar(paso)
+
+        def terminar(manejador, fallo):
+            def envoltura(valor):
+                del self.trabajos[pagina]
+                etiqueta.setText("")
+                manejador(valor)
+                if corrida is not None:
+                    if fallo:
+                        corrida.terminar("error", valor)
                     else:
-                        fila.append(0.0)  # Valor por defecto si la celda está vacía
-                A.append(fila)
-
-            # Obtener el vector b de la tabla
-            b = []
-            for i in range(self.tabla_vector_b.rowCount()):
-                item = self.tabla_vector_b.item(i, 0)
-                if item and item.text():
-                    b.append(float(item.text()))
-                else:
-                    b.append(0.0)  # Valor por defecto si la celda está vacía
-
-            # Llamar a la función gauss_seidel
-            solucion, iteraciones = gauss_seidel(A, b)
-
-            # Mostrar la solución en el área de salida
-            self.salida_gauss_seidel.clear()
-            self.salida_gauss_seidel.append(f"Convergió en {iteraciones} iteraciones.")
-            for i, x_i in enumerate(solucion):
-                self.salida_gauss_seidel.append(f"x[{i+1}] = {x_i:.6f}")
+                        corrida.terminar()
+                    self.actualizar_perfil()
+
+            return envoltura
+
+        trabajo.senales.progreso.connect(vigente(progreso))
+        trabajo.senales.terminado.connect(vigente(terminar(al_terminar, False)))
+        trabajo.senales.fallo.connect(vigente(terminar(al_fallar, True)))
+        self.pool.start(trabajo)
+
+    def cancelar_trabajo(self, pagina, aviso=True):
+        trabajo = self.trabajos.pop(pagina, None)
+        if trabajo is not None:
+            trabajo.cancelar()
+            if aviso:
+                self.etiquetas_progreso[pagina].setText("Cancelado.")
+            if trabajo.corrida is not None:
+                trabajo.corrida.terminar("cancelado")
+                self.actualizar_perfil()
+
+    def fallo_antes_de_lanzar(self, corrida, mensaje):
+        """Termina la corrida de una resolución cuyos datos no se pudieron leer."""
+        corrida.terminar("error", mensaje)
+        self.actualizar_perfil()
+
+    def mostrar_panel_perfil(self, visible):
+        """Muestra u oculta el panel de rendimiento (lo construye la primera vez)."""
+        if self.panel_perfil is None:
+            if not visible:
+                return
+            self.panel_perfil = self.construir_panel_perfil()
+            self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.panel_perfil)
+        self.panel_perfil.setVisible(visible)
+        if visible:
+            self.actualizar_perfil()
+
+    def construir_panel_perfil(self):
+        panel = QDockWidget("Rendimiento", self)
+        # Cerrar el panel con su botón también desmarca la acción del menú
+        panel.visibilityChanged.connect(
+            lambda visible: visible or self.accion_perfil.setChecked(False)
+        )
 
+        layout = QVBoxLayout()
+        self.arbol_perfil = QTreeWidget()
+        self.arbol_perfil.setHeaderLabels(["Ejecución / fase", "ms", "%"])
+        self.arbol_perfil.header().setSectionResizeMode(
+            0, QHeaderView.ResizeMode.Stretch
+        )
+        layout.addWidget(self.arbol_perfil)
+
+        casilla_cprofile = QCheckBox("Perfilar con cProfile (más lento)")
+        casilla_cprofile.setChecked(self.perfilador.perfilar)
+        casilla_cprofile.toggled.connect(
+            lambda activo: setattr(self.perfilador, "perfilar", activo)
+        )
+        layout.addWidget(casilla_cprofile)
+
+        botones = QHBoxLayout()
+        for texto, accion in (
+            ("Exportar JSON", self.exportar_perfil_json),
+            ("Exportar cProfile", self.exportar_perfil_cprofile),
+            ("Limpiar", self.limpiar_perfil),
+        ):
+            boton = QPushButton(texto)
+            boton.clicked.connect(accion)
+            botones.addWidget(boton)
+        layout.addLayout(botones)
+
+        self.aviso_perfil = QLabel("")
+        layout.addWidget(self.aviso_perfil)
+
+        contenido = QWidget()
+        contenido.setLayout(layout)
+        panel.setWidget(contenido)
+        return panel
+
+    def actualizar_perfil(self):
+        """Vuelve a llenar el panel de rendimiento, con la última ejecución arriba."""
+        if self.panel_perfil is None or not self.panel_perfil.isVisible():
+            return
+        self.arbol_perfil.clear()
+        for posicion, ejecucion in enumerate(reversed(self.perfilador.ejecuciones())):
+            datos = ejecucion.a_dict()
+            total = datos["duracion"]
+            hora = time.strftime("%H:%M:%S", time.localtime(datos["inicio"]))
+            elemento = QTreeWidgetItem(
+                [f"{hora} {datos['nombre']} ({datos['estado']})", f"{total * 1e3:.1f}", ""]
+            )
+            if datos["mensaje"]:
+                elemento.setToolTip(0, datos["mensaje"])
+
+            # Lo que no está en ninguna fase: esperas del pool y de la interfaz
+            fases = dict(datos["fases"])
+            fases["otros"] = max(total - sum(fases.values()), 0.0)
+            for fase, segundos in fases.items():
+                porcentaje = f"{segundos / total:.0%}" if total > 0 else ""
+                elemento.addChild(
+                    QTreeWidgetItem([fase, f"{segundos * 1e3:.1f}", porcentaje])
+                )
+            for contador, valor in datos["contadores"].items():
+                elemento.addChild(QTreeWidgetItem([f"{contador}: {valor}", "", ""]))
+
+            self.arbol_perfil.addTopLevelItem(elemento)
+            elemento.setExpanded(posicion == 0)
+
+    def exportar_perfil_json(self):
+        ruta = self.pedir_archivo("Exportar tiempos", guardar=True, filtro="JSON (*.json)")
+        if ruta is None:
+            return
+        try:
+            self.perfilador.exportar_json(ruta)
+        except OSError as e:
+            self.aviso_perfil.setText(f"Error: {e}")
+            return
+        self.aviso_perfil.setText(f"Guardado en {ruta}")
+
+    def exportar_perfil_cprofile(self):
+        ruta = self.pedir_archivo(
+            "Exportar perfil de cProfile", guardar=True, filtro="pstats (*.prof)"
+        )
+        if ruta is None:
+            return
+        try:
+            self.perfilador.exportar_cprofile(ruta)
+        except (OSError, ValueError) as e:
+            self.aviso_perfil.setText(f"Error: {e}")
+            return
+        self.aviso_perfil.setText(f"Guardado en {ruta} (python -m pstats {ruta})")
+
+    def limpiar_perfil(self):
+        self.perfilador.limpiar()
+        self.aviso_perfil.setText("")
+        self.actualizar_perfil()
+
+    def resolver_gauss_seidel(self):
+        corrida = self.perfilador.iniciar("gauss_seidel")
+        try:
+            # Los arreglos de las tablas, sin copiarlos: si se edita una
+            # celda mientras se resuelve, el modelo copia antes de cambiarla
+            with corrida.fase("lectura"):
+                A = self.modelo_matriz_a.compartir()
+                b = self.modelo_vector_b.compartir()
         except Exception as e:
-            self.salida_gauss_seidel.clear()
-            self.salida_gauss_seidel.append(f"Error: {str(e)}")
+            self.fallo_gauss_seidel(str(e))
+            self.fallo_antes_de_lanzar(corrida, str(e))
+            return
+        corrida.contar("n", len(b))
+
+        # Resolver partiendo de la solución anterior (si la hay)
+        metodo = self.combo_metodo_gauss_seidel.currentText()
+        sesion = self.sesion_gauss_seidel
+
+        # Curva de convergencia en vivo con los avisos de progreso
+        iteraciones, errores = [], []
+        self.grafico_convergencia.clear()
+        curva = self.grafico_convergencia.plot(pen="b", symbol="o", symbolSize=4)
+
+        def progresar(paso):
+            iteraciones.append(paso.iteracion)
+            errores.append(paso.error)
+            with corrida.fase("grafica"):
+                curva.setData(iteraciones, errores)
+
+        def mostrar(resultado):
+            solucion, estado = resultado
+            if estado.error > 0:  # El último punto de la curva
+                iteraciones.append(estado.iteraciones)
+                errores.append(estado.error)
+                with corrida.fase("grafica"):
+                    curva.setData(iteraciones, errores)
+            with corrida.fase("salida"):
+                self.mostrar_gauss_seidel(metodo, solucion, estado)
+
+        def resolver(callback):
+            # Un sistema ya resuelto se toma de la cache; la clave no incluye
+            # el x0 de la sesión, que solo cambia por cuánto se itera
+            clave = CACHE_RESULTADOS.clave(
+                sesion.resolver,
+                A,
+                b,
+                metodo=metodo.lower(),
+                retornar_estado=True,
+                **sesion.opciones,
+            )
+            with corrida.fase("cache"):
+                encontrado, resultado = CACHE_RESULTADOS.obtener(clave)
+            if encontrado:
+                corrida.contar("aciertos_cache")
+                return resultado
+            with corrida.fase("metodo"):
+                resultado = sesion.resolver(
+                    A, b, metodo=metodo.lower(), retornar_estado=True, callback=callback
+                )
+            corrida.contar("iteraciones", resultado[1].iteraciones)
+            if resultado[1].estado != "cancelado":
+                with corrida.fase("cache"):
+                    CACHE_RESULTADOS.guardar(clave, resultado)
+            return resultado
+
+        self.lanzar_trabajo(
+            "gauss_seidel",
+            resolver,
+            mostrar,
+            self.fallo_gauss_seidel,
+            progresar,
+            corrida,
+        )
+
+    def mostrar_gauss_seidel(self, metodo, solucion, estado):
+        self.solucion_gauss_seidel = np.asarray(solucion)
+
+        # Mostrar el estado y la solución en el área de salida
+        self.salida_gauss_seidel.clear()
+        if not estado.diagonal_dominante:
+            self.salida_gauss_seidel.append(
+                "Advertencia: La matriz no es diagonalmente dominante. "
+                f"Radio espectral estimado (Jacobi): {estado.radio_espectral:.4f}"
+            )
+        self.salida_gauss_seidel.append(f"{metodo}: {estado.mensaje}")
+        if not estado.convergio:
+            self.salida_gauss_seidel.append(
+                f"Se detuvo tras {estado.iteraciones} iteraciones."
+            )
+        if metodo != "Gauss-Seidel":
+            self.salida_gauss_seidel.append(f"omega = {estado.omega:.4f}")
+        self.salida_gauss_seidel.append(f"Residuo: {estado.residuo:.3e}")
+        for i, x_i in enumerate(solucion[:MAX_FILAS_SALIDA]):
+            self.salida_gauss_seidel.append(f"x[{i+1}] = {x_i:.6f}")
+        if len(solucion) > MAX_FILAS_SALIDA:
+            self.salida_gauss_seidel.append(
+                f"... y {len(solucion) - MAX_FILAS_SALIDA} componentes más "
+                "(use Exportar x para guardarlas todas)"
+            )
+
+    def fallo_gauss_seidel(self, mensaje):
+        self.salida_gauss_seidel.clear()
+        self.salida_gauss_seidel.append(f"Error: {mensaje}")
 
     def resolver_regla_falsa(self):
+        corrida = self.perfilador.iniciar("regla_falsa")
 
         # Obtener la función y el intervalo
         expresion_funcion = self.entrada_funcion.text()
@@ -316,147 +856,482 @@ class MainWindow(QMainWindow):
         texto_tol = self.entrada_tol.text()
 
         try:
-            if not expresion_funcion:  # Checamos que la funcion no este vacia
-                raise ValueError("Introduzca una función.")
-
-            if not texto_intervalo:  # Checamos que los intervalos no este vacios
-                raise ValueError("Introduzca el intervalo.")
-
-            # Parsear la función con sympy
-            x = sp.symbols("x")
-            f = sp.sympify(expresion_funcion)
-            f_numerica = sp.lambdify(x, f, "numpy")
-
-            try:
-                maxiter = float(texto_maxiter)
-                tol = float(texto_tol)
-            except:
-                raise ValueError("Valores erroneos en parámetros.")
-
-            try:
-                # Parsear el intervalo
-                a, b = map(float, texto_intervalo.split())
-            except ValueError:
-                raise ValueError("Revisar intervalo ingresado. Error de lectura")
-
-            # Graficar la función
-            x_valores = np.linspace(a, b, 100)
-            y_valores = f_numerica(x_valores)
-            self.grafico.clear()
-            self.grafico.plot(x_valores, y_valores, pen="b")
-
-            # Resolver usando el método de la regla falsa
-            raiz, iteraciones = regla_falsa(f_numerica, a, b, tol, maxiter)
-
-            # Graficamos la raiz
-            self.grafico.plot([raiz], [0], symbol="+", symbolSize=10)
-            self.grafico.addLine(
-                y=0, pen="k"
-            )  # Línea horizontal en y=0 para referencia
-
-            # Mostrar la raíz en el área de salida
+            with corrida.fase("lectura"):
+                if not expresion_funcion:  # Checamos que la funcion no este vacia
+                    raise ValueError("Introduzca una función.")
+
+                if not texto_intervalo:  # Checamos que los intervalos no este vacios
+                    raise ValueError("Introduzca el intervalo.")
+
+                try:
+                    maxiter = float(texto_maxiter)
+                    tol = float(texto_tol)
+                except:
+                    raise ValueError("Valores erroneos en parámetros.")
+
+                try:
+                    # Parsear el intervalo
+                    a, b = map(float, texto_intervalo.split())
+                except ValueError:
+                    raise ValueError("Revisar intervalo ingresado. Error de lectura")
+        except Exception as e:
+            self.fallo_regla_falsa(str(e))
+            self.fallo_antes_de_lanzar(corrida, str(e))
+            return
+
+        variante = self.combo_metodo_regla_falsa.currentText()
+        metodo = METODOS_REGLA_FALSA[variante]
+        buscar_todas = self.casilla_todas_las_raices.isChecked()
+
+        def resolver(callback):
+            # Parsear la función con sympy (se reusa si ya se compiló antes)
+            with corrida.fase("compilacion"):
+                f_numerica = compilar_expresion(expresion_funcion)
+
+            # Muestras para graficar la función (más densas donde cambia rápido)
+            with corrida.fase("muestreo"):
+                x_valores, y_valores = muestrear(
+                    f_numerica, a, b, max_evaluaciones=MAX_EVALUACIONES_GRAFICA
+                )
+            corrida.contar("muestras", len(x_valores))
+
+            if buscar_todas:
+                # Se reusan las muestras de la gráfica para ubicar los cambios de signo
+                with corrida.fase("metodo"):
+                    raices = CACHE_RESULTADOS.resolver(
+                        todas_las_raices,
+                        f_numerica,
+                        a,
+                        b,
+                        tol,
+                        maxiter,
+                        metodo=metodo,
+                        muestras_previas=(x_valores, y_valores),
+                    )
+                corrida.contar("raices", len(raices))
+                return f_numerica, x_valores, y_valores, raices, None
+
+            # Resolver usando el método de la regla falsa (o tomarlo de la cache)
+            with corrida.fase("metodo"):
+                raiz, estado = CACHE_RESULTADOS.resolver(
+                    regla_falsa,
+                    f_numerica,
+                    a,
+                    b,
+                    tol,
+                    maxiter,
+                    metodo=metodo,
+                    retornar_estado=True,
+                    callback=callback,
+                )
+            corrida.contar("iteraciones", estado.iteraciones)
+            corrida.contar("evaluaciones", estado.evaluaciones)
+            if not estado.convergio:
+                raise ValueError(
+                    "El método no convergió en el número máximo de iteraciones."
+                )
+            return f_numerica, x_valores, y_valores, [raiz], estado
+
+        def mostrar(resultado):
+            f_numerica, x_valores, y_valores, raices, estado = resultado
+
+            # Graficar la función y las raíces
+            with corrida.fase("grafica"):
+                self.grafico.clear()
+                self.curva_regla_falsa.mostrar(f_numerica, x_valores, y_valores)
+                self.grafico.plot(
+                    raices, [0] * len(raices), pen=None, symbol="+", symbolSize=10
+                )
+                self.grafico.addLine(
+                    y=0, pen="k"
+                )  # Línea horizontal en y=0 para referencia
+
+            # Mostrar las raíces en el área de salida
             self.salida_regla_falsa.clear()
             self.salida_regla_falsa.append(f"Función: {expresion_funcion}")
             self.salida_regla_falsa.append(f"Intervalo: [{a}, {b}]")
-            self.salida_regla_falsa.append(f"Raíz encontrada: {raiz:.6f}")
-            self.salida_regla_falsa.append(f"Iteraciones: {iteraciones}")
-        except Exception as e:
-            self.salida_regla_falsa.clear()
-            self.salida_regla_falsa.append(f"Aviso: {str(e)} ")
+            if estado is None:
+                self.salida_regla_falsa.append(f"Variante: {variante}")
+                self.salida_regla_falsa.append(f"Raíces encontradas: {len(raices)}")
+                for i, raiz in enumerate(raices):
+                    self.salida_regla_falsa.append(f"x[{i+1}] = {raiz:.6f}")
+                return
+
+            self.salida_regla_falsa.append(f"Raíz encontrada: {raices[0]:.6f}")
+            self.salida_regla_falsa.append(f"Variante: {variante}")
+            self.salida_regla_falsa.append(f"Iteraciones: {estado.iteraciones}")
+            self.salida_regla_falsa.append(
+                f"Evaluaciones de f: {estado.evaluaciones}"
+            )
+
+        self.lanzar_trabajo(
+            "regla_falsa", resolver, mostrar, self.fallo_regla_falsa, corrida=corrida
+        )
+
+    def fallo_regla_falsa(self, mensaje):
+        self.salida_regla_falsa.clear()
+        self.salida_regla_falsa.append(f"Aviso: {mensaje} ")
 
     def resolver_lagrange(self):
+        corrida = self.perfilador.iniciar("lagrange")
         try:
-            # Obtener los datos de la tabla
-            puntos = []
-            for i in range(self.tabla_datos_lagrange.rowCount()):
-                x_item = self.tabla_datos_lagrange.item(i, 0)
-                y_item = self.tabla_datos_lagrange.item(i, 1)
-
-                if x_item and y_item and x_item.text() and y_item.text():
+            with corrida.fase("lectura"):
+                # Obtener los datos de la tabla (las celdas vacías son nan)
+                puntos = self.modelo_puntos_lagrange.compartir()
+                incompletas = np.flatnonzero(np.isnan(puntos).any(axis=1))
+                if len(incompletas):
+                    raise ValueError(f"Fila {incompletas[0] + 1} incompleta")
+
+                if len(puntos) < 2:
+                    raise ValueError("Se necesitan al menos 2 puntos para la interpolación")
+
+                # Obtener el valor a interpolar si se especificó
+                x_interpolar = None
+                if self.entrada_interpolar.text():
                     try:
-                        x = float(x_item.text())
-                        y = float(y_item.text())
-                        puntos.append((x, y))
+                        x_interpolar = float(self.entrada_interpolar.text())
                     except ValueError:
-                        raise ValueError(f"Valores no numéricos en fila {i+1}")
-                else:
-                    raise ValueError(f"Fila {i+1} incompleta")
-
-            if len(puntos) < 2:
-                raise ValueError("Se necesitan al menos 2 puntos para la interpolación")
-
-            # Separar las coordenadas x e y
-            x_vals = [p[0] for p in puntos]
-            y_vals = [p[1] for p in puntos]
-
-            # Obtener el valor a interpolar si se especificó
-            x_interpolar = None
-            if self.entrada_interpolar.text():
-                try:
-                    x_interpolar = float(self.entrada_interpolar.text())
-                except ValueError:
-                    raise ValueError("El valor a interpolar debe ser un número")
-
-            # Calcular el polinomio de Lagrange
-            polinomio, resultado = lagrange(puntos, x_interpolar)
+                        raise ValueError("El valor a interpolar debe ser un número")
+
+            # Actualizar el interpolador solo con los puntos que cambiaron
+            # (la forma simbólica solo se usa para mostrarla)
+            # Con muchos puntos se interpola por tramos (se construye en el trabajo)
+            por_tramos = len(puntos) > MAX_PUNTOS_GLOBAL
+            if not por_tramos:
+                with corrida.fase("interpolador"):
+                    if self.interpolador_lagrange is None:
+                        self.interpolador_lagrange = InterpoladorLagrange(puntos)
+                    else:
+                        self.interpolador_lagrange.sincronizar(puntos)
+        except Exception as e:
+            self.fallo_lagrange(str(e))
+            self.fallo_antes_de_lanzar(corrida, str(e))
+            return
+        corrida.contar("puntos", len(puntos))
+
+        # El trabajo usa una copia, para que un cálculo nuevo pueda
+        # actualizar el interpolador mientras este sigue en curso
+        interpolador = None if por_tramos else copy.copy(self.interpolador_lagrange)
+
+        def resolver(callback):
+            nonlocal interpolador
+            if por_tramos:
+                with corrida.fase("interpolador"):
+                    interpolador = InterpoladorLocal(puntos, grado=GRADO_LOCAL)
+
+            polinomio = None
+            if len(puntos) <= MAX_PUNTOS_SIMBOLICO:
+                # La forma simbólica es lo más caro: se toma de la cache si
+                # ya se calculó para estos puntos
+                with corrida.fase("simbolico"):
+                    clave = CACHE_RESULTADOS.clave(polinomio_lagrange, puntos)
+                    encontrado, polinomio = CACHE_RESULTADOS.obtener(clave)
+                    if not encontrado:
+                        # Lo mismo que polinomio_lagrange(puntos), reusando
+                        # el interpolador
+                        polinomio = str(interpolador.polinomio())
+                        CACHE_RESULTADOS.guardar(clave, polinomio)
+                if encontrado:
+                    corrida.contar("aciertos_cache")
+
+            resultado = None
+            if x_interpolar is not None:
+                resultado = interpolador(x_interpolar)
+
+            # Evaluar el polinomio de interpolación directamente para graficarlo
+            x_min, x_max = puntos[:, 0].min(), puntos[:, 0].max()
+            x_range = x_max - x_min
+            with corrida.fase("muestreo"):
+                x_plot, y_plot = muestrear(
+                    interpolador,
+                    x_min - 0.1 * x_range,
+                    x_max + 0.1 * x_range,
+                    max_evaluaciones=MAX_EVALUACIONES_GRAFICA,
+                )
+            corrida.contar("muestras", len(x_plot))
+            return polinomio, resultado, x_plot, y_plot
+
+        def mostrar(resultados):
+            polinomio, resultado, x_plot, y_plot = resultados
+
+            # Al ser el último trabajo, la copia tiene los mismos puntos y ya
+            # guarda la forma simbólica calculada
+            if not por_tramos:
+                self.interpolador_lagrange = interpolador
 
             # Mostrar resultados
             self.salida_lagrange.clear()
             self.salida_lagrange.append("Polinomio de Lagrange:")
-            self.salida_lagrange.append(f"P(x) = {polinomio}")
+            if por_tramos:
+                self.salida_lagrange.append(
+                    f"P(x) por tramos de grado {GRADO_LOCAL} "
+                    f"({len(puntos)} puntos, más de {MAX_PUNTOS_GLOBAL})"
+                )
+            elif polinomio is not None:
+                self.salida_lagrange.append(f"P(x) = {polinomio}")
+            else:
+                self.salida_lagrange.append(
+                    f"P(x) de grado {len(puntos) - 1} (forma simbólica omitida)"
+                )
 
             if x_interpolar is not None:
                 self.salida_lagrange.append("\nResultado de la interpolación:")
                 self.salida_lagrange.append(f"P({x_interpolar}) = {resultado}")
 
             # Graficar los puntos y el polinomio
-            self.grafico_lagrange.clear()
+            with corrida.fase("grafica"):
+                self.grafico_lagrange.clear()
+
+                # Graficar puntos de entrada
+                self.grafico_lagrange.plot(
+                    puntos[:, 0],
+                    puntos[:, 1],
+                    pen=None,
+                    symbol="o",
+                    symbolSize=10,
+                    symbolBrush="b",
+                )
+                self.curva_lagrange.mostrar(interpolador, x_plot, y_plot)
+
+        self.lanzar_trabajo(
+            "lagrange", resolver, mostrar, self.fallo_lagrange, corrida=corrida
+        )
 
-            # Graficar puntos de entrada
-            self.grafico_lagrange.plot(
-                x_vals, y_vals, pen=None, symbol="o", symbolSize=10, symbolBrush="b"
-            )
+    def fallo_lagrange(self, mensaje):
+        self.salida_lagrange.append(f"Error: {mensaje}.")
 
-            # Graficar polinomio de interpolación
-            if len(puntos) >= 2:
-                x_min, x_max = min(x_vals), max(x_vals)
-                x_range = x_max - x_min
-                x_plot = np.linspace(x_min - 0.1 * x_range, x_max + 0.1 * x_range, 100)
 
-                # Evaluar el polinomio (esto es simplificado, en la práctica necesitarías parsear el polinomio)
-                try:
-                    x_sym = sp.symbols("x")
-                    expr = sp.sympify(str(polinomio))
-                    f = sp.lambdify(x_sym, expr, "numpy")
-                    y_plot = f(x_plot)
-                    self.grafico_lagrange.plot(x_plot, y_plot, pen="r")
-                except:
-                    self.salida_lagrange.append(
-                        "\nNota: No se pudo graficar el polinomio automáticamente"
-                    )
+def polinomio_lagrange(puntos):
+    """Forma simbólica del polinomio de Lagrange como texto, como se guarda en la cache."""
+    return str(InterpoladorLagrange(puntos).polinomio())
 
-        except Exception as e:
-            self.salida_lagrange.append(f"Error: {str(e)}.")
 
+class CurvaAdaptativa:
+    """
+    Curva de una función en un PlotWidget que se vuelve a muestrear (con
+    muestrear) cada vez que se mueve o acerca la vista. Los cambios de rango
+    se agrupan: solo se evalúa la función cuando la vista deja de moverse
+    durante ESPERA_REMUESTREO_MS, y con a lo más MAX_EVALUACIONES_GRAFICA
+    evaluaciones.
+    """
+
+    def __init__(self, grafico, pen):
+        self.grafico = grafico
+        self.pen = pen
+        self.funcion = None
+        self.curva = None
+        self.rango = None
+
+        # pyqtgraph dibuja solo la parte visible y reduce los puntos cuando
+        # hay más que píxeles
+        grafico.setClipToView(True)
+        grafico.setDownsampling(auto=True, mode="peak")
+
+        self.temporizador = QTimer()
+        self.temporizador.setSingleShot(True)
+        self.temporizador.setInterval(ESPERA_REMUESTREO_MS)
+        self.temporizador.timeout.connect(self.actualizar)
+        grafico.getViewBox().sigXRangeChanged.connect(
+            lambda *_: self.temporizador.start()
+        )
 
-class CenterAlignDelegate(QStyledItemDelegate):
-    def initStyleOption(self, option, index):
-        super().initStyleOption(option, index)
-        option.displayAlignment = Qt.AlignmentFlag.AlignCenter
+    def mostrar(self, funcion, x, y):
+        """Dibuja las muestras ya calculadas (después de grafico.clear())."""
+        self.funcion = funcion
+        self.curva = self.grafico.plot(x, y, pen=self.pen)
+        self.rango = (x[0], x[-1])
+
+    def actualizar(self):
+        if self.funcion is None or self.curva is None:
+            return
+        rango = tuple(self.grafico.getViewBox().viewRange()[0])
+        if rango == self.rango or not rango[0] < rango[1]:
+            return
+        try:
+            x, y = muestrear(
+                self.funcion, *rango, max_evaluaciones=MAX_EVALUACIONES_GRAFICA
+            )
+        except Exception:
+            return  # Se conserva la curva anterior
+        self.rango = rango
+        self.curva.setData(x, y)
 
 
-app = QApplication([])
-ventana = MainWindow()
-app.setStyleSheet(
+class ModeloArreglo(QAbstractTableModel):
     """
-    QLabel{font-size: 18pt;}
-    QTextEdit{font-size: 14pt;}
-    QPushButton{font-size: 15pt;}
-    QLineEdit{font-size: 15pt;}
-    QListWidget{font-size: 15pt; font-weight:bold}
-    QTableWidget{font-size: 14pt;}
-    QTableWidget::view{}
+    Modelo de tabla que muestra y edita directamente un arreglo de NumPy (o
+    una MatrizCSR, solo de lectura). La vista solo pide las celdas visibles,
+    así que el costo no depende del tamaño de la matriz, y los métodos leen
+    el mismo arreglo sin copiarlo.
+
+    El arreglo se copia solo si se edita mientras otro lo está usando
+    (después de compartir()) o si es de solo lectura, como un .npy mapeado:
+    así un cálculo en curso nunca ve cambios a medias.
     """
-)
-ventana.show()
-app.exec()
+
+    def __init__(self, arreglo, encabezados=None, relleno=0.0):
+        """
+        Args:
+            arreglo: Vector o matriz inicial
+            encabezados: Nombres de las columnas (por defecto 1, 2, ...)
+            relleno: Valor de las celdas nuevas al redimensionar (nan se
+                muestra vacío)
+        """
+        super().__init__()
+        self.encabezados = encabezados
+        self.relleno = relleno
+        self._compartido = False
+        self._poner(arreglo)
+
+    def _poner(self, arreglo):
+        if not es_dispersa(arreglo):
+            arreglo = np.asarray(arreglo, dtype=float)
+        self._arreglo = arreglo
+        # Vista de dos dimensiones (un vector se muestra como columna)
+        self._vista = arreglo[:, None] if len(arreglo.shape) == 1 else arreglo
+
+    @property
+    def arreglo(self):
+        return self._arreglo
+
+    def compartir(self):
+        """Retorna el arreglo sin copiarlo; si después se edita, se copia antes."""
+        self._compartido = True
+        return self._arreglo
+
+    def cambiar_arreglo(self, arreglo):
+        self.beginResetModel()
+        self._poner(arreglo)
+        self._compartido = False
+        self.endResetModel()
+
+    def redimensionar(self, filas, columnas=None):
+        """Cambia el tamaño conservando los valores que siguen cabiendo."""
+        columnas = self._vista.shape[1] if columnas is None else columnas
+        if (filas, columnas) == self._vista.shape:
+            return
+        if es_dispersa(self._arreglo):
+            A = self._arreglo
+            i = np.repeat(np.arange(A.shape[0]), np.diff(A.indptr))
+            dentro = (i < filas) & (A.indices < columnas)
+            nuevo = MatrizCSR.desde_tripletas(
+                i[dentro], A.indices[dentro], A.data[dentro], (filas, columnas)
+            )
+        else:
+            nuevo = np.full((filas, columnas), self.relleno)
+            comunes = min(filas, self._vista.shape[0]), min(columnas, self._vista.shape[1])
+            nuevo[: comunes[0], : comunes[1]] = self._vista[: comunes[0], : comunes[1]]
+            if self._arreglo.ndim == 1:
+                nuevo = nuevo[:, 0]
+        self.cambiar_arreglo(nuevo)
+
+    def insertar_fila(self):
+        fila = self.rowCount()
+        self.beginInsertRows(QModelIndex(), fila, fila)
+        nueva = np.full((1, self._vista.shape[1]), self.relleno)
+        arreglo = np.vstack([self._vista, nueva])
+        self._poner(arreglo[:, 0] if self._arreglo.ndim == 1 else arreglo)
+        self._compartido = False
+        self.endInsertRows()
+
+    def eliminar_fila(self, fila):
+        self.beginRemoveRows(QModelIndex(), fila, fila)
+        self._poner(np.delete(self._arreglo, fila, axis=0))
+        self._compartido = False
+        self.endRemoveRows()
+
+    def rowCount(self, padre=QModelIndex()):
+        return 0 if padre.isValid() else self._vista.shape[0]
+
+    def columnCount(self, padre=QModelIndex()):
+        return 0 if padre.isValid() else self._vista.shape[1]
+
+    def data(self, indice, rol=Qt.ItemDataRole.DisplayRole):
+        if rol == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if rol not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return None
+        valor = self._valor(indice.row(), indice.column())
+        if np.isnan(valor):
+            return ""
+        # Al editar se muestra el valor completo: con :g la celda se
+        # redondearía a 6 cifras al confirmar la edición
+        if rol == Qt.ItemDataRole.EditRole:
+            return repr(valor)
+        return f"{valor:g}"
+
+    def _valor(self, i, j):
+        if not es_dispersa(self._arreglo):
+            return float(self._vista[i, j])
+        A = self._arreglo
+        inicio, fin = A.indptr[i], A.indptr[i + 1]
+        k = inicio + np.searchsorted(A.indices[inicio:fin], j)
+        return float(A.data[k]) if k < fin and A.indices[k] == j else 0.0
+
+    def setData(self, indice, valor, rol=Qt.ItemDataRole.EditRole):
+        if rol != Qt.ItemDataRole.EditRole or es_dispersa(self._arreglo):
+            return False
+        texto = str(valor).strip()
+        try:
+            numero = float(texto) if texto else self.relleno
+        except ValueError:
+            return False
+        if self._compartido or not self._arreglo.flags.writeable:
+            self._poner(np.array(self._arreglo))
+            self._compartido = False
+        self._vista[indice.row(), indice.column()] = numero
+        self.dataChanged.emit(indice, indice)
+        return True
+
+    def flags(self, indice):
+        banderas = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if not es_dispersa(self._arreglo):
+            banderas |= Qt.ItemFlag.ItemIsEditable
+        return banderas
+
+    def headerData(self, seccion, orientacion, rol=Qt.ItemDataRole.DisplayRole):
+        if rol != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientacion == Qt.Orientation.Horizontal and self.encabezados:
+            return self.encabezados[seccion]
+        return str(seccion + 1)
+
+
+def crear_vista_tabla(modelo):
+    """QTableView para un ModeloArreglo, con filas y columnas de tamaño fijo."""
+    vista = QTableView()
+    vista.setModel(modelo)
+    for encabezado in (vista.horizontalHeader(), vista.verticalHeader()):
+        encabezado.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    vista.horizontalHeader().setDefaultSectionSize(90)
+    vista.horizontalHeader().setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
+    return vista
+
+
+def main():
+    app = QApplication(sys.argv)
+    ventana = MainWindow()
+    app.setStyleSheet(
+        """
+        QLabel{font-size: 18pt;}
+        QTextEdit{font-size: 14pt;}
+        QPushButton{font-size: 15pt;}
+        QLineEdit{font-size: 15pt;}
+        QListWidget{font-size: 15pt; font-weight:bold}
+        QTableWidget{font-size: 14pt;}
+        QTableWidget::view{}
+        """
+    )
+    ventana.show()
+
+    if "--medir-inicio" in sys.argv:
+        # Se mide cuando el ciclo de eventos ya dibujó la ventana
+        QTimer.singleShot(
+            0,
+            lambda: print(f"Arranque: {time.perf_counter() - _INICIO:.3f} s"),
+        )
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
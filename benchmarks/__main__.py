@@ -0,0 +1,238 @@
+"""
+Suite de rendimiento de metodos/:
+
+    python -m benchmarks --salida base.json
+    python -m benchmarks --salida nuevo.json --comparar base.json
+
+Para cada caso (ver benchmarks/casos.py) mide el tiempo de pared (mínimo y
+mediana de varias repeticiones, después de una ejecución de calentamiento
+que incluye la compilación de Numba), las iteraciones, las evaluaciones de
+la función y el pico de memoria (con tracemalloc, en una ejecución aparte
+porque lo hace más lento). Con --comparar se marcan como regresiones los
+casos cuya mediana empeoró más que --umbral, los que ahora usan más
+iteraciones o evaluaciones y los que convergían y ya no (un método que se
+detiene antes sin converger parecería más rápido); en ese caso el código
+de salida es 1.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.casos import todos_los_casos
+
+
+def medir(caso, repeticiones, tiempo_minimo):
+    """
+    Mide un caso y retorna su resultado como diccionario serializable.
+
+    Se repite al menos repeticiones veces y hasta acumular tiempo_minimo
+    segundos, para que los casos muy rápidos no dependan de una sola
+    medición.
+    """
+    ejecutar = caso.preparar()
+    contadores = ejecutar()  # Calentamiento (compilación, caches)
+
+    tiempos = []
+    inicio = time.perf_counter()
+    while len(tiempos) < repeticiones or time.perf_counter() - inicio < tiempo_minimo:
+        t0 = time.perf_counter()
+        ejecutar()
+        tiempos.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    try:
+        ejecutar()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "nombre": caso.nombre,
+        "metodo": caso.metodo,
+        "parametros": caso.parametros,
+        "tiempo": {
+            "minimo": min(tiempos),
+            "mediana": statistics.median(tiempos),
+            "repeticiones": len(tiempos),
+        },
+        "iteraciones": contadores["iteraciones"],
+        "evaluaciones": contadores["evaluaciones"],
+        "estado": contadores["estado"],
+        "memoria_pico": pico,
+    }
+
+
+def entorno():
+    """Datos de la máquina y del código, para saber qué se está comparando."""
+    try:
+        import numba
+
+        version_numba = numba.__version__
+    except ImportError:
+        version_numba = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            timeout=10,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "numba": version_numba,
+        "plataforma": platform.platform(),
+        "procesador": platform.processor() or platform.machine(),
+        "nucleos": os.cpu_count(),
+    }
+
+
+def comparar(base, actual, umbral, filtro=""):
+    """
+    Compara dos ejecuciones caso por caso. Los casos de la base que no se
+    ejecutaron (y que pasan el filtro) se listan aparte.
+
+    Returns:
+        Una tupla con las líneas del informe y el número de regresiones
+    """
+    anteriores = {r["nombre"]: r for r in base["resultados"]}
+    lineas = [f"{'caso':<52} {'base':>10} {'actual':>10} {'cambio':>8}"]
+    regresiones = 0
+    for r in actual["resultados"]:
+        anterior = anteriores.get(r["nombre"])
+        if anterior is None:
+            lineas.append(f"{r['nombre']:<52} {'(nuevo)':>10}")
+            continue
+        t_base = anterior["tiempo"]["mediana"]
+        t_actual = r["tiempo"]["mediana"]
+        cambio = t_actual / t_base - 1 if t_base > 0 else 0.0
+
+        avisos = []
+        # Los JSON anteriores a este campo no tienen estado
+        estado_base = anterior.get("estado")
+        if estado_base == "convergio" and r["estado"] != "convergio":
+            avisos.append(f"estado {estado_base} -> {r['estado']}")
+        if cambio > umbral:
+            avisos.append("más lento")
+        for contador in ("iteraciones", "evaluaciones"):
+            if (
+                anterior[contador] is not None
+                and r[contador] is not None
+                and r[contador] > anterior[contador]
+            ):
+                avisos.append(f"{contador} {anterior[contador]} -> {r[contador]}")
+        regresiones += bool(avisos)
+
+        lineas.append(
+            f"{r['nombre']:<52} {_formato_tiempo(t_base):>10} "
+            f"{_formato_tiempo(t_actual):>10} {cambio:>+8.1%}"
+            + (f"  REGRESIÓN: {', '.join(avisos)}" if avisos else "")
+        )
+    faltantes = {n for n in anteriores if filtro in n} - {
+        r["nombre"] for r in actual["resultados"]
+    }
+    for nombre in sorted(faltantes):
+        lineas.append(f"{nombre:<52} {'(no se ejecutó)':>10}")
+    return lineas, regresiones
+
+
+def _formato_tiempo(segundos):
+    if segundos < 1e-3:
+        return f"{segundos * 1e6:.1f} µs"
+    if segundos < 1:
+        return f"{segundos * 1e3:.2f} ms"
+    return f"{segundos:.3f} s"
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Suite de rendimiento de metodos/."
+    )
+    parser.add_argument("--salida", help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--comparar", help="JSON de una ejecución anterior")
+    parser.add_argument(
+        "--umbral",
+        type=float,
+        default=0.2,
+        help="Empeoramiento relativo de la mediana que cuenta como regresión",
+    )
+    parser.add_argument(
+        "--filtro", default="", help="Solo los casos cuyo nombre contiene este texto"
+    )
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument(
+        "--tiempo-minimo",
+        type=float,
+        default=0.2,
+        help="Segundos mínimos de medición por caso",
+    )
+    parser.add_argument(
+        "--rapido", action="store_true", help="Menos tamaños, para una revisión rápida"
+    )
+    return parser
+
+
+def main(argv=None):
+    argumentos = crear_parser().parse_args(argv)
+    if argumentos.repeticiones <= 0:
+        print("Error: --repeticiones debe ser positivo", file=sys.stderr)
+        return 2
+
+    base = None
+    if argumentos.comparar:
+        try:
+            with open(argumentos.comparar) as archivo:
+                base = json.load(archivo)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Error: no se pudo leer {argumentos.comparar}: {e}", file=sys.stderr)
+            return 2
+
+    casos = [c for c in todos_los_casos(argumentos.rapido) if argumentos.filtro in c.nombre]
+    resultados = []
+    for caso in casos:
+        resultado = medir(caso, argumentos.repeticiones, argumentos.tiempo_minimo)
+        resultados.append(resultado)
+        contadores = ", ".join(
+            f"{c} {resultado[c]}"
+            for c in ("estado", "iteraciones", "evaluaciones")
+            if resultado[c] is not None
+        )
+        print(
+            f"{caso.nombre:<52} {_formato_tiempo(resultado['tiempo']['mediana']):>10}"
+            f"  {resultado['memoria_pico'] / 2**20:7.2f} MiB  {contadores}",
+            flush=True,
+        )
+
+    ejecucion = {"entorno": entorno(), "resultados": resultados}
+    if argumentos.salida:
+        with open(argumentos.salida, "w") as archivo:
+            json.dump(ejecucion, archivo, indent=2)
+            archivo.write("\n")
+
+    if base is not None:
+        lineas, regresiones = comparar(
+            base, ejecucion, argumentos.umbral, argumentos.filtro
+        )
+        print()
+        print("\n".join(lineas))
+        print(f"\nRegresiones: {regresiones}")
+        return 1 if regresiones else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+Casos de la suite de rendimiento.
+
+Cada caso tiene un nombre único (que identifica el caso al comparar dos
+ejecuciones), los parámetros que lo definen y una función preparar() que
+construye los datos fuera de la medición y retorna la función a medir. Esa
+función resuelve el problema una vez y retorna un diccionario con las
+iteraciones, las evaluaciones y el estado final del método (None si no
+aplican al método).
+
+Los datos aleatorios usan semillas fijas, así que dos ejecuciones resuelven
+exactamente los mismos problemas.
+"""
+
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+SEMILLA = 20250101
+
+
+class Caso(NamedTuple):
+    nombre: str
+    metodo: str
+    parametros: dict
+    preparar: Callable
+
+
+def casos_lagrange(rapido=False):
+    """
+    Interpolación de Lagrange de 5 a 200 puntos (nodos de Chebyshev de
+    sin(3x) en [-1, 1]): construir el interpolador y evaluarlo en 10⁴
+    puntos, y la forma simbólica (lagrange) hasta 30 puntos, que es lo que
+    construye la interfaz.
+    """
+    from metodos.lagrange import InterpoladorLagrange, lagrange
+
+    tamanos = (5, 20, 50) if rapido else (5, 10, 20, 50, 100, 200)
+    evaluar = np.linspace(-1, 1, 10_000)
+
+    def puntos(n):
+        x = np.cos(np.pi * (np.arange(n) + 0.5) / n)
+        return np.column_stack([x, np.sin(3 * x)])
+
+    casos = []
+    for n in tamanos:
+
+        def preparar(n=n):
+            datos = puntos(n)
+
+            def ejecutar():
+                InterpoladorLagrange(datos)(evaluar)
+                return {"iteraciones": None, "evaluaciones": len(evaluar), "estado": None}
+
+            return ejecutar
+
+        casos.append(
+            Caso(f"lagrange/numerico/n={n}", "lagrange", {"puntos": n}, preparar)
+        )
+
+    for n in (t for t in tamanos if t <= 30):
+
+        def preparar(n=n):
+            datos = puntos(n).tolist()
+
+            def ejecutar():
+                lagrange(datos, x_interpolar=0.5)
+                return {"iteraciones": None, "evaluaciones": 1, "estado": None}
+
+            return ejecutar
+
+        casos.append(
+            Caso(f"lagrange/simbolico/n={n}", "lagrange", {"puntos": n}, preparar)
+        )
+    return casos
+
+
+def casos_gauss_seidel(rapido=False):
+    """
+    Gauss-Seidel con matrices densas aleatorias de dominancia diagonal
+    fuerte (2) y débil (1.05), y con la matriz dispersa del laplaciano 2D
+    (5 puntos) con y sin desplazamiento de la diagonal, que controla el
+    condicionamiento.
+    """
+    from metodos.gaussSeidel import gauss_seidel
+
+    densas = (50, 200) if rapido else (50, 200, 800)
+    dispersas = (16, 32) if rapido else (16, 32, 64)
+
+    def ejecutor(A, b):
+        def ejecutar():
+            _, estado = gauss_seidel(A, b, 1e-8, 20_000, retornar_estado=True)
+            return {
+                "iteraciones": estado.iteraciones,
+                "evaluaciones": None,
+                "estado": estado.estado,
+            }
+
+        return ejecutar
+
+    casos = []
+    for n in densas:
+        for nombre, dominancia in (("fuerte", 2.0), ("debil", 1.05)):
+
+            def preparar(n=n, dominancia=dominancia):
+                rng = np.random.default_rng(SEMILLA + n)
+                # Entradas positivas: con dominancia cercana a 1 converge lento
+                A = rng.uniform(0, 1, (n, n))
+                np.fill_diagonal(A, 0.0)
+                np.fill_diagonal(A, dominancia * np.abs(A).sum(axis=1))
+                return ejecutor(A, rng.uniform(-1, 1, n))
+
+            casos.append(
+                Caso(
+                    f"gauss_seidel/densa/n={n}/dominancia={nombre}",
+                    "gauss_seidel",
+                    {"tipo": "densa", "n": n, "dominancia": dominancia},
+                    preparar,
+                )
+            )
+
+    for m in dispersas:
+        for desplazamiento in (1.0, 0.0):
+
+            def preparar(m=m, desplazamiento=desplazamiento):
+                A = laplaciano(m, desplazamiento)
+                rng = np.random.default_rng(SEMILLA + m)
+                return ejecutor(A, rng.uniform(-1, 1, m * m))
+
+            casos.append(
+                Caso(
+                    f"gauss_seidel/dispersa/n={m * m}/desplazamiento={desplazamiento:g}",
+                    "gauss_seidel",
+                    {"tipo": "dispersa", "n": m * m, "desplazamiento": desplazamiento},
+                    preparar,
+                )
+            )
+    return casos
+
+
+def laplaciano(m, desplazamiento=0.0):
+    """
+    Matriz del laplaciano 2D con 5 puntos en una malla de m x m, como
+    MatrizCSR, con desplazamiento sumado a la diagonal (sin desplazamiento
+    el radio espectral de Gauss-Seidel tiende a 1 al crecer m).
+    """
+    from metodos.matrizDispersa import MatrizCSR
+
+    n = m * m
+    indices = np.arange(n)
+    fila, columna = indices // m, indices % m
+    filas, columnas = [indices], [indices]
+    valores = [np.full(n, 4.0 + desplazamiento)]
+    for df, dc in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+        dentro = (0 <= fila + df) & (fila + df < m) & (0 <= columna + dc) & (columna + dc < m)
+        filas.append(indices[dentro])
+        columnas.append(((fila + df) * m + columna + dc)[dentro])
+        valores.append(np.full(dentro.sum(), -1.0))
+    return MatrizCSR.desde_tripletas(
+        np.concatenate(filas), np.concatenate(columnas), np.concatenate(valores), (n, n)
+    )
+
+
+def casos_regla_falsa(rapido=False):
+    """
+    Regla falsa y sus variantes con una función barata (un polinomio) y una
+    cara (promedio de 2·10⁴ tangentes hiperbólicas por evaluación), donde
+    lo que importa es cuántas veces se evalúa f.
+    """
+    from metodos.expresiones import compilar_expresion
+    from metodos.reglaFalsa import regla_falsa
+
+    metodos = ("clasica", "illinois") if rapido else (
+        "clasica",
+        "illinois",
+        "anderson-bjorck",
+        "brent",
+    )
+
+    def cara():
+        centros = np.random.default_rng(SEMILLA).normal(0.3, 1.0, 20_000)
+        return lambda x: np.mean(np.tanh(x - centros))
+
+    funciones = {
+        # La clásica converge lento en este intervalo: un extremo queda fijo
+        "barata": (lambda: compilar_expresion("x**3 - 2*x - 5"), 2.0, 10.0),
+        "cara": (cara, -3.0, 3.0),
+    }
+
+    casos = []
+    for nombre, (crear, a, b) in funciones.items():
+        for metodo in metodos:
+
+            def preparar(crear=crear, a=a, b=b, metodo=metodo):
+                f = crear()
+
+                def ejecutar():
+                    _, estado = regla_falsa(
+                        f, a, b, 1e-12, 100_000, metodo=metodo, retornar_estado=True
+                    )
+                    return {
+                        "iteraciones": estado.iteraciones,
+                        "evaluaciones": estado.evaluaciones,
+                        "estado": estado.estado,
+                    }
+
+                return ejecutar
+
+            casos.append(
+                Caso(
+                    f"regla_falsa/{nombre}/{metodo}",
+                    "regla_falsa",
+                    {"funcion": nombre, "variante": metodo, "a": a, "b": b},
+                    preparar,
+                )
+            )
+    return casos
+
+
+def todos_los_casos(rapido=False):
+    return casos_lagrange(rapido) + casos_gauss_seidel(rapido) + casos_regla_falsa(rapido)
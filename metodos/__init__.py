@@ -0,0 +1,44 @@
+"""
+Métodos numéricos: regla falsa, Gauss-Seidel e interpolación de Lagrange.
+
+Los módulos se importan solo cuando se usa uno de sus nombres, para que
+"import metodos" sea inmediato (NumPy, SymPy y Numba tardan en cargarse).
+Desde la terminal: python -m metodos --help
+"""
+
+import importlib
+
+# Nombre público -> módulo que lo define
+_NOMBRES = {
+    "regla_falsa": "reglaFalsa",
+    "regla_falsa_lote": "reglaFalsa",
+    "todas_las_raices": "reglaFalsa",
+    "EstadoRaiz": "reglaFalsa",
+    "gauss_seidel": "gaussSeidel",
+    "gauss_seidel_lote": "gaussSeidel",
+    "SesionGaussSeidel": "gaussSeidel",
+    "EstadoConvergencia": "gaussSeidel",
+    "lagrange": "lagrange",
+    "InterpoladorLagrange": "lagrange",
+    "InterpoladorLocal": "lagrange",
+    "MatrizCSR": "matrizDispersa",
+    "compilar_expresion": "expresiones",
+    "muestrear": "muestreo",
+    "Iteracion": "traza",
+    "trazar": "traza",
+}
+
+__all__ = list(_NOMBRES)
+
+
+def __getattr__(nombre):
+    if nombre not in _NOMBRES:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    modulo = importlib.import_module(f"{__name__}.{_NOMBRES[nombre]}")
+    valor = getattr(modulo, nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
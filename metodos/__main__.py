@@ -0,0 +1,327 @@
+"""
+Interfaz de línea de comandos, sin Qt:
+
+    python -m metodos regla-falsa "x**2 - 4" 0 5 --metodo illinois
+    python -m metodos gauss-seidel "[[4, 1], [1, 3]]" "[1, 2]"
+    python -m metodos lagrange puntos.txt --x 1.5 --simbolico
+    python -m metodos lotes trabajos.jsonl resultados.jsonl --procesos 8
+    python -m metodos cache --limpiar
+
+Cada subcomando importa solo los módulos que necesita. Los resultados se
+guardan en la cache de metodos.resultados: repetir un problema con los
+mismos datos no vuelve a resolverlo (salvo con --sin-cache).
+"""
+
+import argparse
+import json
+import os
+import sys
+
+
+def _leer_arreglo(texto):
+    """
+    Lee un arreglo desde un archivo (.csv, .txt, .npy, .npz o .mtx, ver
+    metodos.archivos) o desde una lista en JSON escrita directamente.
+    """
+    import numpy as np
+
+    if os.path.isfile(texto):
+        from metodos.archivos import cargar_arreglo
+
+        return cargar_arreglo(texto)
+    try:
+        return np.asarray(json.loads(texto), dtype=float)
+    except (json.JSONDecodeError, ValueError, TypeError):
+        raise ValueError(f"No es un archivo ni una lista válida: {texto}")
+
+
+def _a_json(valor):
+    """Convierte arreglos y números de NumPy a tipos de JSON."""
+    if hasattr(valor, "tolist"):
+        return valor.tolist()
+    if isinstance(valor, float) and valor != valor:
+        return None  # nan
+    return valor
+
+
+def _resolver(argumentos, funcion, *args, **kwargs):
+    """Llama a funcion usando la cache de resultados (salvo con --sin-cache)."""
+    if argumentos.sin_cache:
+        return funcion(*args, **kwargs)
+    from metodos.resultados import CACHE_RESULTADOS
+
+    return CACHE_RESULTADOS.resolver(funcion, *args, **kwargs)
+
+
+def _resolver_regla_falsa(texto, a, b, tol, max_iter, metodo, todas, muestras):
+    # La clave de la cache es el texto de la función: con un acierto no
+    # hace falta importar SymPy
+    from metodos.expresiones import compilar_expresion
+    from metodos.reglaFalsa import regla_falsa, todas_las_raices
+
+    f = compilar_expresion(texto)
+    if todas:
+        raices = todas_las_raices(f, a, b, tol, max_iter, metodo=metodo, muestras=muestras)
+        return {"raices": raices}
+
+    raiz, estado = regla_falsa(
+        f, a, b, tol, max_iter, metodo=metodo, retornar_estado=True
+    )
+    return {
+        "raiz": raiz,
+        "estado": estado.estado,
+        "iteraciones": estado.iteraciones,
+        "evaluaciones": estado.evaluaciones,
+    }
+
+
+def _regla_falsa(argumentos):
+    resultado = _resolver(
+        argumentos,
+        _resolver_regla_falsa,
+        argumentos.funcion,
+        argumentos.a,
+        argumentos.b,
+        argumentos.tol,
+        argumentos.max_iter,
+        argumentos.metodo,
+        argumentos.todas,
+        argumentos.muestras,
+    )
+    if argumentos.todas:
+        raices = resultado["raices"]
+        return resultado, [f"x[{i+1}] = {r:.10g}" for i, r in enumerate(raices)]
+
+    lineas = [
+        f"Raíz encontrada: {resultado['raiz']:.10g}",
+        f"Estado: {resultado['estado']}",
+        f"Iteraciones: {resultado['iteraciones']}",
+        f"Evaluaciones de f: {resultado['evaluaciones']}",
+    ]
+    return resultado, lineas
+
+
+def _gauss_seidel(argumentos):
+    from metodos.gaussSeidel import gauss_seidel
+
+    A = _leer_arreglo(argumentos.A)
+    b = _leer_arreglo(argumentos.b)
+    if b.ndim == 2 and 1 in b.shape:
+        b = b.ravel()  # Vector guardado como una columna o una fila
+    x, estado = _resolver(
+        argumentos,
+        gauss_seidel,
+        A,
+        b,
+        argumentos.tol,
+        argumentos.max_iter,
+        multicolor=argumentos.multicolor,
+        metodo=argumentos.metodo,
+        omega=argumentos.omega,
+        retornar_estado=True,
+    )
+    resultado = {
+        "x": x,
+        "estado": estado.estado,
+        "iteraciones": estado.iteraciones,
+        "residuo": estado.residuo,
+        "omega": estado.omega,
+    }
+    lineas = [estado.mensaje, f"Residuo: {estado.residuo:.3e}"]
+    if argumentos.metodo != "gauss-seidel":
+        lineas.append(f"omega = {estado.omega:.4f}")
+    # Con varias columnas en b, cada x[i] tiene un valor por columna
+    for i, x_i in enumerate(x):
+        valores = x_i if isinstance(x_i, list) else [x_i]
+        lineas.append(f"x[{i+1}] = " + " ".join(f"{v:.10g}" for v in valores))
+    return resultado, lineas
+
+
+def _resolver_lagrange(puntos, local, simbolico, x):
+    from metodos.lagrange import InterpoladorLagrange, InterpoladorLocal
+
+    if local is not None:
+        if simbolico:
+            raise ValueError("La interpolación por tramos no tiene forma simbólica")
+        interpolador = InterpoladorLocal(puntos, grado=local)
+    else:
+        interpolador = InterpoladorLagrange(puntos)
+
+    resultado = {}
+    if simbolico:
+        # Solo aquí se importa SymPy
+        resultado["polinomio"] = str(interpolador.polinomio())
+    if x:
+        resultado["valores"] = interpolador(x).tolist()
+    return resultado
+
+
+def _lagrange(argumentos):
+    puntos = _leer_arreglo(argumentos.puntos)
+    if puntos.ndim != 2 or puntos.shape[1] != 2:
+        raise ValueError("Los puntos deben tener dos columnas (x, y)")
+    resultado = _resolver(
+        argumentos,
+        _resolver_lagrange,
+        puntos,
+        argumentos.local,
+        argumentos.simbolico,
+        argumentos.x,
+    )
+
+    lineas = []
+    if "polinomio" in resultado:
+        lineas.append(f"P(x) = {resultado['polinomio']}")
+    if "valores" in resultado:
+        lineas += [
+            f"P({x}) = {y:.10g}" for x, y in zip(argumentos.x, resultado["valores"])
+        ]
+    return resultado, lineas
+
+
+def _lotes(argumentos):
+    from metodos.lotes import ejecutar_lote
+
+    resumen = ejecutar_lote(
+        argumentos.entrada,
+        argumentos.salida,
+        procesos=argumentos.procesos,
+        max_pendientes=argumentos.pendientes,
+        tamano_bloque=argumentos.bloque,
+        reanudar=not argumentos.desde_cero,
+        usar_cache=not argumentos.sin_cache,
+    )
+    lineas = [
+        f"Líneas procesadas: {resumen['procesadas']}",
+        f"Líneas omitidas (ya estaban en la salida): {resumen['omitidas']}",
+        f"Líneas con error: {resumen['errores']}",
+    ]
+    return resumen, lineas
+
+
+def _cache(argumentos):
+    from metodos.resultados import CACHE_RESULTADOS
+
+    if argumentos.limpiar:
+        CACHE_RESULTADOS.limpiar(disco=True)
+    estadisticas = CACHE_RESULTADOS.estadisticas()
+    resultado = {
+        "archivo": CACHE_RESULTADOS.archivo,
+        "en_disco": estadisticas["en_disco"],
+        "bytes_disco": estadisticas["bytes_disco"],
+        "max_bytes_disco": estadisticas["max_bytes_disco"],
+    }
+    lineas = [
+        f"Archivo: {resultado['archivo'] or '(sin cache en disco)'}",
+        f"Resultados guardados: {resultado['en_disco']}",
+        f"Tamaño: {resultado['bytes_disco'] / 2**20:.2f} de "
+        f"{resultado['max_bytes_disco'] / 2**20:.0f} MiB",
+    ]
+    return resultado, lineas
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m metodos", description="Métodos numéricos desde la terminal."
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Imprime el resultado como JSON"
+    )
+    parser.add_argument(
+        "--sin-cache",
+        action="store_true",
+        help="No usa ni guarda resultados en la cache (ver el subcomando cache)",
+    )
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    regla = subparsers.add_parser("regla-falsa", help="Raíz de f en [a, b]")
+    regla.add_argument("funcion", help='Función de x, p. ej. "x**2 - 4"')
+    regla.add_argument("a", type=float)
+    regla.add_argument("b", type=float)
+    regla.add_argument("--tol", type=float, default=1e-6)
+    regla.add_argument("--max-iter", type=int, default=1000)
+    regla.add_argument(
+        "--metodo",
+        default="clasica",
+        choices=("clasica", "illinois", "anderson-bjorck", "brent"),
+    )
+    regla.add_argument(
+        "--todas", action="store_true", help="Busca todas las raíces del intervalo"
+    )
+    regla.add_argument("--muestras", type=int, default=100)
+    regla.set_defaults(ejecutar=_regla_falsa)
+
+    gauss = subparsers.add_parser("gauss-seidel", help="Resuelve Ax = b")
+    gauss.add_argument("A", help="Archivo (.csv, .npy, .mtx, ...) o lista JSON con la matriz")
+    gauss.add_argument("b", help="Archivo o lista JSON con el vector")
+    gauss.add_argument("--tol", type=float, default=1e-6)
+    gauss.add_argument("--max-iter", type=int, default=1000)
+    gauss.add_argument(
+        "--metodo", default="gauss-seidel", choices=("gauss-seidel", "sor", "ssor")
+    )
+    gauss.add_argument("--omega", type=float, default=None)
+    gauss.add_argument("--multicolor", action="store_true")
+    gauss.set_defaults(ejecutar=_gauss_seidel)
+
+    interpolacion = subparsers.add_parser("lagrange", help="Interpolación de Lagrange")
+    interpolacion.add_argument(
+        "puntos", help="Archivo o lista JSON con los puntos (x, y)"
+    )
+    interpolacion.add_argument(
+        "--x", type=float, action="append", default=[], help="Valor a interpolar"
+    )
+    interpolacion.add_argument(
+        "--simbolico", action="store_true", help="Muestra el polinomio (usa SymPy)"
+    )
+    interpolacion.add_argument(
+        "--local",
+        type=int,
+        metavar="K",
+        default=None,
+        help="Interpola por tramos con polinomios de grado K (para muchos puntos)",
+    )
+    interpolacion.set_defaults(ejecutar=_lagrange)
+
+    lotes = subparsers.add_parser(
+        "lotes", help="Resuelve los trabajos de un archivo JSON lines"
+    )
+    lotes.add_argument("entrada", help="Archivo con un trabajo JSON por línea")
+    lotes.add_argument("salida", help="Archivo de resultados (JSON lines)")
+    lotes.add_argument("--procesos", type=int, default=None)
+    lotes.add_argument(
+        "--pendientes", type=int, default=None, help="Máximo de bloques en curso"
+    )
+    lotes.add_argument("--bloque", type=int, default=16, help="Trabajos por bloque")
+    lotes.add_argument(
+        "--desde-cero",
+        action="store_true",
+        help="Sobrescribe la salida en lugar de continuar una ejecución anterior",
+    )
+    lotes.set_defaults(ejecutar=_lotes)
+
+    cache = subparsers.add_parser(
+        "cache", help="Muestra (o vacía) la cache de resultados en disco"
+    )
+    cache.add_argument("--limpiar", action="store_true", help="Borra los resultados")
+    cache.set_defaults(ejecutar=_cache)
+
+    return parser
+
+
+def main(argv=None):
+    argumentos = crear_parser().parse_args(argv)
+    try:
+        resultado, lineas = argumentos.ejecutar(argumentos)
+    except (ValueError, TypeError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if argumentos.json:
+        print(json.dumps({k: _a_json(v) for k, v in resultado.items()}))
+    else:
+        print("\n".join(lineas))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+Lectura y escritura de matrices, vectores y conjuntos de puntos.
+
+Formatos según la extensión del archivo:
+
+- .csv / .txt : texto, columnas separadas por comas o espacios; se lee
+  siempre como tabla de 2 dimensiones (un vector queda como una columna o
+  una fila)
+- .npy : arreglo de NumPy; al leer se mapea en memoria (no se copia)
+- .npz : varios arreglos de NumPy con nombre, p. ej. A y b
+- .mtx : Matrix Market; el formato "coordinate" se lee como MatrizCSR y
+  el formato "array" como arreglo denso
+"""
+
+import os
+
+import numpy as np
+
+from metodos.matrizDispersa import MatrizCSR, es_dispersa
+
+FORMATOS = (".csv", ".txt", ".npy", ".npz", ".mtx")
+
+
+def cargar_arreglo(ruta, clave=None, mapear=True):
+    """
+    Lee un arreglo de un archivo.
+
+    Los .npy se abren mapeados en memoria y de solo lectura: los datos se
+    leen del disco a medida que se usan y gauss_seidel trabaja directamente
+    sobre ellos, sin copiarlos. Los .npz no se pueden mapear (están
+    comprimidos en un zip), así que se leen completos.
+
+    Args:
+        ruta: Ruta del archivo
+        clave: Nombre del arreglo dentro de un .npz (si tiene más de uno)
+        mapear: Si es False, los .npy se leen completos a memoria
+
+    Returns:
+        Un arreglo de NumPy, o una MatrizCSR para .mtx en formato coordinate
+
+    Raises:
+        ValueError: Si el formato no es válido o falta la clave en el .npz
+        OSError: Si no se puede leer el archivo
+    """
+    extension = _extension(ruta)
+    if extension == ".npy":
+        return np.load(ruta, mmap_mode="r" if mapear else None, allow_pickle=False)
+    if extension == ".npz":
+        with np.load(ruta, allow_pickle=False) as contenido:
+            if clave is None:
+                if len(contenido.files) != 1:
+                    raise ValueError(
+                        f"El archivo tiene varios arreglos ({', '.join(contenido.files)}); "
+                        "indique cuál leer"
+                    )
+                clave = contenido.files[0]
+            if clave not in contenido.files:
+                raise ValueError(f"El archivo no tiene el arreglo {clave!r}")
+            return contenido[clave]
+    if extension == ".mtx":
+        return _cargar_matrix_market(ruta)
+    return _cargar_texto(ruta)
+
+
+def cargar_sistema(ruta):
+    """
+    Lee un sistema Ax = b guardado en un .npz con los arreglos A y b.
+
+    Returns:
+        Una tupla (A, b)
+
+    Raises:
+        ValueError: Si el archivo no tiene los arreglos A y b
+    """
+    if _extension(ruta) != ".npz":
+        raise ValueError("El sistema completo solo se puede leer de un .npz con A y b")
+    return cargar_arreglo(ruta, "A"), cargar_arreglo(ruta, "b")
+
+
+def guardar_arreglo(ruta, arreglo, **otros):
+    """
+    Guarda un arreglo (o MatrizCSR) en el formato indicado por la extensión.
+    En un .npz, el arreglo se guarda como "A" y los demás con sus nombres,
+    p. ej. guardar_arreglo("sistema.npz", A, b=b).
+
+    Raises:
+        ValueError: Si el formato no es válido para el arreglo dado
+    """
+    extension = _extension(ruta)
+    if otros and extension != ".npz":
+        raise ValueError("Solo los .npz pueden guardar varios arreglos")
+
+    if extension == ".mtx":
+        _guardar_matrix_market(ruta, arreglo)
+        return
+    if es_dispersa(arreglo):
+        arreglo = _densa(arreglo)
+    arreglo = np.asarray(arreglo, dtype=float)
+
+    if extension == ".npy":
+        np.save(ruta, arreglo)
+    elif extension == ".npz":
+        np.savez(ruta, A=arreglo, **{k: np.asarray(v) for k, v in otros.items()})
+    else:
+        if arreglo.ndim > 2:
+            raise ValueError("Solo se pueden guardar vectores o matrices como texto")
+        delimitador = "," if extension == ".csv" else " "
+        np.savetxt(ruta, arreglo, delimiter=delimitador, fmt="%.17g")
+
+
+def _extension(ruta):
+    extension = os.path.splitext(str(ruta))[1].lower()
+    if extension not in FORMATOS:
+        raise ValueError(
+            f"Formato no soportado: {extension or 'sin extensión'} "
+            f"(use {', '.join(FORMATOS)})"
+        )
+    return extension
+
+
+def _cargar_texto(ruta):
+    # Se revisa la primera línea con datos para elegir el separador
+    delimitador = None
+    with open(ruta) as archivo:
+        for linea in archivo:
+            if linea.strip() and not linea.lstrip().startswith("#"):
+                delimitador = "," if "," in linea else None
+                break
+    try:
+        # ndmin=2: con una sola fila (p. ej. un único punto x, y) loadtxt
+        # retornaría un vector
+        return np.loadtxt(ruta, delimiter=delimitador, ndmin=2)
+    except ValueError as e:
+        raise ValueError(f"El archivo tiene valores que no son números: {e}")
+
+
+def _densa(A):
+    return A.a_densa() if isinstance(A, MatrizCSR) else A.toarray()
+
+
+def _cargar_matrix_market(ruta):
+    with open(ruta) as archivo:
+        encabezado = archivo.readline().lower().split()
+        if len(encabezado) != 5 or encabezado[0] != "%%matrixmarket":
+            raise ValueError("El archivo no es Matrix Market")
+        _, objeto, formato, campo, simetria = encabezado
+        if objeto != "matrix" or campo not in ("real", "integer", "pattern"):
+            raise ValueError("Solo se leen matrices reales, enteras o de patrón")
+        if simetria not in ("general", "symmetric", "skew-symmetric"):
+            raise ValueError(f"Simetría no soportada: {simetria}")
+
+        linea = archivo.readline()
+        while linea.startswith("%") or not linea.strip():
+            linea = archivo.readline()
+        tamanos = [int(v) for v in linea.split()]
+        if len(tamanos) != (2 if formato == "array" else 3):
+            raise ValueError("La línea de tamaños del archivo no es válida")
+        datos = np.loadtxt(archivo, comments="%", ndmin=2)
+
+    if formato == "array":
+        filas, columnas = tamanos
+        if simetria != "general":
+            raise ValueError("Solo se leen matrices densas con simetría general")
+        # Matrix Market guarda las matrices densas por columnas
+        return datos.ravel().reshape((columnas, filas)).T.copy()
+
+    filas, columnas, nnz = tamanos
+    if nnz == 0:
+        return MatrizCSR.desde_tripletas([], [], [], (filas, columnas))
+    if len(datos) != nnz:
+        raise ValueError("El número de entradas no coincide con el encabezado")
+    i = datos[:, 0].astype(np.int64) - 1
+    j = datos[:, 1].astype(np.int64) - 1
+    valores = np.ones(nnz) if campo == "pattern" else datos[:, 2]
+
+    # Las matrices simétricas solo guardan el triángulo inferior
+    if simetria != "general":
+        fuera = i != j
+        signo = -1.0 if simetria == "skew-symmetric" else 1.0
+        i, j, valores = (
+            np.concatenate([i, j[fuera]]),
+            np.concatenate([j, i[fuera]]),
+            np.concatenate([valores, signo * valores[fuera]]),
+        )
+    return MatrizCSR.desde_tripletas(i, j, valores, (filas, columnas))
+
+
+def _guardar_matrix_market(ruta, A):
+    with open(ruta, "w") as archivo:
+        if es_dispersa(A):
+            if not isinstance(A, MatrizCSR):
+                csr = A.tocsr()
+                A = MatrizCSR(csr.data, csr.indices, csr.indptr, csr.shape)
+            filas = np.repeat(np.arange(A.shape[0]), np.diff(A.indptr))
+            archivo.write("%%MatrixMarket matrix coordinate real general\n")
+            archivo.write(f"{A.shape[0]} {A.shape[1]} {A.nnz}\n")
+            np.savetxt(
+                archivo,
+                np.column_stack([filas + 1, A.indices + 1, A.data]),
+                fmt=("%d", "%d", "%.17g"),
+            )
+            return
+
+        A = np.asarray(A, dtype=float)
+        if A.ndim == 1:
+            A = A[:, None]
+        if A.ndim != 2:
+            raise ValueError("Matrix Market solo guarda vectores o matrices")
+        archivo.write("%%MatrixMarket matrix array real general\n")
+        archivo.write(f"{A.shape[0]} {A.shape[1]}\n")
+        np.savetxt(archivo, A.T.ravel(), fmt="%.17g")
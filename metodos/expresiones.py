@@ -0,0 +1,215 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+class CacheExpresiones:
+    """
+    Cache LRU de funciones compiladas a partir de texto (sympify + lambdify).
+
+    La clave es el texto normalizado (sin espacios), las variables y el
+    backend de lambdify. Si dos textos distintos producen la misma expresión
+    (p. ej. "x**2 - 4" y "-4 + x**2") comparten también la función compilada.
+
+    Opcionalmente guarda en disco las expresiones ya interpretadas, de modo
+    que en otra ejecución se evita volver a interpretar el texto. Las
+    funciones de lambdify no se pueden serializar, así que ese paso sí se
+    repite al cargar desde disco.
+    """
+
+    def __init__(self, capacidad=128, directorio=None):
+        """
+        Args:
+            capacidad: Máximo de funciones guardadas en memoria
+            directorio: Carpeta para el nivel en disco (None para no usarlo)
+
+        Raises:
+            ValueError: Si la capacidad no es un entero positivo
+        """
+        if not isinstance(capacidad, int) or capacidad <= 0:
+            raise ValueError("capacidad debe ser un entero positivo")
+        self.capacidad = capacidad
+        self.directorio = directorio
+        if directorio is not None:
+            os.makedirs(directorio, exist_ok=True)
+
+        self._funciones = OrderedDict()
+        self._candado = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.aciertos_disco = 0
+
+    def compilar(self, texto, variables="x", backend="numpy"):
+        """
+        Retorna la función compilada para el texto dado, usando la cache.
+
+        La función tiene atributos extra: expresion (la expresión de
+        SymPy), texto (el texto normalizado), variables y backend.
+
+        Args:
+            texto: Expresión como texto, p. ej. "x**2 - 4"
+            variables: Nombre de la variable o secuencia de nombres
+            backend: Módulo para lambdify ("numpy", "math", ...)
+
+        Returns:
+            La función compilada
+
+        Raises:
+            ValueError: Si el texto no se puede interpretar
+        """
+        if isinstance(variables, str):
+            variables = (variables,)
+        variables = tuple(variables)
+        normalizado = "".join(str(texto).split())
+        if not normalizado:
+            raise ValueError("Introduzca una función.")
+
+        clave = ("texto", normalizado, variables, backend)
+        with self._candado:
+            funcion = self._buscar(clave)
+            if funcion is not None:
+                self.aciertos += 1
+                return funcion
+            self.fallos += 1
+
+        # SymPy tarda en importarse: solo se carga cuando hay que compilar
+        import sympy as sp
+
+        expresion = self._cargar_disco(clave)
+        if expresion is None:
+            try:
+                expresion = sp.sympify(normalizado)
+            except (sp.SympifyError, SyntaxError, TypeError) as e:
+                raise ValueError(f"No se pudo interpretar la función: {texto}") from e
+            self._guardar_disco(clave, expresion)
+
+        # Textos distintos con la misma expresión comparten la función
+        clave_expresion = ("expresion", sp.srepr(expresion), variables, backend)
+        with self._candado:
+            funcion = self._buscar(clave_expresion)
+        if funcion is None:
+            simbolos = sp.symbols(variables)
+            funcion = sp.lambdify(simbolos, expresion, backend)
+            funcion.expresion = expresion
+            funcion.texto = normalizado
+            funcion.variables = variables
+            funcion.backend = backend
+
+        with self._candado:
+            self._guardar(clave_expresion, funcion)
+            self._guardar(clave, funcion)
+        return funcion
+
+    def estadisticas(self):
+        """Retorna un diccionario con los contadores de la cache."""
+        with self._candado:
+            consultas = self.aciertos + self.fallos
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "aciertos_disco": self.aciertos_disco,
+                "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+                "en_memoria": len(self._funciones),
+                "capacidad": self.capacidad,
+            }
+
+    def limpiar(self, disco=False):
+        """Vacía la cache en memoria (y la de disco si disco=True) y reinicia los contadores."""
+        with self._candado:
+            self._funciones.clear()
+            self.aciertos = self.fallos = self.aciertos_disco = 0
+        if disco and self.directorio is not None:
+            for nombre in os.listdir(self.directorio):
+                if nombre.endswith(".pkl"):
+                    os.remove(os.path.join(self.directorio, nombre))
+
+    def __len__(self):
+        return len(self._funciones)
+
+    def _buscar(self, clave):
+        funcion = self._funciones.get(clave)
+        if funcion is not None:
+            self._funciones.move_to_end(clave)
+        return funcion
+
+    def _guardar(self, clave, funcion):
+        self._funciones[clave] = funcion
+        self._funciones.move_to_end(clave)
+        while len(self._funciones) > self.capacidad:
+            self._funciones.popitem(last=False)
+
+    def _ruta(self, clave):
+        nombre = hashlib.sha256(repr(clave).encode()).hexdigest()
+        return os.path.join(self.directorio, nombre + ".pkl")
+
+    def _cargar_disco(self, clave):
+        if self.directorio is None:
+            return None
+        try:
+            with open(self._ruta(clave), "rb") as archivo:
+                expresion = pickle.load(archivo)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+        with self._candado:
+            self.aciertos_disco += 1
+        return expresion
+
+    def _guardar_disco(self, clave, expresion):
+        if self.directorio is None:
+            return
+        # Se escribe en un archivo temporal y se renombra para no dejar
+        # archivos a medias si otro proceso lee al mismo tiempo
+        try:
+            descriptor, temporal = tempfile.mkstemp(dir=self.directorio)
+            with os.fdopen(descriptor, "wb") as archivo:
+                pickle.dump(expresion, archivo)
+            os.replace(temporal, self._ruta(clave))
+        except (OSError, pickle.PicklingError):
+            pass  # El nivel en disco es solo una optimización
+
+
+class FuncionSerializable:
+    """
+    Envoltura de una función de compilar_expresion que se puede serializar
+    con pickle (las funciones de lambdify no se pueden), para mandarla a
+    otro proceso: viaja como texto y se vuelve a compilar al llegar, con la
+    cache de ese proceso.
+    """
+
+    def __init__(self, funcion):
+        self.funcion = funcion
+
+    def __call__(self, *args):
+        return self.funcion(*args)
+
+    def __getstate__(self):
+        f = self.funcion
+        return f.texto, f.variables, f.backend
+
+    def __setstate__(self, estado):
+        self.funcion = compilar_expresion(*estado)
+
+
+# Cache compartida por toda la aplicación
+CACHE_EXPRESIONES = CacheExpresiones()
+
+
+def compilar_expresion(texto, variables="x", backend="numpy"):
+    """
+    Compila el texto a una función usando la cache compartida.
+
+    Args:
+        texto: Expresión como texto, p. ej. "x**2 - 4"
+        variables: Nombre de la variable o secuencia de nombres
+        backend: Módulo para lambdify ("numpy", "math", ...)
+
+    Returns:
+        La función compilada (con los atributos expresion y texto)
+
+    Raises:
+        ValueError: Si el texto no se puede interpretar
+    """
+    return CACHE_EXPRESIONES.compilar(texto, variables, backend)
@@ -1,34 +1,164 @@
-def gauss_seidel(A, b, tol=1e-6, max_iter=1000):
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import NamedTuple
+
+import numpy as np
+
+from metodos.matrizDispersa import MatrizCSR, colorear, es_dispersa
+from metodos.traza import Iteracion
+
+# Numba es opcional: si está instalado, los barridos se compilan; si no, se
+# usa NumPy para las matrices densas y listas de Python para las dispersas
+try:
+    from numba import get_num_threads, njit, prange, set_num_threads
+except ImportError:
+    njit = None
+    prange = range
+
+NUMBA_DISPONIBLE = njit is not None
+
+
+METODOS = ("gauss-seidel", "sor", "ssor")
+
+# Cada cuántas iteraciones el monitor revisa también el residuo ||b - Ax||
+_CADA_RESIDUO = 10
+
+_MENSAJES = {
+    "convergio": "Convergió",
+    "max_iter": "No convergió en el número máximo de iteraciones.",
+    "diverge": "El método diverge - valores demasiado grandes",
+    "estancado": "El método se estancó: no alcanzará la tolerancia en el máximo de iteraciones.",
+    "cancelado": "Se canceló la resolución.",
+}
+
+
+class EstadoConvergencia(NamedTuple):
+    """
+    Resultado estructurado de una resolución iterativa.
+
+    estado : str ("convergio", "max_iter", "diverge", "estancado" o "cancelado")
+    iteraciones : int (o lista, una por columna o sistema)
+    error : float (último cambio máximo entre iteraciones)
+    residuo : float (norma infinito de b - Ax al terminar)
+    omega : float (factor de relajación usado al final)
+    diagonal_dominante : bool
+    radio_espectral : float (estimación del radio espectral de la matriz de
+        iteración de Jacobi; < 1 predice convergencia)
+    iteraciones_estimadas : float (predicción hecha antes de iterar a partir
+        del radio espectral; inf si no se espera convergencia)
+    """
+
+    estado: str
+    iteraciones: object
+    error: float
+    residuo: float
+    omega: float
+    diagonal_dominante: bool
+    radio_espectral: float
+    iteraciones_estimadas: float
+
+    @property
+    def convergio(self):
+        return self.estado == "convergio"
+
+    @property
+    def mensaje(self):
+        if self.convergio:
+            return f"Convergió en {np.max(self.iteraciones)} iteraciones."
+        return _MENSAJES[self.estado]
+
+
+def gauss_seidel(
+    A,
+    b,
+    tol=1e-6,
+    max_iter=1000,
+    multicolor=False,
+    hilos=None,
+    metodo="gauss-seidel",
+    omega=None,
+    x0=None,
+    retornar_estado=False,
+    callback=None,
+):
     """
     Método de Gauss-Seidel para resolver el sistema de ecuaciones Ax = b.
 
     Parámetros:
-    A : lista de listas (matriz de coeficientes)
-    b : lista (vector de términos independientes)
+    A : lista de listas o arreglo de NumPy (matriz de coeficientes), MatrizCSR
+        o matriz de scipy.sparse; con una matriz dispersa cada iteración
+        cuesta O(nnz)
+    b : lista o arreglo de NumPy (vector de términos independientes); si es
+        una matriz de n x m, se resuelven las m columnas a la vez y las que
+        convergen dejan de iterarse
     tol : float (tolerancia de convergencia)
     max_iter : int (máximo número de iteraciones)
+    multicolor : bool (colorea el grafo de A y actualiza juntas todas las
+        incógnitas de un mismo color; rojo-negro en mallas de 5 puntos. No
+        se combina con SSOR: con ese orden el barrido de regreso no acelera
+        la convergencia y cada iteración costaría el doble)
+    hilos : int (hilos para el modo multicolor; por defecto todos los núcleos)
+    metodo : str ("gauss-seidel", "sor" o "ssor"; una iteración de SSOR es un
+        barrido hacia adelante y otro hacia atrás)
+    omega : float (factor de relajación en (0, 2) para SOR/SSOR; si no se da,
+        se estima con los primeros barridos)
+    x0 : lista o arreglo de NumPy (aproximación inicial, de la misma forma
+        que b; por defecto ceros)
+    retornar_estado : bool (si es True, retorna un EstadoConvergencia en lugar
+        del número de iteraciones y no lanza excepción si no converge)
+    callback : función (se llama con un Iteracion al terminar cada iteración;
+        si retorna True la resolución se cancela. Con varias columnas, x son
+        solo las columnas que siguen iterándose, una por fila)
 
     Retorna:
-    x : lista (vector solución)
+    x : lista (vector solución; con varias columnas, lista de n x m)
+    iteraciones : int (iteraciones realizadas, incluyendo las de estimación;
+        con varias columnas, una lista con las de cada columna)
 
     Raises:
     ValueError: Si la matriz no es cuadrada, si las dimensiones no coinciden,
-               si hay ceros en la diagonal principal o si los parámetros no son válidos
+               si hay ceros en la diagonal principal, si los parámetros no son
+               válidos (también si se pide SSOR con multicolor=True) o si
+               el método no converge (diverge, se estanca,
+               agota max_iter o se cancela)
     TypeError: Si los tipos de datos de entrada no son correctos
     """
     # Validación de tipos
-    if not isinstance(A, list) or not all(isinstance(row, list) for row in A):
-        raise TypeError("A debe ser una lista de listas")
-    if not isinstance(b, list):
-        raise TypeError("b debe ser una lista")
     if not isinstance(tol, (int, float)) or not isinstance(max_iter, int):
         raise TypeError("tol debe ser un número y max_iter debe ser un entero")
+    dispersa = es_dispersa(A)
+    if not dispersa:
+        if isinstance(A, list):
+            if not all(isinstance(row, list) for row in A):
+                raise TypeError("A debe ser una lista de listas")
+        elif not isinstance(A, np.ndarray):
+            raise TypeError("A debe ser una lista de listas")
+    if not isinstance(b, (list, np.ndarray)):
+        raise TypeError("b debe ser una lista")
+    if hilos is not None and (not isinstance(hilos, int) or hilos <= 0):
+        raise ValueError("hilos debe ser un entero positivo")
+    if metodo not in METODOS:
+        raise ValueError(f"metodo debe ser uno de {', '.join(METODOS)}")
+    if omega is not None and not 0 < omega < 2:
+        raise ValueError("omega debe estar en el intervalo (0, 2)")
 
     # Validación de dimensiones
-    n = len(A)
+    if dispersa:
+        A = _a_csr(A)
+        n = A.shape[0]
+        cuadrada = A.shape[1] == n
+    elif isinstance(A, list):
+        n = len(A)
+        cuadrada = all(len(row) == n for row in A)
+    else:
+        n = A.shape[0] if A.ndim else 0
+        cuadrada = A.ndim == 2 and A.shape[1] == n
     if n == 0:
         raise ValueError("La matriz A está vacía")
-    if not all(len(row) == n for row in A):
+    if not cuadrada:
         raise ValueError("La matriz A debe ser cuadrada")
     if len(b) != n:
         raise ValueError("Las dimensiones de A y b no coinciden")
@@ -39,47 +169,879 @@ def gauss_seidel(A, b, tol=1e-6, max_iter=1000):
     if tol <= 0:
         raise ValueError("tol debe ser positivo")
 
+    # Validación de números válidos en A y b (sin copiar si ya son float64)
+    try:
+        if not dispersa:
+            A = np.ascontiguousarray(A, dtype=float)
+        b = np.ascontiguousarray(b, dtype=float)
+    except (ValueError, TypeError):
+        raise ValueError("Todos los elementos deben ser números válidos")
+    if b.ndim not in (1, 2):
+        raise ValueError("Las dimensiones de A y b no coinciden")
+    if b.ndim == 2 and multicolor:
+        raise ValueError("El modo multicolor no admite varios términos independientes")
+    if metodo == "ssor" and multicolor:
+        raise ValueError("El modo multicolor no admite SSOR; use SOR")
+    x0 = _validar_x0(x0, b.shape)
+
     # Validación de diagonal dominante
-    for i in range(n):
-        if A[i][i] == 0:
-            raise ValueError(f"No puede haber ceros en la diagonal principal: {A}")
-
-        # Advertencia si la matriz no es diagonalmente dominante
-        if abs(A[i][i]) <= sum(abs(A[i][j]) for j in range(n) if j != i):
-            print(
-                "Advertencia: La matriz no es diagonalmente dominante. La convergencia no está garantizada."
+    if dispersa:
+        diagonal = A.diagonal()
+        suma_filas = A.suma_abs_filas()
+    else:
+        diagonal = A.diagonal().copy()
+        suma_filas = _suma_abs_filas(A)
+    if np.any(diagonal == 0):
+        raise ValueError("No puede haber ceros en la diagonal principal")
+    dominante = bool(np.all(np.abs(diagonal) > suma_filas - np.abs(diagonal)))
+
+    # Predicción barata de convergencia (solo si se pide el estado)
+    radio = prediccion = np.nan
+    if retornar_estado:
+        radio = estimar_radio_espectral(A, diagonal)
+        prediccion = _predecir_iteraciones(radio, b, diagonal, tol)
+    diagnostico = (dominante, radio, prediccion)
+
+    # Varios términos independientes: se resuelven todos juntos
+    if b.ndim == 2:
+        x, estado = _gauss_seidel_varios(
+            A, b, diagonal, tol, max_iter, metodo, omega, x0, diagnostico, callback
+        )
+        return _terminar(x, estado, retornar_estado)
+
+    # Inicialización
+    x = np.zeros(n) if x0 is None else x0
+
+    with ExitStack() as recursos:
+        if multicolor:
+            if not dispersa:
+                A = MatrizCSR.desde_densa(A)
+            barrido = _preparar_barrido_multicolor(
+                A, b, diagonal, x, hilos or os.cpu_count() or 1, recursos
             )
+        else:
+            barrido = _preparar_barrido(A, b, diagonal, x)
+
+        ajuste = _AjusteOmega(metodo, omega)
+        monitor = MonitorConvergencia(tol, max_iter)
+        inicio = time.perf_counter()
+
+        # Algoritmo principal: cada barrido actualiza x en su lugar y retorna
+        # el máximo cambio entre iteraciones, sin crear arreglos nuevos
+        for it in range(max_iter):
+            error = barrido(ajuste.omega, False)
+            if ajuste.simetrico:
+                error = max(error, barrido(ajuste.omega, True))
+
+            residuo = None
+            if (it + 1) % _CADA_RESIDUO == 0:
+                residuo = _residuo(A, b, x)
+            detener = monitor.registrar(error, residuo, ajustando=ajuste.estimando)
+            if callback is not None:
+                paso = Iteracion(
+                    it + 1, x, float(error), residuo, time.perf_counter() - inicio
+                )
+                if callback(paso) and not detener:
+                    detener = monitor.cancelar()
+            if detener:
+                break
+
+            ajuste.registrar(error)
+
+    estado = EstadoConvergencia(
+        monitor.estado,
+        monitor.iteraciones,
+        float(error),
+        _residuo(A, b, x),
+        ajuste.omega,
+        *diagnostico,
+    )
+    return _terminar(_como_lista(x), estado, retornar_estado)
+
+
+def gauss_seidel_lote(
+    A,
+    b,
+    tol=1e-6,
+    max_iter=1000,
+    metodo="gauss-seidel",
+    omega=None,
+    x0=None,
+    retornar_estado=False,
+    callback=None,
+):
+    """
+    Resuelve a la vez varios sistemas independientes A[k] x[k] = b[k] del
+    mismo tamaño. La validación se hace una sola vez para todo el lote, cada
+    barrido actualiza todos los sistemas juntos y los que ya convergieron
+    dejan de iterarse.
+
+    Parámetros:
+    A : arreglo de NumPy o lista de matrices, de forma (k, n, n)
+    b : arreglo de NumPy o lista de vectores, de forma (k, n)
+    tol, max_iter, metodo, omega : como en gauss_seidel (con omega estimado,
+        el mismo factor se usa para todo el lote)
+    x0 : arreglo de NumPy de forma (k, n) (aproximaciones iniciales)
+    retornar_estado : bool (como en gauss_seidel)
+    callback : función (como en gauss_seidel; x son los sistemas que siguen
+        iterándose, uno por fila, y error el peor de ellos)
 
-    # Validación de números válidos en A y b
+    Retorna:
+    x : arreglo de NumPy de forma (k, n) (una solución por sistema)
+    iteraciones : arreglo de NumPy con las iteraciones de cada sistema
+
+    Raises:
+    ValueError: Si las dimensiones no coinciden, si hay ceros en la diagonal
+               principal, si los parámetros no son válidos o si algún sistema
+               no converge
+    TypeError: Si los tipos de datos de entrada no son correctos
+    """
+    # Validación de tipos
+    if not isinstance(tol, (int, float)) or not isinstance(max_iter, int):
+        raise TypeError("tol debe ser un número y max_iter debe ser un entero")
+    if metodo not in METODOS:
+        raise ValueError(f"metodo debe ser uno de {', '.join(METODOS)}")
+    if omega is not None and not 0 < omega < 2:
+        raise ValueError("omega debe estar en el intervalo (0, 2)")
     try:
-        for row in A:
-            for elem in row:
-                float(elem)
-        for elem in b:
-            float(elem)
+        A = np.ascontiguousarray(A, dtype=float)
+        b = np.ascontiguousarray(b, dtype=float)
     except (ValueError, TypeError):
         raise ValueError("Todos los elementos deben ser números válidos")
 
-    # Inicialización
-    x = [0.0] * n
+    # Validación de dimensiones y valores
+    if A.ndim != 3 or A.shape[1] != A.shape[2]:
+        raise ValueError("A debe ser un lote de matrices cuadradas de forma (k, n, n)")
+    if A.shape[0] == 0 or A.shape[1] == 0:
+        raise ValueError("La matriz A está vacía")
+    if b.shape != A.shape[:2]:
+        raise ValueError("Las dimensiones de A y b no coinciden")
+    if max_iter <= 0:
+        raise ValueError("max_iter debe ser positivo")
+    if tol <= 0:
+        raise ValueError("tol debe ser positivo")
+    x0 = _validar_x0(x0, b.shape)
+
+    # Validación de diagonal dominante, para todo el lote a la vez
+    diagonal = np.diagonal(A, axis1=1, axis2=2).copy()
+    if np.any(diagonal == 0):
+        raise ValueError("No puede haber ceros en la diagonal principal")
+    dominante = bool(np.all(2 * np.abs(diagonal) > np.abs(A).sum(axis=2)))
+
+    def preparar(activos, x):
+        A_activos = A if len(activos) == len(A) else A[activos]
+        b_activos, diagonal_activos = b[activos], diagonal[activos]
+        return lambda omega, reverso, errores: _barrido_lote(
+            A_activos, b_activos, diagonal_activos, x, omega, reverso, errores
+        )
+
+    ajuste = _AjusteOmega(metodo, omega)
+    x, iteraciones, estado, error = _iterar_varios(
+        preparar, len(b), b.shape[1], tol, max_iter, ajuste, x0, callback
+    )
+    residuo = float(np.abs(b - np.einsum("kij,kj->ki", A, x)).max())
+    estado = EstadoConvergencia(
+        estado, iteraciones, error, residuo, ajuste.omega, dominante, np.nan, np.nan
+    )
+    return _terminar(x, estado, retornar_estado)
+
+
+def _gauss_seidel_varios(
+    A, B, diagonal, tol, max_iter, metodo, omega, x0, diagnostico, callback=None
+):
+    """
+    Resuelve A X = B para varias columnas de términos independientes a la
+    vez. Retorna las soluciones por columnas y el EstadoConvergencia.
+    """
+    B = np.ascontiguousarray(B.T)
+
+    def preparar(activos, x):
+        B_activos = B[activos]
+        if isinstance(A, MatrizCSR):
+            return lambda omega, reverso, errores: _barrido_csr_varios(
+                A.indptr, A.indices, A.data, diagonal, B_activos, x, omega, reverso, errores
+            )
+        return lambda omega, reverso, errores: _barrido_denso_varios(
+            A, B_activos, diagonal, x, omega, reverso, errores
+        )
+
+    if x0 is not None:
+        x0 = np.ascontiguousarray(x0.T)
+    ajuste = _AjusteOmega(metodo, omega)
+    x, iteraciones, estado, error = _iterar_varios(
+        preparar, len(B), B.shape[1], tol, max_iter, ajuste, x0, callback
+    )
+    residuo = _residuo(A, B.T, x.T)
+    estado = EstadoConvergencia(
+        estado, iteraciones.tolist(), error, residuo, ajuste.omega, *diagnostico
+    )
+    return x.T.tolist(), estado
+
+
+def _iterar_varios(preparar, k, n, tol, max_iter, ajuste, x0=None, callback=None):
+    """
+    Itera k problemas de tamaño n juntos. preparar(activos, x) recibe los
+    índices de los problemas que siguen activos y su arreglo de iterados
+    (compacto, una fila por problema) y retorna la función de barrido. x0
+    son las aproximaciones iniciales, también con una fila por problema.
+    callback recibe un Iteracion por iteración, con el arreglo compacto.
+
+    Los problemas que convergen guardan su solución en ese momento; se sacan
+    del arreglo compacto cuando son al menos la cuarta parte de los activos,
+    para no reconstruirlo en cada iteración.
+
+    Retorna (x de forma (k, n), iteraciones de cada problema, estado del
+    MonitorConvergencia, último cambio máximo de los pendientes).
+    """
+    x = np.zeros((k, n)) if x0 is None else x0
+    iteraciones = np.zeros(k, dtype=int)
+    convergido = np.zeros(k, dtype=bool)
+
+    activos = np.arange(k)
+    x_activos = x.copy()
+    barrido = preparar(activos, x_activos)
+    errores, errores_regreso = np.empty(k), np.empty(k)
+    monitor = MonitorConvergencia(tol, max_iter)
+    inicio = time.perf_counter()
 
-    # Algoritmo principal
     for it in range(max_iter):
-        x_old = x[:]
-        for i in range(n):
-            suma1 = sum(A[i][j] * x[j] for j in range(i))
-            suma2 = sum(A[i][j] * x_old[j] for j in range(i + 1, n))
-            x[i] = (b[i] - suma1 - suma2) / A[i][i]
-
-        # Cálculo del error
-        try:
-            error = max(abs(x[i] - x_old[i]) for i in range(n))
-        except OverflowError:
-            raise ValueError("El método diverge - valores demasiado grandes")
-
-        if error < tol:
-            print(f"Convergió en {it+1} iteraciones.")
-            return x, max_iter
-
-    print("No convergió en el número máximo de iteraciones.")
-    return x, 100
+        error = errores[: len(activos)]
+        barrido(ajuste.omega, False, error)
+        if ajuste.simetrico:
+            barrido(ajuste.omega, True, errores_regreso[: len(activos)])
+            np.maximum(error, errores_regreso[: len(activos)], out=error)
+
+        nuevos = (error < tol) & ~convergido[activos]
+        if nuevos.any():
+            x[activos[nuevos]] = x_activos[nuevos]
+            iteraciones[activos[nuevos]] = it + 1
+            convergido[activos[nuevos]] = True
+
+        # El monitor sigue al peor de los problemas que no han convergido
+        pendientes = ~convergido[activos]
+        peor = error[pendientes].max() if pendientes.any() else error.max()
+        detener = monitor.registrar(peor, ajustando=ajuste.estimando)
+        if callback is not None:
+            paso = Iteracion(
+                it + 1, x_activos, float(peor), None, time.perf_counter() - inicio
+            )
+            if callback(paso) and not detener:
+                detener = monitor.cancelar()
+        if detener:
+            break
+
+        ajuste.registrar(peor)
+        if np.count_nonzero(~pendientes) * 4 >= len(activos):
+            activos = activos[pendientes]
+            x_activos = x_activos[pendientes].copy()
+            barrido = preparar(activos, x_activos)
+
+    # Los que no convergieron se iteraron hasta que se detuvo el ciclo
+    pendientes = ~convergido[activos]
+    x[activos[pendientes]] = x_activos[pendientes]
+    iteraciones[activos[pendientes]] = monitor.iteraciones
+    return x, iteraciones, monitor.estado, float(peor)
+
+
+class _AjusteOmega:
+    """
+    Lleva el factor de relajación durante la iteración. Sin omega dado,
+    SOR/SSOR empiezan con barridos de Gauss-Seidel y van subiendo omega
+    según la velocidad de convergencia observada (SSOR solo con barridos
+    hacia adelante mientras se estima).
+    """
+
+    def __init__(self, metodo, omega):
+        self.metodo = metodo
+        self.estimando = metodo != "gauss-seidel" and omega is None
+        self.omega = 1.0 if omega is None or metodo == "gauss-seidel" else omega
+        self._errores = []
+
+    @property
+    def simetrico(self):
+        """Indica si cada iteración lleva también el barrido de regreso de SSOR."""
+        return self.metodo == "ssor" and not self.estimando
+
+    def registrar(self, error):
+        """Registra el cambio máximo de la última iteración y ajusta omega."""
+        if not self.estimando:
+            return
+        self._errores.append(error)
+        estimado = _estimar_omega(self._errores, self.omega)
+        if estimado is None:
+            return
+
+        optimo, mu = estimado
+        # SSOR usa directamente la primera estimación de mu
+        if optimo - self.omega < 1e-3 or self.metodo == "ssor":
+            self.estimando = False
+            if self.metodo == "ssor":
+                optimo = 2.0 / (1.0 + np.sqrt(2.0 * (1.0 - mu)))
+        self.omega = optimo
+        self._errores.clear()
+
+    def __str__(self):
+        if self.metodo == "gauss-seidel":
+            return ""
+        return f" (omega = {self.omega:.4f})"
+
+
+class MonitorConvergencia:
+    """
+    Vigila la tendencia del cambio entre iteraciones (y del residuo, cuando
+    se le pasa) para cortar la iteración en cuanto el resultado es claro, en
+    lugar de agotar siempre max_iter:
+
+    - "convergio": el cambio bajó de la tolerancia.
+    - "diverge": aparecen valores no finitos, o el cambio o el residuo
+      crecieron muy por encima del mínimo observado.
+    - "estancado": en las últimas paciencia iteraciones ni el cambio ni el
+      residuo bajaron de su mínimo, o a la velocidad observada en ese lapso
+      (la del cambio y la del residuo) no llegaría a la tolerancia ni con el
+      doble de las iteraciones que quedan.
+    - "cancelado": se pidió detener desde fuera con cancelar().
+
+    El estancamiento se juzga sobre muchas iteraciones porque al empezar el
+    cambio máximo puede quedarse plano durante cientos de barridos (en una
+    malla grande la corrección tarda en recorrerla) aunque luego converja
+    bien. Si no se pasan residuos, solo se usa el cambio. Por defecto
+    paciencia es la décima parte de max_iter (entre 10 y 1000), para que el
+    corte anticipado también ocurra con pocas iteraciones.
+    """
+
+    # Cuánto tiene que crecer el cambio (o el residuo) respecto a su mínimo
+    # para considerar que diverge
+    CRECIMIENTO_DIVERGENCIA = 1e6
+
+    def __init__(self, tol, max_iter, paciencia=None):
+        self.tol = tol
+        self.max_iter = max_iter
+        if paciencia is None:
+            paciencia = min(1000, max(10, max_iter // 10))
+        self.paciencia = paciencia
+        self.estado = "max_iter"
+        self.iteraciones = 0
+        # (iteración, valor) de las últimas paciencia iteraciones
+        self._errores = deque()
+        self._residuos = deque()
+        self._minimo_error = self._minimo_residuo = np.inf
+        self._mejora_error = self._mejora_residuo = 0
+
+    def registrar(self, error, residuo=None, ajustando=False):
+        """
+        Registra una iteración. ajustando indica que el método todavía está
+        cambiando de parámetros (por ejemplo omega) y no conviene juzgar su
+        velocidad. Retorna True si hay que detenerse (ver self.estado).
+        """
+        self.iteraciones += 1
+        if not np.isfinite(error) or (residuo is not None and not np.isfinite(residuo)):
+            return self._terminar("diverge")
+        if error < self.tol:
+            return self._terminar("convergio")
+
+        if error < self._minimo_error:
+            self._minimo_error, self._mejora_error = error, self.iteraciones
+        if error > self.CRECIMIENTO_DIVERGENCIA * self._minimo_error:
+            return self._terminar("diverge")
+        if residuo is not None:
+            if residuo < self._minimo_residuo:
+                self._minimo_residuo, self._mejora_residuo = residuo, self.iteraciones
+            if residuo > self.CRECIMIENTO_DIVERGENCIA * max(self._minimo_residuo, self.tol):
+                return self._terminar("diverge")
+
+        self._agregar(self._errores, error)
+        if residuo is not None:
+            self._agregar(self._residuos, residuo)
+        if ajustando or self.iteraciones <= self.paciencia:
+            return False
+
+        # Sin bajar en todo el lapso (ni el cambio ni el residuo)
+        if self.iteraciones - self._mejora_error > self.paciencia and (
+            not self._residuos or self.iteraciones - self._mejora_residuo > self.paciencia
+        ):
+            return self._terminar("estancado")
+
+        # Bajan, pero demasiado despacio para llegar en las que quedan
+        quedan = 2 * (self.max_iter - self.iteraciones)
+        if self._faltan(self._errores, error) > quedan and (
+            not self._residuos or self._faltan(self._residuos, error) > quedan
+        ):
+            return self._terminar("estancado")
+        return False
+
+    def cancelar(self):
+        """Marca la iteración como cancelada. Retorna True, como registrar."""
+        return self._terminar("cancelado")
+
+    def _terminar(self, estado):
+        self.estado = estado
+        return True
+
+    def _agregar(self, historia, valor):
+        historia.append((self.iteraciones, valor))
+        while historia[0][0] < self.iteraciones - self.paciencia:
+            historia.popleft()
+
+    def _faltan(self, historia, error):
+        """
+        Iteraciones que faltarían para que el cambio llegue a la tolerancia,
+        si error (o residuo) sigue bajando como en historia:
+        valor_k ≈ valor_j * razon^(k - j).
+        """
+        (j, primero), (k, ultimo) = historia[0], historia[-1]
+        if k == j or not 0 < ultimo < primero:
+            return np.inf
+        razon = (ultimo / primero) ** (1.0 / (k - j))
+        return np.log(self.tol / error) / np.log(razon)
+
+
+def estimar_radio_espectral(A, diagonal=None, pasos=10):
+    """
+    Estima el radio espectral de la matriz de iteración de Jacobi
+    D⁻¹(D - A) con unos pocos pasos del método de las potencias, todos
+    vectorizados (un producto matriz-vector por paso). Si es menor que 1,
+    Jacobi converge y, para matrices diagonalmente dominantes o M-matrices,
+    Gauss-Seidel también y más rápido (radio de Gauss-Seidel ≈ radio²).
+
+    Parámetros:
+    A : arreglo de NumPy o MatrizCSR (matriz de coeficientes)
+    diagonal : arreglo de NumPy (diagonal de A, si ya se calculó)
+    pasos : int (pasos del método de las potencias)
+
+    Retorna:
+    radio : float (estimación del radio espectral)
+    """
+    if diagonal is None:
+        diagonal = A.diagonal()
+    v = np.random.default_rng(0).uniform(0.5, 1.5, len(diagonal))
+    radio = np.nan
+    for _ in range(pasos):
+        norma = np.linalg.norm(v)
+        if norma == 0 or not np.isfinite(norma):
+            break
+        v = v / norma
+        v = v - (A @ v) / diagonal
+        radio = np.linalg.norm(v)
+    return float(radio)
+
+
+def _predecir_iteraciones(radio, b, diagonal, tol):
+    """
+    Predice las iteraciones de Gauss-Seidel desde cero: el primer cambio es
+    del orden de b/D y cada iteración lo reduce en un factor ≈ radio².
+    """
+    if not 0 <= radio < 1:
+        return np.inf
+    inicial = np.abs(b / (diagonal if b.ndim == 1 else diagonal[:, None])).max()
+    if inicial <= tol or radio == 0:
+        return 1.0
+    return float(np.ceil(np.log(tol / inicial) / np.log(radio**2)))
+
+
+def _suma_abs_filas(A, bloque=2**20):
+    """
+    Suma de los valores absolutos de cada fila de una matriz densa, por
+    bloques de filas para no crear una copia completa de |A| (A puede estar
+    mapeada desde un archivo y no caber en memoria).
+    """
+    filas = max(1, bloque // max(A.shape[1], 1))
+    return np.concatenate(
+        [np.abs(A[i : i + filas]).sum(axis=1) for i in range(0, len(A), filas)]
+    )
+
+
+def _residuo(A, b, x):
+    """Norma infinito de b - Ax (x y b pueden tener varias columnas)."""
+    return float(np.abs(b - A @ x).max())
+
+
+def _terminar(x, estado, retornar_estado):
+    if retornar_estado:
+        return x, estado
+    if not estado.convergio:
+        raise ValueError(estado.mensaje)
+    return x, estado.iteraciones
+
+
+class SesionGaussSeidel:
+    """
+    Sesión de resolución que recuerda la última solución para cada forma de
+    sistema y la usa como aproximación inicial del siguiente. En barridos de
+    parámetros, donde A o b cambian poco entre resoluciones, la solución
+    anterior está mucho más cerca que el vector cero y se ahorran iteraciones.
+    """
+
+    def __init__(self, **opciones):
+        """
+        Args:
+            **opciones: Argumentos por defecto para gauss_seidel (tol, metodo, ...)
+        """
+        self.opciones = opciones
+        self._ultimas = {}
+
+    def resolver(self, A, b, **opciones):
+        """
+        Resuelve Ax = b con gauss_seidel partiendo de la última solución de
+        la misma forma (si la hay). Acepta los mismos argumentos; un x0
+        explícito tiene prioridad sobre la solución recordada.
+
+        Returns:
+            Lo mismo que gauss_seidel
+        """
+        forma = np.shape(b)
+        opciones = {**self.opciones, **opciones}
+        opciones.setdefault("x0", self._ultimas.get(forma))
+
+        x, resultado = gauss_seidel(A, b, **opciones)
+
+        # Una solución que no convergió no sirve como punto de partida
+        if not isinstance(resultado, EstadoConvergencia) or resultado.convergio:
+            self._ultimas[forma] = np.array(x)
+        return x, resultado
+
+    def olvidar(self):
+        """Descarta todas las soluciones recordadas."""
+        self._ultimas.clear()
+
+
+def _validar_x0(x0, forma):
+    """Retorna una copia en float64 de la aproximación inicial (o None)."""
+    if x0 is None:
+        return None
+    try:
+        x0 = np.array(x0, dtype=float)
+    except (ValueError, TypeError):
+        raise ValueError("Todos los elementos de x0 deben ser números válidos")
+    if x0.shape != forma:
+        raise ValueError("x0 debe tener la misma forma que b")
+    return x0
+
+
+def _estimar_omega(errores, omega):
+    """
+    Estima el factor de relajación óptimo de SOR (adaptativo, al estilo de
+    Hageman y Young). Cuando el cociente entre cambios máximos consecutivos
+    se estabiliza tiende al radio espectral lambda de la iteración con el
+    omega actual, y para matrices consistentemente ordenadas el radio
+    espectral mu de Jacobi cumple (lambda + omega - 1)² = lambda omega² mu².
+
+    Retorna la tupla (omega óptimo para SOR, mu), o None mientras el cociente
+    no se estabiliza.
+    """
+    if len(errores) < 4:
+        return None
+    razones = [nuevo / viejo for viejo, nuevo in zip(errores[-4:], errores[-3:])]
+    tasas = [1.0 - razon for razon in razones]
+    if min(tasas) <= 0 or max(tasas) - min(tasas) > 1e-2 * min(tasas):
+        return None
+
+    razon = razones[-1]
+    mu2 = min((razon + omega - 1.0) ** 2 / (razon * omega**2), 1.0 - 1e-12)
+    return 2.0 / (1.0 + np.sqrt(1.0 - mu2)), np.sqrt(mu2)
+
+
+def _a_csr(A):
+    """Convierte una matriz dispersa de scipy a MatrizCSR (sin copiar los datos)."""
+    if isinstance(A, MatrizCSR):
+        return A
+    A = A.tocsr()
+    return MatrizCSR(A.data, A.indices, A.indptr, A.shape)
+
+
+def _como_lista(x):
+    return x.tolist() if isinstance(x, np.ndarray) else list(x)
+
+
+def _preparar_barrido(A, b, diagonal, x):
+    """
+    Retorna una función barrido(omega, reverso) que hace un barrido de SOR
+    sobre x (en su lugar) y retorna el máximo cambio. Elige el núcleo
+    compilado con Numba si está disponible.
+    """
+    if isinstance(A, MatrizCSR):
+        if NUMBA_DISPONIBLE:
+            return lambda omega, reverso: _barrido_csr(
+                A.indptr, A.indices, A.data, diagonal, b, x, omega, reverso
+            )
+
+        # Las listas de Python se recorren mucho más rápido que los arreglos
+        # de NumPy elemento por elemento
+        datos = (A.indptr.tolist(), A.indices.tolist(), A.data.tolist())
+        diagonal, b = diagonal.tolist(), b.tolist()
+        x_lista = x.tolist()
+
+        def barrido(omega, reverso):
+            error = _barrido_csr(*datos, diagonal, b, x_lista, omega, reverso)
+            x[:] = x_lista
+            return error
+
+        return barrido
+
+    return lambda omega, reverso: _barrido_denso(A, b, diagonal, x, omega, reverso)
+
+
+def _preparar_barrido_multicolor(A, b, diagonal, x, hilos, recursos):
+    """
+    Como _preparar_barrido, pero recorriendo las incógnitas color por color.
+    Las de un mismo color no dependen entre sí, así que se actualizan todas
+    a la vez: en paralelo con Numba o, sin Numba, con operaciones de NumPy
+    repartidas en un conjunto de hilos.
+    """
+    colores = colorear(A)
+    orden = np.argsort(colores, kind="stable")
+    limites = np.searchsorted(colores[orden], np.arange(colores.max() + 2))
+    grupos = [orden[inicio:fin] for inicio, fin in zip(limites[:-1], limites[1:])]
+
+    if NUMBA_DISPONIBLE:
+        cambios = np.empty(len(x))
+        hilos_previos = get_num_threads()
+        set_num_threads(min(hilos, hilos_previos))
+        recursos.callback(set_num_threads, hilos_previos)
+
+        def barrido(omega, reverso):
+            error = 0.0
+            for filas in grupos[::-1] if reverso else grupos:
+                _barrido_color_csr(
+                    A.indptr, A.indices, A.data, diagonal, b, x, omega, filas, cambios
+                )
+                error = max(error, cambios[: len(filas)].max())
+            return error
+
+        return barrido
+
+    # Sin Numba: cada color se parte en bloques, uno por hilo, con sus
+    # elementos fuera de la diagonal ya extraídos
+    bloques = [
+        [_extraer_bloque(A, b, diagonal, parte) for parte in np.array_split(filas, hilos)]
+        for filas in grupos
+    ]
+    ejecutor = recursos.enter_context(ThreadPoolExecutor(max_workers=hilos))
+
+    def barrido(omega, reverso):
+        error = 0.0
+        for bloques_color in bloques[::-1] if reverso else bloques:
+            if len(bloques_color) == 1:
+                cambios = [_actualizar_bloque(bloques_color[0], x, omega)]
+            else:
+                cambios = ejecutor.map(
+                    _actualizar_bloque, bloques_color, [x] * hilos, [omega] * hilos
+                )
+            error = max(error, *cambios)
+        return error
+
+    return barrido
+
+
+def _extraer_bloque(A, b, diagonal, filas):
+    inicios = A.indptr[filas]
+    cantidades = A.indptr[filas + 1] - inicios
+    desplazamientos = inicios - (np.cumsum(cantidades) - cantidades)
+    posiciones = np.arange(cantidades.sum()) + np.repeat(desplazamientos, cantidades)
+    locales = np.repeat(np.arange(len(filas)), cantidades)
+    fuera = A.indices[posiciones] != filas[locales]
+    return (
+        filas,
+        locales[fuera],
+        A.indices[posiciones[fuera]],
+        A.data[posiciones[fuera]],
+        b[filas],
+        diagonal[filas],
+    )
+
+
+def _actualizar_bloque(bloque, x, omega):
+    filas, locales, columnas, valores, b, diagonal = bloque
+    if len(filas) == 0:
+        return 0.0
+    suma = np.bincount(locales, weights=valores * x[columnas], minlength=len(filas))
+    anterior = x[filas]
+    nuevo = anterior + omega * ((b - suma) / diagonal - anterior)
+    cambio = np.max(np.abs(nuevo - anterior))
+    x[filas] = nuevo
+    return cambio
+
+
+def _barrido_color_csr(indptr, indices, data, diagonal, b, x, omega, filas, cambios):
+    # Las filas de un mismo color no dependen entre sí: el orden da igual
+    for k in prange(len(filas)):
+        i = filas[k]
+        suma = 0.0
+        for p in range(indptr[i], indptr[i + 1]):
+            j = indices[p]
+            if j != i:
+                suma += data[p] * x[j]
+        anterior = x[i]
+        nuevo = anterior + omega * ((b[i] - suma) / diagonal[i] - anterior)
+        cambios[k] = abs(nuevo - anterior)
+        x[i] = nuevo
+
+
+# En los barridos siguientes, al actualizar x en su lugar las posiciones ya
+# visitadas tienen el valor nuevo y las demás el de la iteración anterior.
+# Con omega = 1 es Gauss-Seidel; con reverso se recorre de la última fila a
+# la primera (la mitad de regreso de SSOR).
+
+
+def _barrido_csr(indptr, indices, data, diagonal, b, x, omega, reverso):
+    n = len(x)
+    error = 0.0
+    for m in range(n):
+        i = n - 1 - m if reverso else m
+        suma = 0.0
+        for k in range(indptr[i], indptr[i + 1]):
+            j = indices[k]
+            if j != i:
+                suma += data[k] * x[j]
+        anterior = x[i]
+        nuevo = anterior + omega * ((b[i] - suma) / diagonal[i] - anterior)
+        cambio = abs(nuevo - anterior)
+        if not cambio <= error:
+            error = cambio
+        x[i] = nuevo
+    return error
+
+
+def _barrido_denso_lazos(A, b, diagonal, x, omega, reverso):
+    n = len(x)
+    error = 0.0
+    for m in range(n):
+        i = n - 1 - m if reverso else m
+        suma = 0.0
+        for j in range(n):
+            if j != i:
+                suma += A[i, j] * x[j]
+        anterior = x[i]
+        nuevo = anterior + omega * ((b[i] - suma) / diagonal[i] - anterior)
+        cambio = abs(nuevo - anterior)
+        if not cambio <= error:
+            error = cambio
+        x[i] = nuevo
+    return error
+
+
+def _barrido_denso_numpy(A, b, diagonal, x, omega, reverso):
+    # Un solo producto punto por fila; el término diagonal se descuenta después
+    n = len(x)
+    error = 0.0
+    for i in range(n - 1, -1, -1) if reverso else range(n):
+        anterior = x[i]
+        actualizado = (b[i] - A[i] @ x + diagonal[i] * anterior) / diagonal[i]
+        nuevo = anterior + omega * (actualizado - anterior)
+        cambio = abs(nuevo - anterior)
+        if not cambio <= error:
+            error = cambio
+        x[i] = nuevo
+    return error
+
+
+# Núcleos para varios problemas a la vez: x y b tienen una fila por problema
+# y errores recibe el cambio máximo de cada uno
+
+
+def _barrido_denso_varios_lazos(A, B, diagonal, X, omega, reverso, errores):
+    m, n = X.shape
+    errores[:] = 0.0
+    for q in range(n):
+        i = n - 1 - q if reverso else q
+        for c in range(m):
+            suma = 0.0
+            for j in range(n):
+                if j != i:
+                    suma += A[i, j] * X[c, j]
+            anterior = X[c, i]
+            nuevo = anterior + omega * ((B[c, i] - suma) / diagonal[i] - anterior)
+            cambio = abs(nuevo - anterior)
+            if not cambio <= errores[c]:
+                errores[c] = cambio
+            X[c, i] = nuevo
+
+
+def _barrido_denso_varios_numpy(A, B, diagonal, X, omega, reverso, errores):
+    n = X.shape[1]
+    errores[:] = 0.0
+    for i in range(n - 1, -1, -1) if reverso else range(n):
+        anterior = X[:, i].copy()
+        actualizado = (B[:, i] - X @ A[i] + diagonal[i] * anterior) / diagonal[i]
+        nuevo = anterior + omega * (actualizado - anterior)
+        np.maximum(errores, np.abs(nuevo - anterior), out=errores)
+        X[:, i] = nuevo
+
+
+def _barrido_csr_varios_lazos(
+    indptr, indices, data, diagonal, B, X, omega, reverso, errores
+):
+    m, n = X.shape
+    errores[:] = 0.0
+    for q in range(n):
+        i = n - 1 - q if reverso else q
+        for c in range(m):
+            suma = 0.0
+            for k in range(indptr[i], indptr[i + 1]):
+                j = indices[k]
+                if j != i:
+                    suma += data[k] * X[c, j]
+            anterior = X[c, i]
+            nuevo = anterior + omega * ((B[c, i] - suma) / diagonal[i] - anterior)
+            cambio = abs(nuevo - anterior)
+            if not cambio <= errores[c]:
+                errores[c] = cambio
+            X[c, i] = nuevo
+
+
+def _barrido_csr_varios_numpy(
+    indptr, indices, data, diagonal, B, X, omega, reverso, errores
+):
+    n = X.shape[1]
+    errores[:] = 0.0
+    for i in range(n - 1, -1, -1) if reverso else range(n):
+        inicio, fin = indptr[i], indptr[i + 1]
+        anterior = X[:, i].copy()
+        suma = X[:, indices[inicio:fin]] @ data[inicio:fin] - diagonal[i] * anterior
+        nuevo = anterior + omega * ((B[:, i] - suma) / diagonal[i] - anterior)
+        np.maximum(errores, np.abs(nuevo - anterior), out=errores)
+        X[:, i] = nuevo
+
+
+def _barrido_lote_lazos(A, B, diagonal, X, omega, reverso, errores):
+    k, n = X.shape
+    errores[:] = 0.0
+    for q in range(n):
+        i = n - 1 - q if reverso else q
+        for s in range(k):
+            suma = 0.0
+            for j in range(n):
+                if j != i:
+                    suma += A[s, i, j] * X[s, j]
+            anterior = X[s, i]
+            nuevo = anterior + omega * ((B[s, i] - suma) / diagonal[s, i] - anterior)
+            cambio = abs(nuevo - anterior)
+            if not cambio <= errores[s]:
+                errores[s] = cambio
+            X[s, i] = nuevo
+
+
+def _barrido_lote_numpy(A, B, diagonal, X, omega, reverso, errores):
+    n = X.shape[1]
+    errores[:] = 0.0
+    for i in range(n - 1, -1, -1) if reverso else range(n):
+        anterior = X[:, i].copy()
+        suma = np.einsum("kj,kj->k", A[:, i, :], X) - diagonal[:, i] * anterior
+        nuevo = anterior + omega * ((B[:, i] - suma) / diagonal[:, i] - anterior)
+        np.maximum(errores, np.abs(nuevo - anterior), out=errores)
+        X[:, i] = nuevo
+
+
+if NUMBA_DISPONIBLE:
+    _barrido_csr = njit(cache=True, nogil=True)(_barrido_csr)
+    _barrido_denso = njit(cache=True, nogil=True)(_barrido_denso_lazos)
+    _barrido_color_csr = njit(cache=True, nogil=True, parallel=True)(
+        _barrido_color_csr
+    )
+    _barrido_denso_varios = njit(cache=True, nogil=True)(_barrido_denso_varios_lazos)
+    _barrido_csr_varios = njit(cache=True, nogil=True)(_barrido_csr_varios_lazos)
+    _barrido_lote = njit(cache=True, nogil=True)(_barrido_lote_lazos)
+else:
+    _barrido_denso = _barrido_denso_numpy
+    _barrido_denso_varios = _barrido_denso_varios_numpy
+    _barrido_csr_varios = _barrido_csr_varios_numpy
+    _barrido_lote = _barrido_lote_numpy
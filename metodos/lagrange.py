@@ -1,14 +1,382 @@
-import sympy as sp
+import time
+
 import numpy as np
 
+from metodos.traza import Iteracion
+
+
+# Máximo de elementos de la matriz (puntos a evaluar x nodos) que se
+# construye de una vez al evaluar; acota la memoria con muchos puntos
+_BLOQUE_EVALUACION = 2**20
+
+# Desde cuántos puntos a evaluar conviene ordenarlos antes de buscar su
+# tramo en InterpoladorLocal
+_MIN_ORDENAR_BUSQUEDA = 4096
+
+
+def pesos_baricentricos(x_vals):
+    """
+    Calcula los pesos baricéntricos w_j = 1 / prod_{k != j} (x_j - x_k).
+
+    Las diferencias se escalan por la longitud del intervalo para evitar
+    desbordamientos con muchos puntos; el factor común se cancela en la
+    fórmula baricéntrica, así que no afecta al polinomio.
+
+    Args:
+        x_vals: Arreglo con los valores x (distintos entre sí)
+
+    Returns:
+        Una tupla con:
+        - Los pesos baricéntricos como arreglo de NumPy
+        - El factor de escala usado (necesario para actualizar los pesos)
+    """
+    x_vals = np.asarray(x_vals, dtype=float)
+    n = len(x_vals)
+    longitud = np.ptp(x_vals) if n > 1 else 0.0
+    escala = 4.0 / longitud if longitud > 0 else 1.0
+
+    diferencias = (x_vals[:, None] - x_vals[None, :]) * escala
+    np.fill_diagonal(diferencias, 1.0)
+    return 1.0 / np.prod(diferencias, axis=1), escala
+
+
+class InterpoladorLagrange:
+    """
+    Polinomio de interpolación de Lagrange en forma baricéntrica.
+
+    Los pesos se calculan una sola vez en O(n²) y cada evaluación cuesta
+    O(n) por punto, vectorizada sobre arreglos completos de NumPy. La
+    expresión simbólica solo se construye cuando se pide con polinomio().
+
+    Agregar o eliminar un punto actualiza los pesos en O(n), sin recalcular
+    todo el interpolador.
+    """
+
+    def __init__(self, puntos):
+        """
+        Args:
+            puntos: Lista de tuplas (x, y) o arreglo de n x 2 con los puntos
+                conocidos
+
+        Raises:
+            ValueError: Si hay puntos duplicados, insuficientes puntos o los
+                puntos no tienen dos columnas
+        """
+        puntos = np.asarray(puntos, dtype=float)
+        if len(puntos) == 0:
+            raise ValueError("Se requiere al menos un punto para la interpolación")
+        if puntos.ndim != 2 or puntos.shape[1] != 2:
+            raise ValueError("Los puntos deben tener dos columnas (x, y)")
+        self._x = puntos[:, 0].copy()
+        self._y = puntos[:, 1].copy()
+
+        # Verificar que no haya valores x duplicados
+        if len(np.unique(self._x)) != len(self._x):
+            raise ValueError(
+                "No puede haber valores x duplicados en los puntos de interpolación"
+            )
+
+        self._pesos, self._escala = pesos_baricentricos(self._x)
+        # Los pesos guardados son los verdaderos divididos por exp(_log_comun)
+        # (se normalizan al actualizarlos para que no se desborden)
+        self._log_comun = 0.0
+        self._polinomio = None
+
+    @property
+    def puntos(self):
+        return list(zip(self._x.tolist(), self._y.tolist()))
+
+    def __len__(self):
+        return len(self._x)
+
+    def agregar_punto(self, x, y):
+        """
+        Agrega el punto (x, y) actualizando los pesos en O(n).
+
+        Raises:
+            ValueError: Si ya existe un punto con ese valor x
+        """
+        x, y = float(x), float(y)
+        if np.any(self._x == x):
+            raise ValueError(
+                "No puede haber valores x duplicados en los puntos de interpolación"
+            )
+
+        # Si el punto amplía el intervalo se achica la escala, para que las
+        # diferencias escaladas sigan siendo del orden de 1. Los pesos
+        # actuales (w_j ∝ escala^-(n-1)) se pasan a la escala nueva; todo se
+        # hace con logaritmos y se normaliza, porque los factores se
+        # desbordarían con muchos puntos
+        n = len(self._x)
+        longitud = max(self._x.max(), x) - min(self._x.min(), x)
+        escala = min(self._escala, 4.0 / longitud)
+        diferencias = (self._x - x) * escala
+        actuales = self._pesos / diferencias
+        log_pesos = np.append(
+            np.log(np.abs(actuales))
+            + self._log_comun
+            + (n - 1) * np.log(self._escala / escala),
+            -np.sum(np.log(np.abs(diferencias))),
+        )
+        signos = np.append(np.sign(actuales), np.prod(np.sign(-diferencias)))
+        self._log_comun = log_pesos.max()
+        self._pesos = signos * np.exp(log_pesos - self._log_comun)
+        self._escala = escala
+        self._x = np.append(self._x, x)
+        self._y = np.append(self._y, y)
+        self._polinomio = None
+
+    def eliminar_punto(self, x):
+        """
+        Elimina el punto con valor x actualizando los pesos en O(n).
+
+        Raises:
+            ValueError: Si no existe el punto o si es el único que queda
+        """
+        indices = np.flatnonzero(self._x == float(x))
+        if len(indices) == 0:
+            raise ValueError(f"No existe un punto con x = {x}")
+        if len(self._x) == 1:
+            raise ValueError("Se requiere al menos un punto para la interpolación")
+
+        k = indices[0]
+        pesos = np.delete(self._pesos * (self._x - self._x[k]) * self._escala, k)
+        # El factor común no cambia el polinomio: se normaliza para que
+        # muchas eliminaciones seguidas no lleven los pesos a cero
+        maximo = np.abs(pesos).max()
+        self._pesos = pesos / maximo
+        self._log_comun += np.log(maximo)
+        self._x = np.delete(self._x, k)
+        self._y = np.delete(self._y, k)
+        self._polinomio = None
+
+    def sincronizar(self, puntos):
+        """
+        Actualiza el interpolador para que use exactamente los puntos dados,
+        aplicando solo las diferencias con los puntos actuales. Si cambió más
+        de la mitad de los puntos se reconstruye desde cero, que es más barato.
+
+        Args:
+            puntos: Lista de tuplas (x, y) con los nuevos puntos
+
+        Raises:
+            ValueError: Si hay puntos duplicados o insuficientes puntos
+        """
+        nuevos = {}
+        for xi, yi in puntos:
+            if float(xi) in nuevos:
+                raise ValueError(
+                    "No puede haber valores x duplicados en los puntos de interpolación"
+                )
+            nuevos[float(xi)] = float(yi)
+
+        actuales = dict(zip(self._x.tolist(), self._y.tolist()))
+        agregar = [(xi, yi) for xi, yi in nuevos.items() if xi not in actuales]
+        eliminar = [xi for xi in actuales if xi not in nuevos]
+
+        if len(agregar) + len(eliminar) > len(self._x) // 2:
+            self.__init__(list(nuevos.items()))
+            return
+
+        # Primero se agregan para no dejar nunca el interpolador vacío
+        for xi, yi in agregar:
+            self.agregar_punto(xi, yi)
+        for xi in eliminar:
+            self.eliminar_punto(xi)
+
+        # Cambiar solo un valor y no afecta a los pesos
+        y_nuevos = np.array([nuevos[xi] for xi in self._x.tolist()])
+        if not np.array_equal(y_nuevos, self._y):
+            self._y = y_nuevos
+            self._polinomio = None
+
+    def __call__(self, x):
+        """
+        Evalúa el polinomio en x (escalar o arreglo) con la fórmula
+        baricéntrica. En los nodos devuelve exactamente el valor y conocido.
+        """
+        x = np.asarray(x, dtype=float)
+        plano = x.ravel()
+        resultado = np.empty(plano.shape)
 
-def lagrange(puntos, x_interpolar=None):
+        bloque = max(1, _BLOQUE_EVALUACION // len(self._x))
+        for inicio in range(0, plano.size, bloque):
+            trozo = plano[inicio : inicio + bloque]
+            diferencias = trozo[:, None] - self._x[None, :]
+            exactos = diferencias == 0
+            diferencias[exactos] = 1.0
+            coeficientes = self._pesos / diferencias
+            valores = (coeficientes @ self._y) / coeficientes.sum(axis=1)
+
+            # Los puntos que coinciden con un nodo toman su valor y
+            filas, columnas = np.nonzero(exactos)
+            valores[filas] = self._y[columnas]
+            resultado[inicio : inicio + bloque] = valores
+
+        if x.ndim == 0:
+            return float(resultado[0])
+        return resultado.reshape(x.shape)
+
+    def polinomio(self):
+        """
+        Construye (y guarda) el polinomio como expresión simbólica de SymPy.
+        Solo hace falta para mostrarlo; para evaluar se usa la forma numérica.
+        """
+        if self._polinomio is None:
+            # SymPy tarda en importarse: solo se carga cuando se pide la forma simbólica
+            import sympy as sp
+
+            x = sp.symbols("x")
+            polinomio = sp.sympify(0)
+            for i, (xi, yi) in enumerate(zip(self._x, self._y)):
+                termino = sp.Float(yi)
+                for j, xj in enumerate(self._x):
+                    if j != i:
+                        termino *= (x - xj) / (xi - xj)
+                polinomio += termino
+            self._polinomio = sp.expand(polinomio)
+        return self._polinomio
+
+
+class InterpoladorLocal:
+    """
+    Interpolación de Lagrange por tramos, para conjuntos grandes de puntos.
+
+    En cada tramo [x_i, x_(i+1)] se usa el polinomio de grado k que pasa por
+    los k + 1 nodos más cercanos al tramo, en lugar de un único polinomio
+    por todos los puntos (que con muchos puntos es caro y oscila, fenómeno
+    de Runge). Los coeficientes de cada tramo se calculan una sola vez, en
+    O(n k²), y evaluar un punto cuesta una búsqueda binaria O(log n) más un
+    Horner de grado k, vectorizado sobre arreglos completos de NumPy.
+
+    Fuera de [x_0, x_(n-1)] se extrapola con el polinomio del primer o del
+    último tramo.
+    """
+
+    def __init__(self, puntos, grado=3):
+        """
+        Args:
+            puntos: Lista de tuplas (x, y) o arreglo de n x 2, en cualquier orden
+            grado: Grado k del polinomio de cada tramo
+
+        Raises:
+            ValueError: Si hay puntos duplicados, insuficientes puntos o el
+                grado no es válido
+        """
+        puntos = np.asarray(puntos, dtype=float)
+        if puntos.ndim != 2 or puntos.shape[1] != 2:
+            raise ValueError("Los puntos deben tener dos columnas (x, y)")
+        if not isinstance(grado, (int, np.integer)) or grado < 1:
+            raise ValueError("El grado debe ser un entero positivo")
+        if len(puntos) < grado + 1:
+            raise ValueError(
+                f"Se requieren al menos {grado + 1} puntos para interpolar con grado {grado}"
+            )
+
+        x, y = puntos[:, 0], puntos[:, 1]
+        if not np.all(x[1:] > x[:-1]):
+            orden = np.argsort(x, kind="stable")
+            x, y = x[orden], y[orden]
+            if np.any(x[1:] == x[:-1]):
+                raise ValueError(
+                    "No puede haber valores x duplicados en los puntos de interpolación"
+                )
+        self._x = np.ascontiguousarray(x)
+        self.grado = int(grado)
+        self._coeficientes = self._calcular_coeficientes(y)
+
+    def __len__(self):
+        return len(self._x)
+
+    def _calcular_coeficientes(self, y):
+        """
+        Coeficientes c[i, j] del polinomio del tramo i en potencias de
+        t = x - x_i, de modo que p_i(x) = sum_j c[i, j] t^j. Los de cada
+        tramo quedan juntos en memoria, para leerlos de una vez al evaluar.
+        """
+        x, k = self._x, self.grado
+        tramos = len(x) - 1
+        coeficientes = np.empty((tramos, k + 1))
+
+        # Primer nodo de cada plantilla: centrada en el tramo cuando se puede
+        inicios = np.clip(np.arange(tramos) - (k - 1) // 2, 0, len(x) - k - 1)
+
+        for inicio in range(0, tramos, _BLOQUE_EVALUACION):
+            fin = min(inicio + _BLOQUE_EVALUACION, tramos)
+            nodos = inicios[inicio:fin]
+            # Nodos relativos a x_i: así los coeficientes no pierden precisión
+            # aunque los x sean grandes
+            d = [x.take(nodos + j) - x[inicio:fin] for j in range(k + 1)]
+
+            # Diferencias divididas de Newton, para todos los tramos a la vez
+            # (una lista de vectores por nodo: operaciones sobre memoria contigua)
+            a = [y.take(nodos + j) for j in range(k + 1)]
+            for orden in range(1, k + 1):
+                for j in range(k, orden - 1, -1):
+                    a[j] = (a[j] - a[j - 1]) / (d[j] - d[j - orden])
+
+            # Forma de Newton a potencias de t con Horner:
+            # p = a_k, p = p (t - d_j) + a_j para j = k - 1, ..., 0
+            p = np.zeros((k + 1, fin - inicio))
+            p[0] = a[k]
+            for j in range(k - 1, -1, -1):
+                p[1:] = p[:-1] - d[j] * p[1:]
+                p[0] = a[j] - d[j] * p[0]
+            coeficientes[inicio:fin] = p.T
+        return coeficientes
+
+    def __call__(self, x):
+        """Evalúa la interpolación en x (escalar o arreglo de cualquier forma)."""
+        x = np.asarray(x, dtype=float)
+        plano = x.ravel()
+        resultado = np.empty(plano.shape)
+
+        ultimo = len(self._coeficientes) - 1
+        for inicio in range(0, plano.size, _BLOQUE_EVALUACION):
+            trozo = plano[inicio : inicio + _BLOQUE_EVALUACION]
+            tramos = self._buscar_tramos(trozo)
+            np.clip(tramos, 0, ultimo, out=tramos)
+            t = trozo - self._x[tramos]
+            c = self._coeficientes.take(tramos, axis=0)
+            valores = c[:, -1].copy()
+            for j in range(self.grado - 1, -1, -1):
+                valores *= t
+                valores += c[:, j]
+            resultado[inicio : inicio + _BLOQUE_EVALUACION] = valores
+
+        if x.ndim == 0:
+            return float(resultado[0])
+        return resultado.reshape(x.shape)
+
+    def _buscar_tramos(self, x):
+        """Índice i del tramo [x_i, x_(i+1)) de cada punto (-1 antes de x_0)."""
+        if len(x) < _MIN_ORDENAR_BUSQUEDA or np.all(x[1:] >= x[:-1]):
+            return np.searchsorted(self._x, x, side="right") - 1
+        # Con muchos puntos desordenados conviene ordenarlos antes: las
+        # búsquedas consecutivas recorren las mismas zonas de self._x y
+        # aprovechan la cache del procesador
+        orden = np.argsort(x)
+        tramos = np.empty(len(x), dtype=np.intp)
+        tramos[orden] = np.searchsorted(self._x, x[orden], side="right") - 1
+        return tramos
+
+
+def lagrange(puntos, x_interpolar=None, callback=None):
     """
     Calcula el polinomio de interpolación de Lagrange para un conjunto de puntos dados.
 
+    Con callback, el polinomio se construye agregando los puntos uno a uno
+    y después de cada punto se llama callback con un Iteracion: x es el
+    valor interpolado en x_interpolar (None si no se dio), error el cambio
+    de ese valor respecto al punto anterior (inf en el primer punto o sin
+    x_interpolar) y residuo el máximo error en los puntos que aún no se
+    agregan. Si callback retorna True se detiene y se
+    usan solo los puntos agregados hasta ese momento.
+
     Args:
         puntos: Lista de tuplas (x, y) con los puntos conocidos
         x_interpolar: Valor opcional para evaluar el polinomio resultante
+        callback: Función opcional que recibe un Iteracion por punto agregado
 
     Returns:
         Una tupla con:
@@ -18,43 +386,52 @@ def lagrange(puntos, x_interpolar=None):
     Raises:
         ValueError: Si hay puntos duplicados o insuficientes puntos
     """
-    if not puntos:
-        raise ValueError("Se requiere al menos un punto para la interpolación")
-
-    # Verificar que no haya valores x duplicados
-    x_vals = [p[0] for p in puntos]
-    if len(x_vals) != len(set(x_vals)):
-        raise ValueError(
-            "No puede haber valores x duplicados en los puntos de interpolación"
-        )
-
-    x = sp.symbols("x")
-    n = len(puntos)
-    polinomio = sp.sympify(0)  # Inicializar como expresión simbólica
-
-    for i in range(n):
-        xi, yi = puntos[i]
-        termino = yi
-        for j in range(n):
-            if j != i:
-                xj = puntos[j][0]
-                try:
-                    termino *= (x - xj) / (xi - xj)
-                except ZeroDivisionError:
-                    raise ValueError(
-                        f"Los puntos {i} y {j} tienen el mismo valor x ({xi}), lo que causaría división por cero"
-                    )
-        polinomio += termino
-
-    # Simplificar el polinomio
-    polinomio = sp.simplify(polinomio)
+    if callback is None:
+        interpolador = InterpoladorLagrange(puntos)
+    else:
+        interpolador = _construir_con_traza(puntos, x_interpolar, callback)
+    polinomio = interpolador.polinomio()
 
     # Evaluar si se solicita
     resultado = None
     if x_interpolar is not None:
         try:
-            resultado = float(polinomio.subs(x, x_interpolar).evalf())
-        except:
+            resultado = float(interpolador(x_interpolar))
+        except (ValueError, TypeError):
             raise ValueError(f"No se pudo evaluar el polinomio en x = {x_interpolar}")
 
     return polinomio, resultado
+
+
+def _construir_con_traza(puntos, x_interpolar, callback):
+    """Construye el interpolador punto por punto reportando cada paso."""
+    inicio = time.perf_counter()
+    puntos = np.asarray(puntos, dtype=float)
+    if puntos.ndim != 2 or len(puntos) == 0:
+        raise ValueError("Se requiere al menos un punto para la interpolación")
+    if len(np.unique(puntos[:, 0])) != len(puntos):
+        raise ValueError(
+            "No puede haber valores x duplicados en los puntos de interpolación"
+        )
+
+    interpolador = InterpoladorLagrange(puntos[:1])
+    anterior = None
+    for k in range(1, len(puntos) + 1):
+        if k > 1:
+            interpolador.agregar_punto(*puntos[k - 1])
+
+        valor = None if x_interpolar is None else interpolador(x_interpolar)
+        error = (
+            np.inf if anterior is None or valor is None else abs(valor - anterior)
+        )
+        restantes = puntos[k:]
+        residuo = (
+            float(np.abs(interpolador(restantes[:, 0]) - restantes[:, 1]).max())
+            if len(restantes)
+            else 0.0
+        )
+        paso = Iteracion(k, valor, error, residuo, time.perf_counter() - inicio)
+        if callback(paso):
+            break
+        anterior = valor
+    return interpolador
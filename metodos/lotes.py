@@ -0,0 +1,247 @@
+"""
+Ejecución por lotes de problemas descritos en un archivo JSON lines.
+
+Cada línea de la entrada es un trabajo, por ejemplo:
+
+    {"tipo": "regla-falsa", "funcion": "x**2 - 4", "a": 0, "b": 5, "metodo": "brent"}
+    {"tipo": "gauss-seidel", "A": [[4, 1], [1, 3]], "b": [1, 2], "tol": 1e-8}
+    {"tipo": "lagrange", "puntos": [[0, 1], [1, 2], [2, 5]], "x": [0.5, 1.5]}
+
+En los trabajos de Lagrange, "grado": k interpola por tramos con
+polinomios de grado k (InterpoladorLocal) en lugar de un único polinomio.
+
+Las claves que no son del formato (tipo, id, y los datos de cada tipo) se
+pasan como argumentos al método. La salida tiene una línea por cada línea
+de la entrada, en el mismo orden:
+
+    {"linea": 1, "id": ..., "resultado": {...}}
+    {"linea": 2, "id": ..., "error": "mensaje"}
+"""
+
+import json
+import os
+from collections import deque
+from itertools import islice
+
+from metodos.procesos import crear_procesos
+
+
+def ejecutar_trabajo(trabajo):
+    """
+    Resuelve un trabajo (un diccionario con la clave "tipo") y retorna el
+    resultado como diccionario serializable a JSON.
+
+    Raises:
+        ValueError: Si el trabajo no es válido o el método falla
+    """
+    if not isinstance(trabajo, dict):
+        raise ValueError("Cada línea debe ser un objeto JSON")
+    opciones = {k: v for k, v in trabajo.items() if k not in ("tipo", "id")}
+    tipo = trabajo.get("tipo")
+
+    if tipo == "regla-falsa":
+        from metodos.expresiones import compilar_expresion
+        from metodos.reglaFalsa import regla_falsa, todas_las_raices
+
+        f = compilar_expresion(_requerido(opciones, "funcion"))
+        a, b = _requerido(opciones, "a"), _requerido(opciones, "b")
+        if opciones.pop("todas", False):
+            return {"raices": todas_las_raices(f, a, b, **opciones)}
+        raiz, estado = regla_falsa(f, a, b, retornar_estado=True, **opciones)
+        return {
+            "raiz": float(raiz),
+            "estado": estado.estado,
+            "iteraciones": estado.iteraciones,
+            "evaluaciones": estado.evaluaciones,
+        }
+
+    if tipo == "gauss-seidel":
+        from metodos.gaussSeidel import gauss_seidel
+
+        A, b = _requerido(opciones, "A"), _requerido(opciones, "b")
+        x, estado = gauss_seidel(A, b, retornar_estado=True, **opciones)
+        return {
+            "x": x,
+            "estado": estado.estado,
+            "iteraciones": estado.iteraciones,
+            "residuo": estado.residuo,
+        }
+
+    if tipo == "lagrange":
+        from metodos.lagrange import InterpoladorLagrange, InterpoladorLocal
+
+        puntos = _requerido(opciones, "puntos")
+        if "grado" in opciones:
+            interpolador = InterpoladorLocal(puntos, grado=opciones["grado"])
+        else:
+            interpolador = InterpoladorLagrange(puntos)
+        resultado = {}
+        if "x" in opciones:
+            valores = interpolador(opciones["x"])
+            resultado["valores"] = (
+                valores.tolist() if hasattr(valores, "tolist") else valores
+            )
+        if opciones.get("simbolico"):
+            if "grado" in opciones:
+                raise ValueError("La interpolación por tramos no tiene forma simbólica")
+            resultado["polinomio"] = str(interpolador.polinomio())
+        return resultado
+
+    raise ValueError(f"Tipo de trabajo desconocido: {tipo}")
+
+
+def _requerido(opciones, clave):
+    if clave not in opciones:
+        raise ValueError(f"Falta la clave {clave!r}")
+    return opciones.pop(clave)
+
+
+def _ejecutar_bloque(bloque, usar_cache=True):
+    """
+    Resuelve un bloque de líneas (numero, texto) en un proceso del conjunto.
+    Cada línea da exactamente una línea de salida, aunque falle. Retorna el
+    texto de salida y cuántas líneas fallaron.
+    """
+    if usar_cache:
+        from metodos.resultados import CACHE_RESULTADOS
+    salidas = []
+    errores = 0
+    for numero, texto in bloque:
+        salida = {"linea": numero}
+        try:
+            if not texto.strip():
+                raise ValueError("Línea vacía")
+            trabajo = json.loads(texto)
+            if isinstance(trabajo, dict) and "id" in trabajo:
+                salida["id"] = trabajo["id"]
+            if usar_cache:
+                salida["resultado"] = _ejecutar_con_cache(CACHE_RESULTADOS, trabajo)
+            else:
+                salida["resultado"] = ejecutar_trabajo(trabajo)
+        except json.JSONDecodeError as e:
+            salida["error"] = f"JSON inválido: {e}"
+        except (ValueError, TypeError, ArithmeticError) as e:
+            salida["error"] = str(e)
+        except Exception as e:
+            # Un trabajo mal formado no puede detener el lote
+            salida["error"] = f"{type(e).__name__}: {e}"
+        try:
+            texto_salida = json.dumps(salida)
+        except (TypeError, ValueError) as e:
+            salida.pop("resultado")
+            salida["error"] = f"El resultado no se puede escribir como JSON: {e}"
+            texto_salida = json.dumps(salida)
+        errores += "error" in salida
+        salidas.append(texto_salida + "\n")
+    return "".join(salidas), errores
+
+
+def _ejecutar_con_cache(cache, trabajo):
+    """
+    ejecutar_trabajo usando la cache de resultados. La clave es el trabajo
+    sin su id, escrito como JSON con las claves ordenadas: hashear ese
+    texto es mucho más rápido que recorrer listas grandes de números.
+    """
+    if not isinstance(trabajo, dict):
+        return ejecutar_trabajo(trabajo)
+    sin_id = {k: v for k, v in trabajo.items() if k != "id"}
+    clave = cache.clave(ejecutar_trabajo, json.dumps(sin_id, sort_keys=True))
+    encontrado, resultado = cache.obtener(clave)
+    if not encontrado:
+        resultado = ejecutar_trabajo(trabajo)
+        cache.guardar(clave, resultado)
+    return resultado
+
+
+def _lineas_terminadas(ruta):
+    """
+    Cuenta las líneas completas de la salida de una ejecución anterior y
+    corta la última si quedó a medias (por ejemplo, tras una caída).
+    """
+    if not os.path.exists(ruta):
+        return 0
+    with open(ruta, "r+b") as archivo:
+        contenido_final = 0
+        lineas = 0
+        for linea in archivo:
+            if not linea.endswith(b"\n"):
+                break
+            lineas += 1
+            contenido_final += len(linea)
+        archivo.truncate(contenido_final)
+    return lineas
+
+
+def ejecutar_lote(
+    entrada,
+    salida,
+    procesos=None,
+    max_pendientes=None,
+    tamano_bloque=16,
+    reanudar=True,
+    usar_cache=True,
+):
+    """
+    Resuelve todos los trabajos de un archivo JSON lines en un conjunto de
+    procesos y escribe los resultados en otro archivo JSON lines.
+
+    La entrada se lee por bloques a medida que hay lugar, con a lo más
+    max_pendientes bloques en curso, y cada bloque se escribe en cuanto él y
+    todos los anteriores terminaron. Así la memoria no depende del tamaño
+    del archivo y la salida queda siempre en el orden de la entrada.
+
+    Con reanudar=True, si la salida ya existe se conservan sus líneas
+    completas y se continúa desde la siguiente línea de la entrada.
+
+    Args:
+        entrada: Ruta del archivo de trabajos
+        salida: Ruta del archivo de resultados
+        procesos: Número de procesos (por defecto todos los núcleos)
+        max_pendientes: Máximo de bloques en curso (por defecto 4 por proceso)
+        tamano_bloque: Líneas por tarea enviada a un proceso
+        reanudar: Continúa una ejecución anterior en lugar de empezar de cero
+        usar_cache: Reusa los resultados de trabajos ya resueltos (en este u
+            otros lotes, ver metodos.resultados)
+
+    Returns:
+        Un diccionario con las líneas procesadas, las omitidas por ya estar
+        en la salida y las que terminaron con error
+
+    Raises:
+        ValueError: Si los parámetros no son válidos
+    """
+    procesos = procesos or os.cpu_count() or 1
+    max_pendientes = max_pendientes or 4 * procesos
+    if procesos <= 0 or max_pendientes <= 0 or tamano_bloque <= 0:
+        raise ValueError("procesos, max_pendientes y tamano_bloque deben ser positivos")
+
+    omitidas = _lineas_terminadas(salida) if reanudar else 0
+    resumen = {"procesadas": 0, "omitidas": omitidas, "errores": 0}
+
+    with (
+        open(entrada) as archivo_entrada,
+        open(salida, "a" if reanudar else "w") as archivo_salida,
+        crear_procesos(procesos) as ejecutor,
+    ):
+        lineas = enumerate(islice(archivo_entrada, omitidas, None), start=omitidas + 1)
+        pendientes = deque()
+
+        def escribir_siguiente():
+            texto, errores = pendientes.popleft().result()
+            archivo_salida.write(texto)
+            archivo_salida.flush()
+            resumen["procesadas"] += texto.count("\n")
+            resumen["errores"] += errores
+
+        while True:
+            bloque = list(islice(lineas, tamano_bloque))
+            if not bloque:
+                break
+            if len(pendientes) >= max_pendientes:
+                escribir_siguiente()
+            pendientes.append(ejecutor.submit(_ejecutar_bloque, bloque, usar_cache))
+
+        while pendientes:
+            escribir_siguiente()
+
+    return resumen
@@ -0,0 +1,153 @@
+import numpy as np
+
+
+class MatrizCSR:
+    """
+    Matriz dispersa en formato CSR (compressed sparse row).
+
+    Solo guarda los elementos distintos de cero: para la fila i, sus columnas
+    están en indices[indptr[i]:indptr[i + 1]] y sus valores en la misma
+    porción de data. Usa los mismos nombres de atributos que
+    scipy.sparse.csr_matrix, así que los métodos aceptan cualquiera de las dos.
+    """
+
+    def __init__(self, data, indices, indptr, shape):
+        """
+        Args:
+            data: Valores distintos de cero, fila por fila
+            indices: Columna de cada valor de data
+            indptr: Inicio de cada fila en data (longitud filas + 1)
+            shape: Tupla (filas, columnas)
+
+        Raises:
+            ValueError: Si los arreglos no son consistentes entre sí
+        """
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.shape = (int(shape[0]), int(shape[1]))
+
+        if len(self.indptr) != self.shape[0] + 1:
+            raise ValueError("indptr debe tener una entrada más que el número de filas")
+        if len(self.data) != len(self.indices) or self.indptr[-1] != len(self.data):
+            raise ValueError("data, indices e indptr no son consistentes")
+        if len(self.indices) and (
+            self.indices.min() < 0 or self.indices.max() >= self.shape[1]
+        ):
+            raise ValueError("Hay índices de columna fuera de la matriz")
+
+    @classmethod
+    def desde_tripletas(cls, filas, columnas, valores, shape):
+        """
+        Construye la matriz a partir de tripletas (fila, columna, valor).
+        Las entradas repetidas se suman.
+        """
+        filas = np.asarray(filas, dtype=np.int64)
+        columnas = np.asarray(columnas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=float)
+        if not len(filas) == len(columnas) == len(valores):
+            raise ValueError("filas, columnas y valores deben tener la misma longitud")
+        if len(filas) and (filas.min() < 0 or filas.max() >= shape[0]):
+            raise ValueError("Hay índices de fila fuera de la matriz")
+
+        # Ordenar por fila y luego por columna, y sumar los repetidos
+        orden = np.lexsort((columnas, filas))
+        filas, columnas, valores = filas[orden], columnas[orden], valores[orden]
+        if len(filas):
+            nuevas = np.ones(len(filas), dtype=bool)
+            nuevas[1:] = (filas[1:] != filas[:-1]) | (columnas[1:] != columnas[:-1])
+            inicios = np.flatnonzero(nuevas)
+            valores = np.add.reduceat(valores, inicios)
+            filas, columnas = filas[inicios], columnas[inicios]
+
+        indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(filas, minlength=shape[0]), out=indptr[1:])
+        return cls(valores, columnas, indptr, shape)
+
+    @classmethod
+    def desde_densa(cls, A):
+        """Construye la matriz a partir de una matriz densa (lista de listas o arreglo)."""
+        A = np.asarray(A, dtype=float)
+        if A.ndim != 2:
+            raise ValueError("A debe ser una matriz")
+        filas, columnas = np.nonzero(A)
+        return cls.desde_tripletas(filas, columnas, A[filas, columnas], A.shape)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def diagonal(self):
+        """Retorna la diagonal principal como arreglo (con ceros donde no hay entrada)."""
+        diagonal = np.zeros(min(self.shape))
+        filas = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        en_diagonal = filas == self.indices
+        diagonal[filas[en_diagonal]] = self.data[en_diagonal]
+        return diagonal
+
+    def suma_abs_filas(self):
+        """Retorna la suma de los valores absolutos de cada fila."""
+        filas = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return np.bincount(filas, weights=np.abs(self.data), minlength=self.shape[0])
+
+    def simetrizar_patron(self):
+        """
+        Retorna una matriz con el patrón de A + Aᵀ (con unos como valores),
+        que representa el grafo de dependencias entre las incógnitas.
+        """
+        filas = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return MatrizCSR.desde_tripletas(
+            np.concatenate([filas, self.indices]),
+            np.concatenate([self.indices, filas]),
+            np.ones(2 * self.nnz),
+            self.shape,
+        )
+
+    def __matmul__(self, x):
+        x = np.asarray(x, dtype=float)
+        filas = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        if x.ndim == 2:
+            return np.column_stack(
+                [self @ columna for columna in x.T] or [np.zeros(self.shape[0])]
+            )
+        return np.bincount(
+            filas, weights=self.data * x[self.indices], minlength=self.shape[0]
+        )
+
+    def a_densa(self):
+        """Retorna la matriz como arreglo denso de NumPy."""
+        densa = np.zeros(self.shape)
+        filas = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        np.add.at(densa, (filas, self.indices), self.data)
+        return densa
+
+
+def colorear(A):
+    """
+    Colorea el grafo de la matriz de forma voraz: dos incógnitas que
+    dependen una de la otra (A[i, j] != 0 o A[j, i] != 0) nunca comparten
+    color. En mallas con estencil de 5 puntos en orden natural el
+    resultado es la coloración rojo-negro.
+
+    Args:
+        A: MatrizCSR cuadrada
+
+    Returns:
+        Arreglo con el color (0, 1, 2, ...) de cada incógnita
+    """
+    patron = A.simetrizar_patron()
+    indptr, indices = patron.indptr.tolist(), patron.indices.tolist()
+
+    colores = [-1] * A.shape[0]
+    for i in range(A.shape[0]):
+        usados = {colores[j] for j in indices[indptr[i] : indptr[i + 1]] if j != i}
+        color = 0
+        while color in usados:
+            color += 1
+        colores[i] = color
+    return np.array(colores, dtype=np.int64)
+
+
+def es_dispersa(A):
+    """Indica si A es una matriz dispersa (MatrizCSR o de scipy.sparse)."""
+    return isinstance(A, MatrizCSR) or hasattr(A, "tocsr")
@@ -0,0 +1,110 @@
+"""
+Muestreo adaptativo de funciones para graficarlas.
+
+En lugar de una malla fija, se parte de pocas muestras y se agregan puntos
+medios solo donde la curva no se parece a una recta (curvatura alta), donde
+cambia de signo o donde deja de ser finita (polos). El número total de
+evaluaciones está acotado, así que el costo no depende de la función.
+"""
+
+import numpy as np
+
+
+def muestrear(
+    f,
+    a,
+    b,
+    muestras_iniciales=64,
+    max_evaluaciones=2000,
+    tolerancia=1e-3,
+):
+    """
+    Evalúa f en [a, b] con más muestras donde la curva cambia rápido.
+
+    Cada ronda evalúa de una vez el punto medio de todos los tramos
+    candidatos. Un tramo se sigue dividiendo si su punto medio se aleja de
+    la recta entre sus extremos más que tolerancia veces la altura de la
+    curva, si f cambia de signo en él o si f no está definida (nan). Si el
+    presupuesto no alcanza, se dividen primero los tramos más curvos.
+
+    Args:
+        f: Función vectorizada de NumPy (puede retornar un escalar si es
+            constante)
+        a: Extremo izquierdo
+        b: Extremo derecho
+        muestras_iniciales: Muestras de la malla uniforme de partida
+        max_evaluaciones: Máximo de evaluaciones de f en total
+        tolerancia: Error relativo a la altura de la curva que se acepta al
+            unir dos muestras con una recta
+
+    Returns:
+        Una tupla (x, y) de arreglos ordenados por x
+
+    Raises:
+        ValueError: Si el intervalo o los parámetros no son válidos
+    """
+    a, b = float(a), float(b)
+    if not np.isfinite(a) or not np.isfinite(b) or a >= b:
+        raise ValueError("El intervalo debe cumplir a < b")
+    if muestras_iniciales < 2 or max_evaluaciones < muestras_iniciales:
+        raise ValueError(
+            "Se necesitan al menos 2 muestras y max_evaluaciones >= muestras_iniciales"
+        )
+
+    x = np.linspace(a, b, int(muestras_iniciales))
+    y = evaluar(f, x)
+    evaluaciones = len(x)
+    # Tramos más angostos que esto ya no se dividen: para ver más detalle
+    # hay que acercarse (y volver a muestrear el rango visible)
+    ancho_minimo = (b - a) / 2**20
+
+    candidatos = np.arange(len(x) - 1)
+    prioridad = np.zeros(len(candidatos))
+    while len(candidatos) and evaluaciones < max_evaluaciones:
+        restantes = max_evaluaciones - evaluaciones
+        if len(candidatos) > restantes:
+            # Sin presupuesto para todos: primero los tramos más curvos
+            elegidos = np.argpartition(-prioridad, restantes - 1)[:restantes]
+            candidatos = np.sort(candidatos[elegidos])
+        izquierda, derecha = x[candidatos], x[candidatos + 1]
+        medios = 0.5 * (izquierda + derecha)
+        y_medios = evaluar(f, medios)
+        evaluaciones += len(medios)
+
+        # La altura de la curva se mide sin los valores enormes de los
+        # polos, y los valores se recortan a esa franja: fuera de ella no
+        # se ve nada y no vale la pena refinar
+        finitos = y[np.isfinite(y)]
+        if len(finitos):
+            bajo, alto = np.percentile(finitos, [1, 99])
+            altura = max(alto - bajo, 1e-12)
+        else:
+            bajo, alto, altura = -1.0, 1.0, 1.0
+        franja = (bajo - altura, alto + altura)
+        y_izquierda = np.clip(y[candidatos], *franja)
+        y_derecha = np.clip(y[candidatos + 1], *franja)
+
+        with np.errstate(invalid="ignore"):
+            desvio = np.abs(np.clip(y_medios, *franja) - 0.5 * (y_izquierda + y_derecha))
+            desvio = np.where(np.isnan(desvio), np.inf, desvio / altura)
+            dividir = (
+                (desvio > tolerancia) | (y_izquierda * y_derecha < 0)
+            ) & (derecha - izquierda > 2 * ancho_minimo)
+
+        # Insertar los puntos medios: el tramo k, con j candidatos antes que
+        # él, pasa a ser los tramos k + j y k + j + 1
+        x = np.insert(x, candidatos + 1, medios)
+        y = np.insert(y, candidatos + 1, y_medios)
+        nuevos = candidatos[dividir] + np.flatnonzero(dividir)
+        candidatos = np.concatenate([nuevos, nuevos + 1])
+        prioridad = np.tile(desvio[dividir], 2)
+        orden = np.argsort(candidatos)
+        candidatos, prioridad = candidatos[orden], prioridad[orden]
+
+    return x, y
+
+
+def evaluar(f, x):
+    """Evalúa f vectorizada en x (f puede retornar un escalar si es constante)."""
+    with np.errstate(all="ignore"):
+        return np.broadcast_to(np.asarray(f(x), dtype=float), x.shape).copy()
@@ -0,0 +1,165 @@
+"""
+Medición del tiempo de cada fase de una resolución.
+
+Un Perfilador guarda las últimas ejecuciones. Cada ejecución acumula el
+tiempo de sus fases (lectura de datos, compilación de la función, el
+método, la gráfica, ...) y contadores (iteraciones, evaluaciones, ...):
+
+    ejecucion = perfilador.iniciar("regla_falsa")
+    with ejecucion.fase("compilacion"):
+        f = compilar_expresion(texto)
+    ejecucion.contar("evaluaciones", estado.evaluaciones)
+    ejecucion.terminar()
+
+Las fases de una misma ejecución pueden medirse desde hilos distintos
+(la interfaz y el hilo del trabajo). Con perfilar=True, además, cada fase
+se perfila con cProfile y el resultado se puede exportar para verlo con
+pstats o snakeviz.
+"""
+
+import cProfile
+import json
+import pstats
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Hilos que ya tienen un cProfile activo: no se puede anidar otro
+_perfilando = threading.local()
+
+
+class Ejecucion:
+    """Tiempos por fase y contadores de una resolución."""
+
+    def __init__(self, nombre, perfilador, perfilar=False):
+        self.nombre = nombre
+        self.inicio = time.time()
+        self.fases = {}
+        self.contadores = {}
+        self.estado = "en curso"
+        self.mensaje = None
+        self.duracion = None
+        self._perfilador = perfilador
+        self._perfilar = perfilar
+        self._perfiles = []
+        self._t0 = time.perf_counter()
+        self._candado = threading.Lock()
+
+    @contextmanager
+    def fase(self, nombre):
+        """Suma a la fase nombre el tiempo que tarda el bloque with."""
+        perfil = None
+        if self._perfilar and not getattr(_perfilando, "activo", False):
+            perfil = cProfile.Profile()
+            try:
+                perfil.enable()
+            except ValueError:
+                # Desde Python 3.12 solo puede haber un perfilador activo en
+                # todo el proceso: si otro hilo ya perfila, solo se mide el tiempo
+                perfil = None
+            else:
+                _perfilando.activo = True
+        t0 = time.perf_counter()
+        try:
+            yield self
+        finally:
+            transcurrido = time.perf_counter() - t0
+            if perfil is not None:
+                perfil.disable()
+                _perfilando.activo = False
+            with self._candado:
+                self.fases[nombre] = self.fases.get(nombre, 0.0) + transcurrido
+                if perfil is not None:
+                    self._perfiles.append(perfil)
+
+    def contar(self, nombre, cantidad=1):
+        """Suma cantidad al contador nombre (se ignora si cantidad es None)."""
+        if cantidad is None:
+            return
+        with self._candado:
+            self.contadores[nombre] = self.contadores.get(nombre, 0) + cantidad
+
+    def terminar(self, estado="ok", mensaje=None):
+        """
+        Cierra la ejecución y la agrega al perfilador. Solo cuenta la
+        primera llamada: una ejecución cancelada ya no cambia si después
+        llega su resultado.
+        """
+        with self._candado:
+            if self.duracion is not None:
+                return
+            self.duracion = time.perf_counter() - self._t0
+            self.estado = estado
+            self.mensaje = mensaje
+        self._perfilador._agregar(self)
+
+    def a_dict(self):
+        with self._candado:
+            return {
+                "nombre": self.nombre,
+                "inicio": self.inicio,
+                "duracion": self.duracion,
+                "estado": self.estado,
+                "mensaje": self.mensaje,
+                "fases": dict(self.fases),
+                "contadores": dict(self.contadores),
+            }
+
+
+class Perfilador:
+    """Guarda las últimas ejecuciones terminadas y las exporta."""
+
+    def __init__(self, max_ejecuciones=20, perfilar=False):
+        """
+        Args:
+            max_ejecuciones: Cuántas ejecuciones terminadas se conservan
+            perfilar: Si True, las fases se perfilan también con cProfile
+
+        Raises:
+            ValueError: Si max_ejecuciones no es un entero positivo
+        """
+        if not isinstance(max_ejecuciones, int) or max_ejecuciones <= 0:
+            raise ValueError("max_ejecuciones debe ser un entero positivo")
+        self.perfilar = perfilar
+        self._ejecuciones = deque(maxlen=max_ejecuciones)
+        self._candado = threading.Lock()
+
+    def iniciar(self, nombre):
+        """Retorna una Ejecucion nueva; se guarda cuando se llama a terminar()."""
+        return Ejecucion(nombre, self, self.perfilar)
+
+    def ejecuciones(self):
+        """Las ejecuciones guardadas, de la más antigua a la más reciente."""
+        with self._candado:
+            return list(self._ejecuciones)
+
+    def limpiar(self):
+        with self._candado:
+            self._ejecuciones.clear()
+
+    def exportar_json(self, ruta):
+        """Guarda las ejecuciones (fases en segundos) como JSON."""
+        datos = [e.a_dict() for e in self.ejecuciones()]
+        with open(ruta, "w") as archivo:
+            json.dump({"ejecuciones": datos}, archivo, indent=2)
+            archivo.write("\n")
+
+    def exportar_cprofile(self, ruta):
+        """
+        Guarda juntos los perfiles de cProfile de todas las ejecuciones, en
+        el formato de pstats (python -m pstats ruta).
+
+        Raises:
+            ValueError: Si no hay ejecuciones perfiladas con cProfile
+        """
+        perfiles = [p for e in self.ejecuciones() for p in e._perfiles]
+        if not perfiles:
+            raise ValueError(
+                "No hay perfiles de cProfile (active el perfilado y resuelva algo)"
+            )
+        pstats.Stats(*perfiles).dump_stats(ruta)
+
+    def _agregar(self, ejecucion):
+        with self._candado:
+            self._ejecuciones.append(ejecucion)
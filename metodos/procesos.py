@@ -0,0 +1,22 @@
+"""
+Conjuntos de procesos para repartir trabajo (todas_las_raices, lotes).
+
+Los procesos no se crean con fork: si antes se usó Gauss-Seidel
+multicolor, Numba ya tiene hilos trabajando (con TBB u OpenMP) y un fork
+de un proceso con hilos deja su estado a medias; con TBB el proceso se
+cuelga al salir. Con forkserver cada proceso nuevo sale de un servidor
+limpio que no cargó Numba. Donde no existe (Windows), se usa el método
+por defecto, que ya es spawn.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+def crear_procesos(max_workers=None):
+    """Retorna un ProcessPoolExecutor cuyos procesos no se crean con fork."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        contexto = multiprocessing.get_context("forkserver")
+    else:
+        contexto = multiprocessing.get_context()
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=contexto)
@@ -1,16 +1,505 @@
-def regla_falsa(f, a, b, tol=1e-6, max_iter=1000):
-    if f(a) * f(b) >= 0:
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import NamedTuple
+
+import numpy as np
+
+from metodos.muestreo import evaluar
+from metodos.procesos import crear_procesos
+from metodos.traza import Iteracion
+
+METODOS = ("clasica", "illinois", "anderson-bjorck", "brent")
+
+# Variantes que se pueden vectorizar sobre muchos intervalos a la vez
+METODOS_LOTE = ("clasica", "illinois", "anderson-bjorck")
+
+# Formas de repartir los intervalos en todas_las_raices
+EJECUTORES = {"hilos": ThreadPoolExecutor, "procesos": crear_procesos}
+
+
+class EstadoRaiz(NamedTuple):
+    """
+    Resultado estructurado de una búsqueda de raíz.
+
+    estado : str ("convergio", "max_iter" o "cancelado")
+    iteraciones : int
+    evaluaciones : int (veces que se evaluó f, incluyendo los extremos)
+    intervalo : tuple (último intervalo [a, b] que encierra la raíz)
+    valor : float (f evaluada en la raíz encontrada)
+    """
+
+    estado: str
+    iteraciones: int
+    evaluaciones: int
+    intervalo: tuple
+    valor: float
+
+    @property
+    def convergio(self):
+        return self.estado == "convergio"
+
+
+class ContadorEvaluaciones:
+    """Envuelve una función y cuenta cuántas veces se evalúa."""
+
+    def __init__(self, f):
+        self.f = f
+        self.evaluaciones = 0
+
+    def __call__(self, x):
+        self.evaluaciones += 1
+        return self.f(x)
+
+
+def regla_falsa(
+    f,
+    a,
+    b,
+    tol=1e-6,
+    max_iter=1000,
+    metodo="clasica",
+    retornar_estado=False,
+    callback=None,
+):
+    """
+    Busca una raíz de f en el intervalo [a, b] por regla falsa.
+
+    Todas las variantes evalúan f una sola vez por iteración (más las dos
+    evaluaciones iniciales en los extremos) y se detienen cuando |f(c)| < tol:
+
+    - "clasica": regla falsa de siempre; puede estancarse cuando uno de los
+      extremos se queda fijo.
+    - "illinois": si el mismo extremo se conserva dos veces seguidas, divide
+      a la mitad su valor de f para que la secante se acerque a la raíz.
+    - "anderson-bjorck": como Illinois, pero el factor de escala se calcula
+      a partir de los dos últimos valores de f.
+    - "brent": método de Brent, que combina interpolación cuadrática
+      inversa, secante y bisección, con convergencia garantizada.
+
+    Args:
+        f: Función de una variable
+        a, b: Extremos del intervalo (f(a) y f(b) deben tener signos opuestos)
+        tol: Tolerancia sobre |f(c)|
+        max_iter: Máximo número de iteraciones
+        metodo: Una de las variantes de arriba
+        retornar_estado: Si es True, retorna un EstadoRaiz en lugar del número
+            de iteraciones y no lanza excepción si no converge
+        callback: Función que recibe un Iteracion por iteración (x es el nuevo
+            punto, error el ancho del intervalo y residuo |f(x)|); si retorna
+            True la búsqueda se cancela
+
+    Returns:
+        Una tupla con la raíz y el número de iteraciones (o el EstadoRaiz)
+
+    Raises:
+        ValueError: Si la función no cambia de signo en el intervalo, si el
+            método no es válido, si no converge en max_iter iteraciones o si
+            se cancela
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"metodo debe ser uno de {', '.join(METODOS)}")
+    max_iter = int(max_iter)  # Se acepta también como float, p. ej. 1e5
+
+    contador = ContadorEvaluaciones(f)
+    fa, fb = contador(a), contador(b)
+    if fa * fb >= 0:
         raise ValueError("La función no cambia de signo en el intervalo dado.")
 
-    iteraciones = 0
-    while iteraciones < max_iter:
-        c = (a * f(b) - b * f(a)) / (f(b) - f(a))
-        if abs(f(c)) < tol:  # Checamos tolerancias
-            return c, iteraciones
-        if f(a) * f(c) < 0:  # Si tienen el mismo signo copiamos c a b
-            b = c
+    reportar = None if callback is None else _Reportero(callback)
+    if metodo == "brent":
+        resultado = _brent(contador, a, b, fa, fb, tol, max_iter, reportar)
+    else:
+        resultado = _secante_acotada(
+            contador, a, b, fa, fb, tol, max_iter, metodo, reportar
+        )
+    c, fc, iteraciones, intervalo, estado = resultado
+
+    estado = EstadoRaiz(estado, iteraciones, contador.evaluaciones, intervalo, fc)
+    if retornar_estado:
+        return c, estado
+    if estado.estado == "cancelado":
+        raise ValueError("Se canceló la búsqueda de la raíz.")
+    if not estado.convergio:
+        raise ValueError("El método no convergió en el número máximo de iteraciones.")
+    return c, iteraciones
+
+
+def regla_falsa_lote(
+    f, a, b, tol=1e-6, max_iter=1000, metodo="illinois", parametros=()
+):
+    """
+    Busca a la vez las raíces de muchos problemas del mismo tipo: una misma
+    función en muchos intervalos, o una familia de funciones f(x, p1, p2, ...)
+    con distintos parámetros. En cada iteración f se evalúa una sola vez,
+    vectorizada sobre todos los problemas que siguen activos; los que
+    convergen se retiran del conjunto activo.
+
+    Args:
+        f: Función vectorizada f(x, *parametros) (p. ej. de sp.lambdify con "numpy")
+        a, b: Arreglos (o escalares) con los extremos de cada intervalo
+        tol: Tolerancia sobre |f(c)|
+        max_iter: Máximo número de iteraciones
+        metodo: "clasica", "illinois" o "anderson-bjorck" (ver regla_falsa)
+        parametros: Secuencia de arreglos (o escalares) con los parámetros
+            de cada problema; se combinan con a y b por broadcasting
+
+    Returns:
+        Una tupla de arreglos con la forma común de a, b y los parámetros:
+        - Las raíces (nan donde no hay cambio de signo)
+        - Las iteraciones de cada problema
+        - El estado de cada problema: "convergio", "max_iter",
+          "sin_cambio_signo", "sin_avance" (el intervalo ya no se puede
+          partir en punto flotante sin llegar a la tolerancia; la raíz es
+          el mejor extremo) o "no_finito" (c o f(c) no es finito; la raíz
+          es nan)
+
+    Raises:
+        ValueError: Si el método no es válido, max_iter no es positivo o las
+            formas no son compatibles
+    """
+    if metodo not in METODOS_LOTE:
+        raise ValueError(f"metodo debe ser uno de {', '.join(METODOS_LOTE)}")
+    max_iter = int(max_iter)
+    if max_iter <= 0:
+        raise ValueError("max_iter debe ser positivo")
+
+    arreglos = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (a, b, *parametros))
+    )
+    forma = arreglos[0].shape
+    a, b, *parametros = (v.ravel().copy() for v in arreglos)
+    n = len(a)
+
+    raices = np.full(n, np.nan)
+    iteraciones = np.zeros(n, dtype=int)
+    estados = np.full(n, "max_iter", dtype="<U16")
+
+    fa = np.broadcast_to(f(a, *parametros), (n,)).astype(float)
+    fb = np.broadcast_to(f(b, *parametros), (n,)).astype(float)
+
+    # Los extremos que ya son raíz terminan sin iterar
+    for extremo, f_extremo in ((a, fa), (b, fb)):
+        exactos = (f_extremo == 0) & (estados == "max_iter")
+        raices[exactos] = extremo[exactos]
+        estados[exactos] = "convergio"
+    estados[(fa * fb > 0) | ~np.isfinite(fa * fb)] = "sin_cambio_signo"
+
+    # Arreglos compactos con solo los problemas activos
+    activos = np.flatnonzero(estados == "max_iter")
+    a, b, fa, fb = a[activos], b[activos], fa[activos], fb[activos]
+    parametros = [p[activos] for p in parametros]
+
+    for it in range(max_iter):
+        if len(activos) == 0:
+            break
+
+        c = (a * fb - b * fa) / (fb - fa)
+        fc = np.broadcast_to(f(c, *parametros), c.shape).astype(float)
+
+        # Terminan los que cumplen la tolerancia, los que ya no se pueden
+        # partir y los que dan valores no finitos (desbordes, nan)
+        no_finito = ~(np.isfinite(c) & np.isfinite(fc))
+        sin_avance = ~no_finito & ~((np.minimum(a, b) < c) & (c < np.maximum(a, b)))
+        convergio = ~no_finito & ~sin_avance & (np.abs(fc) < tol)
+        hechos = convergio | sin_avance | no_finito
+        iteraciones[activos[hechos]] = it
+
+        raices[activos[convergio]] = c[convergio]
+        estados[activos[convergio]] = "convergio"
+        estados[activos[no_finito]] = "no_finito"
+        # En las variantes modificadas fa está escalado: b es el último
+        # punto calculado, y en la clásica se toma el extremo con menor |f|
+        if metodo == "clasica":
+            mejor = np.where(np.abs(fa) < np.abs(fb), a, b)
+        else:
+            mejor = b
+        raices[activos[sin_avance]] = mejor[sin_avance]
+        estados[activos[sin_avance]] = "sin_avance"
+
+        if metodo == "clasica":
+            lado_b = fa * fc < 0  # La raíz está entre a y c
+            b = np.where(lado_b, c, b)
+            fb = np.where(lado_b, fc, fb)
+            a = np.where(lado_b, a, c)
+            fa = np.where(lado_b, fa, fc)
+        else:
+            cruzo = fc * fb < 0  # b pasa a ser el extremo conservado
+            if metodo == "illinois":
+                escala = np.full_like(fc, 0.5)
+            else:
+                escala = 1 - fc / fb
+                escala[escala <= 0] = 0.5
+            a = np.where(cruzo, b, a)
+            fa = np.where(cruzo, fb, fa * escala)
+            b, fb = c, fc
+
+        pendientes = ~hechos
+        activos = activos[pendientes]
+        a, b, fa, fb = a[pendientes], b[pendientes], fa[pendientes], fb[pendientes]
+        parametros = [p[pendientes] for p in parametros]
+
+    # Los que se quedaron sin iteraciones reportan la última aproximación
+    if len(activos):
+        raices[activos] = c[pendientes]
+        iteraciones[activos] = max_iter
+
+    return raices.reshape(forma), iteraciones.reshape(forma), estados.reshape(forma)
+
+
+def todas_las_raices(
+    f,
+    a,
+    b,
+    tol=1e-6,
+    max_iter=1000,
+    metodo="illinois",
+    muestras=100,
+    refinamientos=3,
+    subdivisiones=8,
+    muestras_previas=None,
+    paralelo=None,
+    trabajadores=None,
+):
+    """
+    Busca todas las raíces de f en [a, b].
+
+    Primero muestrea f en una sola llamada vectorizada y refina la malla
+    donde f cambia de signo o donde |f| tiene un mínimo local (ahí puede
+    haber dos raíces muy juntas que la malla gruesa no separa). Cada par de
+    muestras consecutivas con signos opuestos es un intervalo con una raíz,
+    y todos se resuelven a la vez:
+
+    - Sin paralelo y con una variante de METODOS_LOTE, con regla_falsa_lote,
+      evaluando f una vez por iteración sobre todos los intervalos.
+    - Con paralelo="hilos" o "procesos", cada intervalo se resuelve con
+      regla_falsa en un conjunto de hilos o procesos; conviene cuando f es
+      cara y no se puede vectorizar. Con procesos, las funciones de
+      compilar_expresion se mandan como texto y cada proceso las compila;
+      cualquier otra f debe poder serializarse (p. ej. una función definida
+      a nivel de módulo).
+
+    Los cambios de signo causados por polos (como en tan(x)) se descartan.
+
+    Args:
+        f: Función vectorizada de una variable
+        a, b: Extremos del intervalo
+        tol: Tolerancia sobre |f(c)|
+        max_iter: Máximo número de iteraciones por raíz
+        metodo: Una de las variantes de regla_falsa
+        muestras: Número de muestras iniciales
+        refinamientos: Rondas de refinamiento de la malla
+        subdivisiones: En cuántas partes se divide cada tramo refinado
+        muestras_previas: Tupla (x, y) con muestras ya calculadas (p. ej. las
+            de la gráfica) que se usan en lugar de las muestras iniciales
+        paralelo: None, "hilos" o "procesos"
+        trabajadores: Número de hilos o procesos (por defecto todos los núcleos)
+
+    Returns:
+        Lista ordenada con las raíces encontradas (vacía si no hay ninguna)
+
+    Raises:
+        ValueError: Si los parámetros no son válidos
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"metodo debe ser uno de {', '.join(METODOS)}")
+    if paralelo is not None and paralelo not in EJECUTORES:
+        raise ValueError(f"paralelo debe ser None o uno de {', '.join(EJECUTORES)}")
+    if not a < b:
+        raise ValueError("El intervalo debe cumplir a < b")
+    if int(muestras) < 2 or int(subdivisiones) < 2:
+        raise ValueError("muestras y subdivisiones deben ser al menos 2")
+
+    if muestras_previas is None:
+        x = np.linspace(a, b, int(muestras))
+        y = evaluar(f, x)
+    else:
+        x, y = (np.asarray(v, dtype=float).ravel() for v in muestras_previas)
+        if len(x) != len(y) or len(x) < 2:
+            raise ValueError("muestras_previas debe tener x e y de la misma longitud")
+        orden = np.argsort(x)
+        x, y = x[orden], y[orden]
+    x, y = _refinar_muestras(f, x, y, int(refinamientos), int(subdivisiones))
+
+    raices = x[y == 0].tolist()
+    tramos = np.flatnonzero(y[:-1] * y[1:] < 0)
+    if len(tramos) == 0:
+        return sorted(raices)
+    izquierdos, derechos = x[tramos], x[tramos + 1]
+
+    if paralelo is None and metodo in METODOS_LOTE:
+        encontradas, _, _ = regla_falsa_lote(
+            f, izquierdos, derechos, tol, max_iter, metodo=metodo
+        )
+    else:
+        f_tramos = f
+        if paralelo == "procesos" and hasattr(f, "texto"):
+            from metodos.expresiones import FuncionSerializable
+
+            f_tramos = FuncionSerializable(f)
+        resolver = partial(
+            _raiz_en_tramo, f_tramos, tol=tol, max_iter=max_iter, metodo=metodo
+        )
+        if paralelo is None:
+            encontradas = list(map(resolver, izquierdos, derechos))
+        else:
+            with EJECUTORES[paralelo](max_workers=trabajadores) as ejecutor:
+                encontradas = list(ejecutor.map(resolver, izquierdos, derechos))
+        encontradas = np.array(encontradas, dtype=float)
+
+    # En un polo |f| crece al acercarse, así que en la "raíz" es mayor que en
+    # las muestras que la rodean; en una raíz verdadera es menor
+    valores = np.abs(evaluar(f, encontradas))
+    vecinos = np.minimum(np.abs(y[tramos]), np.abs(y[tramos + 1]))
+    raices.extend(encontradas[valores <= vecinos].tolist())
+    return sorted(raices)
+
+
+def _refinar_muestras(f, x, y, refinamientos, subdivisiones):
+    """
+    Agrega muestras en los tramos con cambio de signo o junto a un mínimo
+    local de |f|, evaluando todas las muestras nuevas de una vez por ronda.
+    """
+    fracciones = np.arange(1, subdivisiones) / subdivisiones
+    for _ in range(refinamientos):
+        absolutos = np.abs(y)
+        minimos = np.zeros(len(y), dtype=bool)
+        minimos[1:-1] = (absolutos[1:-1] < absolutos[:-2]) & (
+            absolutos[1:-1] < absolutos[2:]
+        )
+        sospechosos = (y[:-1] * y[1:] < 0) | minimos[:-1] | minimos[1:]
+        tramos = np.flatnonzero(sospechosos)
+        if len(tramos) == 0:
+            break
+
+        anchos = x[tramos + 1] - x[tramos]
+        x_nuevos = (x[tramos, None] + anchos[:, None] * fracciones).ravel()
+        x = np.concatenate([x, x_nuevos])
+        y = np.concatenate([y, evaluar(f, x_nuevos)])
+        orden = np.argsort(x, kind="stable")
+        x, y = x[orden], y[orden]
+    return x, y
+
+
+def _raiz_en_tramo(f, a, b, tol, max_iter, metodo):
+    """Resuelve un solo tramo para todas_las_raices (debe poder serializarse)."""
+    raiz, _ = regla_falsa(f, a, b, tol, max_iter, metodo=metodo, retornar_estado=True)
+    return raiz
+
+
+class _Reportero:
+    """Arma los registros Iteracion para el callback y mide el tiempo."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.inicio = time.perf_counter()
+
+    def __call__(self, iteracion, c, fc, a, b):
+        paso = Iteracion(
+            iteracion, c, abs(b - a), abs(fc), time.perf_counter() - self.inicio
+        )
+        return bool(self.callback(paso))
+
+
+def _secante_acotada(f, a, b, fa, fb, tol, max_iter, metodo, reportar=None):
+    """
+    Regla falsa clásica y sus variantes modificadas. Retorna la raíz, f en
+    la raíz, las iteraciones, el último intervalo y el estado.
+    """
+    if metodo == "clasica":
+        c, fc = a, fa
+        iteraciones = 0
+        while iteraciones < max_iter:
+            c = (a * fb - b * fa) / (fb - fa)
+            fc = f(c)
+            if abs(fc) < tol:  # Checamos tolerancias
+                if reportar is not None:
+                    reportar(iteraciones + 1, c, fc, a, b)
+                return c, fc, iteraciones, (a, b), "convergio"
+            if fa * fc < 0:  # Si tienen el mismo signo copiamos c a b
+                b, fb = c, fc
+            else:
+                a, fa = c, fc
+            iteraciones += 1
+            if reportar is not None and reportar(iteraciones, c, fc, a, b):
+                return c, fc, iteraciones, (a, b), "cancelado"
+        return c, fc, iteraciones, (a, b), "max_iter"
+
+    # En las variantes modificadas b es siempre el último punto calculado y
+    # a el extremo que se conserva del otro lado de la raíz
+    c, fc = b, fb
+    for iteraciones in range(max_iter):
+        c = (a * fb - b * fa) / (fb - fa)
+        if not min(a, b) < c < max(a, b):
+            # El intervalo ya no se puede partir en punto flotante
+            return b, fb, iteraciones, (min(a, b), max(a, b)), "convergio"
+        fc = f(c)
+        if abs(fc) < tol:
+            if reportar is not None:
+                reportar(iteraciones + 1, c, fc, a, b)
+            return c, fc, iteraciones, (min(a, b), max(a, b)), "convergio"
+
+        if fc * fb < 0:
+            # La raíz quedó entre b y c: b pasa a ser el extremo conservado
+            a, fa = b, fb
+        elif metodo == "illinois":
+            fa /= 2
+        else:
+            factor = 1 - fc / fb
+            fa *= factor if factor > 0 else 0.5
+        b, fb = c, fc
+        if reportar is not None and reportar(iteraciones + 1, c, fc, a, b):
+            return c, fc, iteraciones + 1, (min(a, b), max(a, b)), "cancelado"
+    return c, fc, max_iter, (min(a, b), max(a, b)), "max_iter"
+
+
+def _brent(f, a, b, fa, fb, tol, max_iter, reportar=None):
+    """
+    Método de Brent (como zbrent de Numerical Recipes). b es la mejor
+    aproximación, c el extremo opuesto del intervalo y a la aproximación
+    anterior. Retorna la raíz, f en la raíz, las iteraciones, el intervalo y
+    el estado ("convergio" también cuando el intervalo ya no se puede reducir).
+    """
+    epsilon = sys.float_info.epsilon
+    c, fc = b, fb
+    d = e = b - a
+    for iteraciones in range(max_iter):
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol_x = 2 * epsilon * abs(b)
+        medio = 0.5 * (c - b)
+        if abs(fb) < tol or abs(medio) <= tol_x:
+            return b, fb, iteraciones, (min(b, c), max(b, c)), "convergio"
+
+        if abs(e) >= tol_x and abs(fa) > abs(fb):
+            # Interpolación: secante si solo hay dos puntos, si no cuadrática inversa
+            s = fb / fa
+            if a == c:
+                p = 2 * medio * s
+                q = 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2 * medio * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * medio * q - abs(tol_x * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = medio  # La interpolación no sirve: bisección
         else:
-            a = c
-        iteraciones += 1
+            d = e = medio
 
-    raise ValueError("El método no convergió en el número máximo de iteraciones.")
+        a, fa = b, fb
+        b += d if abs(d) > tol_x else (tol_x if medio > 0 else -tol_x)
+        fb = f(b)
+        if reportar is not None and reportar(iteraciones + 1, b, fb, b, c):
+            return b, fb, iteraciones + 1, (min(b, c), max(b, c)), "cancelado"
+    return b, fb, max_iter, (min(b, c), max(b, c)), "max_iter"
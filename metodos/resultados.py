@@ -0,0 +1,321 @@
+"""
+Cache de resultados de los métodos, indexada por el contenido de los datos.
+
+La clave de una llamada es un hash de la función y de todos sus
+argumentos: los arreglos y matrices se identifican por sus bytes (no por
+el archivo del que vienen) y las funciones compiladas con
+compilar_expresion por su expresión de SymPy. Resolver dos veces el mismo
+problema, desde la interfaz, la terminal o un lote, solo calcula la
+primera vez.
+
+Hay dos niveles: uno en memoria (LRU) y otro en disco, una base de SQLite
+compartida entre ejecuciones y procesos, que se limita por tamaño
+descartando los resultados usados hace más tiempo. La cache compartida
+solo usa el disco si la variable de entorno METODOS_CACHE tiene la ruta de
+la base.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+# Cambiarla invalida los resultados guardados (p. ej. si cambia el formato
+# de lo que retorna un método)
+_VERSION = 1
+
+# Argumentos que no cambian el resultado y no forman parte de la clave
+_IGNORADOS = ("callback",)
+
+
+class CacheResultados:
+    """
+    Cache de resultados en memoria (LRU) y en disco (SQLite).
+
+    Los resultados se guardan serializados con pickle, así que cada acierto
+    retorna una copia nueva: modificar lo que retorna no altera la cache.
+    """
+
+    def __init__(self, capacidad=256, archivo=None, max_bytes_disco=256 * 2**20):
+        """
+        Args:
+            capacidad: Máximo de resultados guardados en memoria
+            archivo: Ruta de la base de SQLite (None para no usar el disco)
+            max_bytes_disco: Tamaño máximo de los resultados en disco
+
+        Raises:
+            ValueError: Si la capacidad o el tamaño no son positivos
+        """
+        if not isinstance(capacidad, int) or capacidad <= 0:
+            raise ValueError("capacidad debe ser un entero positivo")
+        if max_bytes_disco <= 0:
+            raise ValueError("max_bytes_disco debe ser positivo")
+        self.capacidad = capacidad
+        self.archivo = archivo
+        self.max_bytes_disco = max_bytes_disco
+
+        self._resultados = OrderedDict()
+        self._candado = threading.Lock()
+        self._conexion = None
+        self.aciertos = 0
+        self.aciertos_disco = 0
+        self.fallos = 0
+
+    def clave(self, funcion, *args, **kwargs):
+        """
+        Retorna la clave (texto hexadecimal) de la llamada funcion(*args, **kwargs),
+        o None si algún argumento no se puede identificar por su contenido
+        (p. ej. una función de Python cualquiera).
+        """
+        h = hashlib.blake2b(digest_size=32)
+        h.update(f"{_VERSION}:{funcion.__module__}.{funcion.__qualname__}".encode())
+        kwargs = {k: v for k, v in kwargs.items() if k not in _IGNORADOS}
+        try:
+            _agregar(h, args)
+            _agregar(h, kwargs)
+        except TypeError:
+            return None
+        return h.hexdigest()
+
+    def obtener(self, clave):
+        """
+        Busca un resultado, primero en memoria y después en disco.
+
+        Returns:
+            Una tupla (encontrado, resultado)
+        """
+        with self._candado:
+            datos = self._resultados.get(clave)
+            if datos is not None:
+                self._resultados.move_to_end(clave)
+                self.aciertos += 1
+                return True, pickle.loads(datos)
+
+        datos = self._leer_disco(clave)
+        with self._candado:
+            if datos is None:
+                self.fallos += 1
+                return False, None
+            self.aciertos_disco += 1
+            self._guardar_memoria(clave, datos)
+        return True, pickle.loads(datos)
+
+    def guardar(self, clave, resultado):
+        """Guarda un resultado en memoria y en disco (si no se puede serializar, no hace nada)."""
+        try:
+            datos = pickle.dumps(resultado, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        with self._candado:
+            self._guardar_memoria(clave, datos)
+        self._escribir_disco(clave, datos)
+
+    def resolver(self, funcion, *args, **kwargs):
+        """
+        Retorna funcion(*args, **kwargs), usando la cache.
+
+        El callback de progreso no forma parte de la clave: con un acierto
+        no se llama. Tampoco se guardan los resultados cuyo estado es
+        "cancelado", ni se usa la cache si algún argumento no tiene clave.
+        """
+        clave = self.clave(funcion, *args, **kwargs)
+        if clave is None:
+            return funcion(*args, **kwargs)
+        encontrado, resultado = self.obtener(clave)
+        if encontrado:
+            return resultado
+        resultado = funcion(*args, **kwargs)
+        if not _cancelado(resultado):
+            self.guardar(clave, resultado)
+        return resultado
+
+    def estadisticas(self):
+        """Retorna un diccionario con los contadores y tamaños de la cache."""
+        en_disco = bytes_disco = 0
+        conexion = self._conectar()
+        if conexion is not None:
+            with self._candado:
+                en_disco, bytes_disco = conexion.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(tamano), 0) FROM resultados"
+                ).fetchone()
+        with self._candado:
+            consultas = self.aciertos + self.aciertos_disco + self.fallos
+            return {
+                "aciertos": self.aciertos,
+                "aciertos_disco": self.aciertos_disco,
+                "fallos": self.fallos,
+                "tasa_aciertos": (
+                    (self.aciertos + self.aciertos_disco) / consultas if consultas else 0.0
+                ),
+                "en_memoria": len(self._resultados),
+                "capacidad": self.capacidad,
+                "en_disco": en_disco,
+                "bytes_disco": bytes_disco,
+                "max_bytes_disco": self.max_bytes_disco,
+            }
+
+    def limpiar(self, disco=False):
+        """Vacía la cache en memoria (y la de disco si disco=True) y reinicia los contadores."""
+        with self._candado:
+            self._resultados.clear()
+            self.aciertos = self.aciertos_disco = self.fallos = 0
+        conexion = self._conectar() if disco else None
+        if conexion is not None:
+            with self._candado, conexion:
+                conexion.execute("DELETE FROM resultados")
+
+    def __len__(self):
+        return len(self._resultados)
+
+    def _guardar_memoria(self, clave, datos):
+        self._resultados[clave] = datos
+        self._resultados.move_to_end(clave)
+        while len(self._resultados) > self.capacidad:
+            self._resultados.popitem(last=False)
+
+    def _conectar(self):
+        """Abre la base la primera vez que se usa (None si no hay disco)."""
+        if self.archivo is None:
+            return None
+        with self._candado:
+            if self._conexion is None:
+                try:
+                    directorio = os.path.dirname(os.path.abspath(self.archivo))
+                    os.makedirs(directorio, exist_ok=True)
+                    # Una conexión para todos los hilos, protegida por el candado
+                    conexion = sqlite3.connect(
+                        self.archivo, timeout=30, check_same_thread=False
+                    )
+                    # WAL permite leer mientras otro proceso escribe
+                    conexion.execute("PRAGMA journal_mode=WAL")
+                    conexion.execute(
+                        "CREATE TABLE IF NOT EXISTS resultados ("
+                        "clave TEXT PRIMARY KEY, datos BLOB NOT NULL, "
+                        "tamano INTEGER NOT NULL, usado REAL NOT NULL)"
+                    )
+                    conexion.execute(
+                        "CREATE INDEX IF NOT EXISTS resultados_usado ON resultados (usado)"
+                    )
+                    conexion.commit()
+                except (OSError, sqlite3.Error):
+                    # Si la base no se puede abrir (sin permisos, archivo
+                    # dañado) se sigue solo con la memoria
+                    self.archivo = None
+                    return None
+                self._conexion = conexion
+            return self._conexion
+
+    def _leer_disco(self, clave):
+        conexion = self._conectar()
+        if conexion is None:
+            return None
+        try:
+            with self._candado, conexion:
+                fila = conexion.execute(
+                    "SELECT datos FROM resultados WHERE clave = ?", (clave,)
+                ).fetchone()
+                if fila is not None:
+                    conexion.execute(
+                        "UPDATE resultados SET usado = ? WHERE clave = ?",
+                        (time.time(), clave),
+                    )
+        except sqlite3.Error:
+            return None
+        return None if fila is None else fila[0]
+
+    def _escribir_disco(self, clave, datos):
+        conexion = self._conectar()
+        if conexion is None or len(datos) > self.max_bytes_disco:
+            return
+        try:
+            with self._candado, conexion:
+                conexion.execute(
+                    "INSERT OR REPLACE INTO resultados VALUES (?, ?, ?, ?)",
+                    (clave, datos, len(datos), time.time()),
+                )
+                # Descartar los usados hace más tiempo hasta caber en el límite
+                total = conexion.execute(
+                    "SELECT SUM(tamano) FROM resultados"
+                ).fetchone()[0]
+                if total > self.max_bytes_disco:
+                    exceso = total - self.max_bytes_disco
+                    descartar = []
+                    for clave_vieja, tamano in conexion.execute(
+                        "SELECT clave, tamano FROM resultados ORDER BY usado"
+                    ):
+                        descartar.append((clave_vieja,))
+                        exceso -= tamano
+                        if exceso <= 0:
+                            break
+                    conexion.executemany(
+                        "DELETE FROM resultados WHERE clave = ?", descartar
+                    )
+        except sqlite3.Error:
+            pass
+
+
+def _agregar(h, valor):
+    """Agrega al hash el contenido de valor, con su tipo para evitar ambigüedades."""
+    if valor is None or isinstance(valor, (bool, int, float, complex, str)):
+        h.update(f"{type(valor).__name__}:{valor!r};".encode())
+    elif isinstance(valor, bytes):
+        h.update(b"bytes:%d;" % len(valor))
+        h.update(valor)
+    elif isinstance(valor, np.generic):
+        _agregar(h, valor.item())
+    elif isinstance(valor, np.ndarray):
+        if valor.dtype == object:
+            raise TypeError("Los arreglos de objetos no tienen clave")
+        h.update(f"ndarray:{valor.dtype.str}:{valor.shape};".encode())
+        # Un arreglo contiguo (o mapeado de un .npy) se lee sin copiarlo
+        h.update(memoryview(np.ascontiguousarray(valor)).cast("B"))
+    elif isinstance(valor, (list, tuple)):
+        h.update(f"{type(valor).__name__}:{len(valor)};".encode())
+        for elemento in valor:
+            _agregar(h, elemento)
+    elif isinstance(valor, dict):
+        h.update(f"dict:{len(valor)};".encode())
+        for k in sorted(valor, key=repr):
+            _agregar(h, k)
+            _agregar(h, valor[k])
+    elif hasattr(valor, "indptr") and hasattr(valor, "indices"):
+        # MatrizCSR o matriz dispersa de SciPy
+        if hasattr(valor, "tocsr"):
+            valor = valor.tocsr()
+        h.update(b"csr;")
+        _agregar(h, tuple(valor.shape))
+        for arreglo in (valor.data, valor.indices, valor.indptr):
+            _agregar(h, np.asarray(arreglo))
+    elif callable(valor) and hasattr(valor, "expresion"):
+        # Función de compilar_expresion: se identifica por su expresión y
+        # por el backend de lambdify, que cambia la aritmética (math no
+        # admite arreglos y redondea distinto que numpy)
+        import sympy as sp
+
+        codigo = valor.__code__
+        h.update(b"expresion;")
+        _agregar(h, sp.srepr(valor.expresion))
+        _agregar(h, codigo.co_varnames[: codigo.co_argcount])
+        _agregar(h, getattr(valor, "backend", None))
+    else:
+        raise TypeError(f"No se puede calcular la clave de {type(valor).__name__}")
+
+
+def _cancelado(resultado):
+    """True si el resultado (o un elemento de la tupla) tiene estado "cancelado"."""
+    elementos = resultado if isinstance(resultado, tuple) else (resultado,)
+    return any(getattr(e, "estado", None) == "cancelado" for e in elementos)
+
+
+def _archivo_por_defecto():
+    """Ruta de la base compartida: $METODOS_CACHE (sin definir o vacía, sin disco)."""
+    return os.environ.get("METODOS_CACHE") or None
+
+
+# Cache compartida por toda la aplicación (la base se abre al primer uso)
+CACHE_RESULTADOS = CacheResultados(archivo=_archivo_por_defecto())
@@ -0,0 +1,94 @@
+import queue
+import threading
+from typing import NamedTuple
+
+
+class Iteracion(NamedTuple):
+    """
+    Estado de un método iterativo al terminar una iteración. Los métodos que
+    aceptan callback lo llaman con uno de estos registros por iteración; si
+    el callback retorna True, el método se detiene con estado "cancelado".
+
+    iteracion : int (número de iteración, empezando en 1)
+    x : aproximación actual (vector de Gauss-Seidel o punto de regla falsa);
+        los vectores son el arreglo que el método sigue modificando, así que
+        hay que copiarlos para guardarlos
+    error : float (cambio máximo entre iteraciones, o ancho del intervalo)
+    residuo : float o None (||b - Ax|| o |f(x)|; None si no se calculó en
+        esta iteración)
+    tiempo : float (segundos desde que empezó el método)
+    """
+
+    iteracion: int
+    x: object
+    error: float
+    residuo: object
+    tiempo: float
+
+
+def trazar(funcion, /, *args, **kwargs):
+    """
+    Generador que ejecuta funcion (gauss_seidel, regla_falsa, lagrange, ...)
+    y produce un Iteracion por cada iteración, a medida que ocurren.
+
+    El método corre en un hilo aparte que espera a que se pida el siguiente
+    registro, así que mientras se procesa uno el método está detenido y
+    x se puede leer sin copiarlo. Salir del ciclo (break) cancela el método.
+    El resultado final del método es el valor de retorno del generador
+    (StopIteration.value, o el resultado de "yield from"); si el método
+    lanza una excepción, el generador la vuelve a lanzar.
+
+    Ejemplo:
+        for paso in trazar(gauss_seidel, A, b, retornar_estado=True):
+            if paso.error < 1e-3:
+                break
+
+    Args:
+        funcion: Método que acepta el argumento callback
+        *args, **kwargs: Argumentos para el método (sin callback)
+
+    Returns:
+        Un generador de registros Iteracion
+    """
+    pasos = queue.Queue(maxsize=1)
+    respuestas = queue.Queue(maxsize=1)
+
+    def callback(paso):
+        pasos.put(("paso", paso))
+        return respuestas.get()
+
+    def ejecutar():
+        try:
+            resultado = funcion(*args, callback=callback, **kwargs)
+        except BaseException as e:
+            pasos.put(("error", e))
+        else:
+            pasos.put(("fin", resultado))
+
+    hilo = threading.Thread(target=ejecutar, daemon=True)
+    hilo.start()
+
+    cancelar = False
+    try:
+        while True:
+            tipo, valor = pasos.get()
+            if tipo == "fin":
+                return valor
+            if tipo == "error":
+                raise valor
+            yield valor
+            respuestas.put(False)
+    except GeneratorExit:
+        cancelar = True
+        raise
+    finally:
+        if cancelar:
+            # El método está esperando respuesta: se le pide detenerse y se
+            # descartan los avisos que alcance a mandar antes de terminar
+            respuestas.put(True)
+            while True:
+                tipo, _ = pasos.get()
+                if tipo != "paso":
+                    break
+                respuestas.put(True)
+        hilo.join()
@@ -0,0 +1,124 @@
+"""
+Prueba de humo de la interfaz: construye la ventana sin pantalla
+(QT_QPA_PLATFORM=offscreen), resuelve una vez en cada página y espera a
+que termine el trabajo en el QThreadPool.
+"""
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PySide6")
+pytest.importorskip("pyqtgraph")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+import app  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def ventana():
+    aplicacion = QApplication.instance() or QApplication([])
+    ventana = app.MainWindow()
+    ventana.show()
+    yield ventana
+    ventana.close()
+    aplicacion.processEvents()
+
+
+def esperar(ventana, pagina, limite=30.0):
+    """Procesa eventos hasta que termina el trabajo de la página."""
+    inicio = time.monotonic()
+    while pagina in ventana.trabajos:
+        assert time.monotonic() - inicio < limite, f"El trabajo de {pagina} no terminó"
+        QApplication.processEvents()
+        time.sleep(0.005)
+    QApplication.processEvents()
+
+
+def test_regla_falsa(ventana):
+    ventana.cambiar_pagina(0)
+    ventana.entrada_funcion.setText("x**2 - 4")
+    ventana.entrada_intervalo.setText("0 5")
+    ventana.entrada_tol.setText("1e-10")
+    ventana.entrada_maxiter.setText("100")
+    ventana.resolver_regla_falsa()
+    esperar(ventana, "regla_falsa")
+    assert "Raíz encontrada: 2.000000" in ventana.salida_regla_falsa.toPlainText()
+
+    ventana.casilla_todas_las_raices.setChecked(True)
+    ventana.entrada_intervalo.setText("-5 5")
+    ventana.resolver_regla_falsa()
+    esperar(ventana, "regla_falsa")
+    assert "Raíces encontradas: 2" in ventana.salida_regla_falsa.toPlainText()
+
+
+def test_gauss_seidel(ventana):
+    ventana.cambiar_pagina(1)
+    ventana.modelo_matriz_a.cambiar_arreglo(np.array([[4.0, 1.0], [1.0, 3.0]]))
+    ventana.modelo_vector_b.cambiar_arreglo(np.array([1.0, 2.0]))
+    ventana.resolver_gauss_seidel()
+    esperar(ventana, "gauss_seidel")
+    salida = ventana.salida_gauss_seidel.toPlainText()
+    assert "x[1] = 0.090909" in salida and "x[2] = 0.636364" in salida
+
+
+def test_lagrange(ventana):
+    ventana.cambiar_pagina(2)
+    ventana.modelo_puntos_lagrange.cambiar_arreglo(np.array([[0.0, 1.0], [1.0, 3.0], [2.0, 7.0]]))
+    ventana.entrada_interpolar.setText("1.5")
+    ventana.resolver_lagrange()
+    esperar(ventana, "lagrange")
+    assert "P(1.5) = 4.75" in ventana.salida_lagrange.toPlainText()
+
+
+def test_panel_de_rendimiento(ventana, tmp_path):
+    ventana.accion_perfil.setChecked(True)
+    QApplication.processEvents()
+    ejecuciones = ventana.perfilador.ejecuciones()
+    assert [e.nombre for e in ejecuciones] == [
+        "regla_falsa",
+        "regla_falsa",
+        "gauss_seidel",
+        "lagrange",
+    ]
+    assert all(e.estado == "ok" for e in ejecuciones)
+    assert "metodo" in ejecuciones[2].fases and "grafica" in ejecuciones[2].fases
+    assert ventana.arbol_perfil.topLevelItemCount() == 4
+
+    ruta = tmp_path / "tiempos.json"
+    ventana.perfilador.exportar_json(str(ruta))
+    assert ruta.stat().st_size > 0
+
+
+def test_cancelar_gauss_seidel(ventana):
+    from benchmarks.casos import laplaciano
+
+    ventana.cambiar_pagina(1)
+    m = 80
+    ventana.modelo_matriz_a.cambiar_arreglo(laplaciano(m))
+    ventana.modelo_vector_b.cambiar_arreglo(np.ones(m * m))
+    ventana.combo_metodo_gauss_seidel.setCurrentText("Gauss-Seidel")
+    ventana.resolver_gauss_seidel()
+    QApplication.processEvents()
+    ventana.cancelar_trabajo("gauss_seidel")
+    assert "gauss_seidel" not in ventana.trabajos
+    assert ventana.etiquetas_progreso["gauss_seidel"].text() == "Cancelado."
+    assert ventana.perfilador.ejecuciones()[-1].estado == "cancelado"
+    assert ventana.pool.waitForDone(30_000)
+
+
+def test_edicion_de_celda_conserva_el_valor(ventana):
+    from PySide6.QtCore import Qt
+
+    modelo = ventana.modelo_vector_b
+    indice = modelo.index(0, 0)
+    assert modelo.setData(indice, "0.1234567890123")
+    texto = modelo.data(indice, Qt.ItemDataRole.EditRole)
+    assert modelo.setData(indice, texto)
+    assert modelo.arreglo[0] == 0.1234567890123
+
+
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from benchmarks.casos import laplaciano
+from metodos.archivos import cargar_arreglo, cargar_sistema, guardar_arreglo
+from metodos.matrizDispersa import MatrizCSR
+
+
+def test_csv_con_un_solo_punto_se_lee_como_tabla(tmp_path):
+    ruta = tmp_path / "puntos.csv"
+    ruta.write_text("1.5,2.5\n")
+    np.testing.assert_array_equal(cargar_arreglo(str(ruta)), [[1.5, 2.5]])
+
+
+def test_vector_guardado_como_texto_se_lee_como_columna(tmp_path):
+    ruta = tmp_path / "b.txt"
+    guardar_arreglo(str(ruta), np.array([1.0, 2.0, 3.0]))
+    assert cargar_arreglo(str(ruta)).shape == (3, 1)
+
+
+@pytest.mark.parametrize("extension", [".csv", ".txt", ".npy", ".mtx"])
+def test_matriz_densa_ida_y_vuelta(tmp_path, extension):
+    A = np.random.default_rng(4).normal(size=(5, 3)) / 7
+    ruta = str(tmp_path / ("A" + extension))
+    guardar_arreglo(ruta, A)
+    leida = cargar_arreglo(ruta)
+    assert isinstance(leida, np.ndarray)
+    # Los formatos de texto guardan 17 cifras: el valor vuelve exacto
+    np.testing.assert_array_equal(leida, A)
+
+
+def test_npy_se_mapea_en_memoria(tmp_path):
+    ruta = str(tmp_path / "b.npy")
+    guardar_arreglo(ruta, np.arange(4.0))
+    assert isinstance(cargar_arreglo(ruta), np.memmap)
+    assert not isinstance(cargar_arreglo(ruta, mapear=False), np.memmap)
+
+
+def test_sistema_en_npz_ida_y_vuelta(tmp_path):
+    A, b = np.eye(3) * 2, np.array([1.0, 2.0, 3.0])
+    ruta = str(tmp_path / "sistema.npz")
+    guardar_arreglo(ruta, A, b=b)
+    A_leida, b_leido = cargar_sistema(ruta)
+    np.testing.assert_array_equal(A_leida, A)
+    np.testing.assert_array_equal(b_leido, b)
+    with pytest.raises(ValueError, match="varios arreglos"):
+        cargar_arreglo(ruta)
+
+
+def test_matriz_csr_en_mtx_ida_y_vuelta(tmp_path):
+    A = laplaciano(5)
+    ruta = str(tmp_path / "A.mtx")
+    guardar_arreglo(ruta, A)
+    leida = cargar_arreglo(ruta)
+    assert isinstance(leida, MatrizCSR)
+    assert leida.shape == A.shape and leida.nnz == A.nnz
+    np.testing.assert_array_equal(leida.a_densa(), A.a_densa())
+
+
+def test_mtx_simetrico_completa_el_triangulo_superior(tmp_path):
+    ruta = tmp_path / "S.mtx"
+    ruta.write_text(
+        "%%MatrixMarket matrix coordinate real symmetric\n"
+        "% comentario\n"
+        "3 3 4\n1 1 4\n2 1 -1\n2 2 4\n3 3 4\n"
+    )
+    np.testing.assert_array_equal(
+        cargar_arreglo(str(ruta)).a_densa(), [[4, -1, 0], [-1, 4, 0], [0, 0, 4]]
+    )
+
+
+def test_formato_no_soportado(tmp_path):
+    with pytest.raises(ValueError, match="Formato no soportado"):
+        guardar_arreglo(str(tmp_path / "A.xlsx"), np.eye(2))
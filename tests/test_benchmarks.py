@@ -0,0 +1,28 @@
+from benchmarks.__main__ import comparar
+
+
+def resultado(estado, iteraciones, mediana):
+    return {
+        "nombre": "gauss_seidel/dispersa/n=4096/desplazamiento=0",
+        "tiempo": {"mediana": mediana},
+        "iteraciones": iteraciones,
+        "evaluaciones": None,
+        "estado": estado,
+    }
+
+
+def test_dejar_de_converger_es_regresion_aunque_sea_mas_rapido():
+    base = {"resultados": [resultado("convergio", 6000, 0.7)]}
+    actual = {"resultados": [resultado("estancado", 80, 0.01)]}
+    lineas, regresiones = comparar(base, actual, 0.2)
+    assert regresiones == 1
+    assert "convergio -> estancado" in lineas[1]
+
+
+def test_base_sin_estado_no_falla():
+    anterior = resultado("convergio", 6000, 0.7)
+    del anterior["estado"]
+    _, regresiones = comparar(
+        {"resultados": [anterior]}, {"resultados": [resultado("convergio", 6000, 0.7)]}, 0.2
+    )
+    assert regresiones == 0
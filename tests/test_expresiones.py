@@ -0,0 +1,52 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from metodos.expresiones import CacheExpresiones, FuncionSerializable
+
+
+def test_aciertos_y_fallos_en_memoria():
+    cache = CacheExpresiones(capacidad=2)
+    f = cache.compilar("x**2 - 4")
+    assert cache.compilar(" x ** 2 - 4 ") is f
+    # Otro texto con la misma expresión: fallo, pero misma función
+    assert cache.compilar("-4 + x**2") is f
+    assert cache.estadisticas()["aciertos"] == 1
+    assert cache.estadisticas()["fallos"] == 2
+    assert f(np.array([1.0, 2.0])).tolist() == [-3.0, 0.0]
+
+    # Otro backend es otra función
+    assert cache.compilar("x**2 - 4", backend="math") is not f
+
+    # La capacidad se respeta descartando la menos usada
+    cache.compilar("sin(x)")
+    assert len(cache) == 2
+
+
+def test_texto_invalido():
+    with pytest.raises(ValueError, match="interpretar"):
+        CacheExpresiones().compilar("x +* 2")
+    with pytest.raises(ValueError, match="Introduzca"):
+        CacheExpresiones().compilar("   ")
+
+
+def test_nivel_en_disco_sobrevive_a_otra_cache(tmp_path):
+    primera = CacheExpresiones(directorio=tmp_path)
+    primera.compilar("exp(x) - 10")
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+    segunda = CacheExpresiones(directorio=tmp_path)
+    f = segunda.compilar("exp(x) - 10")
+    assert segunda.estadisticas()["aciertos_disco"] == 1
+    assert f(0.0) == -9.0
+
+    segunda.limpiar(disco=True)
+    assert list(tmp_path.glob("*.pkl")) == []
+
+
+def test_funcion_serializable_viaja_como_texto():
+    f = CacheExpresiones().compilar("x*y + 1", variables=("x", "y"), backend="math")
+    copia = pickle.loads(pickle.dumps(FuncionSerializable(f)))
+    assert copia(2.0, 3.0) == 7.0
+    assert copia.funcion.backend == "math"
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from benchmarks.casos import laplaciano
+from metodos.gaussSeidel import gauss_seidel, gauss_seidel_lote
+from metodos.matrizDispersa import MatrizCSR
+
+
+def test_laplaciano_que_converge_despacio_no_se_declara_estancado():
+    # Al empezar, el cambio máximo se queda plano durante muchos barridos
+    A = laplaciano(60)
+    b = np.ones(60 * 60)
+    x, estado = gauss_seidel(
+        A, b, 1e-6, 200_000, metodo="ssor", retornar_estado=True
+    )
+    assert estado.estado == "convergio"
+    assert estado.iteraciones > 200
+    assert estado.residuo < 1e-4
+
+
+def test_sistema_sin_esperanza_se_declara_estancado():
+    # Con 3000 iteraciones no llega: debe cortarse antes de agotarlas
+    A = laplaciano(100)
+    _, estado = gauss_seidel(A, np.ones(100 * 100), 1e-6, 3000, retornar_estado=True)
+    assert estado.estado == "estancado"
+    assert estado.iteraciones < 3000
+
+
+def test_varias_columnas_reportan_las_iteraciones_hechas_al_detenerse():
+    _, estado = gauss_seidel([[1, 3], [3, 1]], np.ones((2, 2)), retornar_estado=True)
+    assert estado.estado == "diverge"
+    assert estado.iteraciones[0] == estado.iteraciones[1] < 20
+
+
+def test_lote_cancelado_reporta_las_iteraciones_hechas():
+    A = np.array([[[4.0, 1.0], [1.0, 3.0]], [[1.0, 0.9], [0.9, 1.0]]])
+    b = np.ones((2, 2))
+    _, estado = gauss_seidel_lote(
+        A, b, 1e-14, 1000, retornar_estado=True, callback=lambda paso: paso.iteracion == 5
+    )
+    assert estado.estado == "cancelado"
+    assert estado.iteraciones[1] == 5
+
+
+def test_sistema_que_oscila_se_corta_antes_de_max_iter_por_defecto():
+    # La iteración de Gauss-Seidel tiene un valor propio de módulo 1: ni
+    # converge ni diverge
+    _, estado = gauss_seidel([[1, 1], [-1, 1]], [1, 1], retornar_estado=True)
+    assert estado.estado == "estancado"
+    assert estado.iteraciones < 1000
+
+
+def test_ssor_multicolor_se_rechaza():
+    A = laplaciano(4)
+    with pytest.raises(ValueError, match="SSOR"):
+        gauss_seidel(A, np.ones(16), metodo="ssor", multicolor=True)
+
+
+def sistema_disperso(n, semilla):
+    """Matriz dispersa de diagonal dominante, densa y en CSR, y un b."""
+    rng = np.random.default_rng(semilla)
+    A = np.where(rng.random((n, n)) < 0.05, rng.uniform(-1, 1, (n, n)), 0.0)
+    A[np.diag_indices(n)] = np.abs(A).sum(axis=1) + 1.0
+    return A, MatrizCSR.desde_densa(A), rng.normal(size=n)
+
+
+def test_matriz_csr_coincide_con_solve_y_con_la_densa():
+    A, A_csr, b = sistema_disperso(80, 2)
+    x, iteraciones = gauss_seidel(A_csr, b, 1e-12, 1000)
+    x_densa, iteraciones_densa = gauss_seidel(A, b, 1e-12, 1000)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), rtol=1e-9, atol=1e-10)
+    np.testing.assert_allclose(x, x_densa, rtol=1e-12, atol=1e-14)
+    assert iteraciones == iteraciones_densa
+
+
+@pytest.mark.parametrize("hilos", [1, 4])
+def test_multicolor_coincide_con_solve(hilos):
+    A = laplaciano(12)
+    b = np.arange(144, dtype=float)
+    x, _ = gauss_seidel(A, b, 1e-12, 5000, multicolor=True, hilos=hilos)
+    np.testing.assert_allclose(x, np.linalg.solve(A.a_densa(), b), rtol=1e-8)
+
+    # Con una matriz sin estructura de malla también (más de dos colores)
+    A, A_csr, b = sistema_disperso(60, 3)
+    x, _ = gauss_seidel(A_csr, b, 1e-12, 1000, multicolor=True, hilos=hilos)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), rtol=1e-9, atol=1e-10)
+
+
+@pytest.mark.parametrize("metodo", ["sor", "ssor"])
+@pytest.mark.parametrize("omega", [None, 1.5])
+def test_sor_y_ssor_coinciden_con_solve(metodo, omega):
+    A = laplaciano(15)
+    b = np.ones(225)
+    x, iteraciones = gauss_seidel(A, b, 1e-12, 20_000, metodo=metodo, omega=omega)
+    np.testing.assert_allclose(x, np.linalg.solve(A.a_densa(), b), rtol=1e-8)
+
+    # Relajar bien tiene que costar menos iteraciones que Gauss-Seidel
+    _, iteraciones_gs = gauss_seidel(A, b, 1e-12, 20_000)
+    assert iteraciones < iteraciones_gs
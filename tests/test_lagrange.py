@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from metodos.lagrange import InterpoladorLagrange, InterpoladorLocal
+
+
+@pytest.mark.parametrize("puntos", [[1, 2, 3], np.ones((4, 3)), np.ones((2, 2, 2))])
+def test_puntos_sin_dos_columnas_se_rechazan(puntos):
+    with pytest.raises(ValueError, match="dos columnas"):
+        InterpoladorLagrange(puntos)
+
+
+def test_puntos_vacios_se_rechazan():
+    with pytest.raises(ValueError, match="al menos un punto"):
+        InterpoladorLagrange([])
+
+
+def test_agregar_puntos_que_amplian_el_intervalo_coincide_con_reconstruir():
+    # Cada punto amplía el intervalo: los pesos tienen que cambiar de escala
+    interpolador = InterpoladorLagrange([(0, 0.0), (1, np.sin(1 / 50))])
+    for x in range(2, 400):
+        interpolador.agregar_punto(x, np.sin(x / 50))
+    reconstruido = InterpoladorLagrange(interpolador.puntos)
+
+    centro = np.linspace(195.5, 204.5, 7)
+    np.testing.assert_allclose(interpolador(centro), reconstruido(centro), rtol=1e-9)
+    np.testing.assert_allclose(interpolador(centro), np.sin(centro / 50), rtol=1e-6)
+
+    for x in range(0, 150, 3):
+        interpolador.eliminar_punto(x)
+    reconstruido = InterpoladorLagrange(interpolador.puntos)
+    np.testing.assert_allclose(interpolador(centro), reconstruido(centro), rtol=1e-9)
+
+
+def test_forma_baricentrica_coincide_con_polyfit():
+    rng = np.random.default_rng(0)
+    x = np.cos(np.pi * (np.arange(9) + 0.5) / 9) * 3 + 1
+    y = rng.normal(size=9)
+    interpolador = InterpoladorLagrange(np.column_stack([x, y]))
+
+    evaluar = np.linspace(-2, 4, 101)
+    esperado = np.polyval(np.polyfit(x, y, 8), evaluar)
+    np.testing.assert_allclose(interpolador(evaluar), esperado, rtol=1e-8, atol=1e-8)
+    # En los nodos el interpolante pasa exactamente por los puntos
+    np.testing.assert_array_equal(interpolador(x), y)
+
+
+def test_interpolacion_local_usa_el_polinomio_de_los_nodos_cercanos():
+    rng = np.random.default_rng(1)
+    x = np.sort(rng.uniform(0, 10, 60))
+    y = np.sin(x)
+    # Los puntos se pueden dar en cualquier orden
+    orden = rng.permutation(len(x))
+    interpolador = InterpoladorLocal(np.column_stack([x[orden], y[orden]]), grado=3)
+
+    # Tramo [x_20, x_21]: cúbica por los nodos 19 a 22
+    t = np.linspace(x[20], x[21], 11)
+    esperado = np.polyval(np.polyfit(x[19:23], y[19:23], 3), t)
+    np.testing.assert_allclose(interpolador(t), esperado, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(interpolador(x), y, atol=1e-12)
+
+
+def test_interpolacion_local_reproduce_un_polinomio_de_su_grado():
+    x = np.linspace(-3, 5, 40)
+    coeficientes = [0.5, -2.0, 1.0, 3.0]
+    interpolador = InterpoladorLocal(np.column_stack([x, np.polyval(coeficientes, x)]))
+
+    # También al extrapolar fuera de [x_0, x_(n-1)]
+    evaluar = np.linspace(-4, 6, 57)
+    np.testing.assert_allclose(
+        interpolador(evaluar), np.polyval(coeficientes, evaluar), rtol=1e-10, atol=1e-10
+    )
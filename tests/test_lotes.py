@@ -0,0 +1,62 @@
+import json
+
+from metodos import lotes
+
+
+def test_trabajos_mal_formados_dan_una_linea_de_error(tmp_path):
+    entrada = tmp_path / "trabajos.jsonl"
+    salida = tmp_path / "resultados.jsonl"
+    trabajos = [
+        {"tipo": "lagrange", "puntos": [1, 2, 3]},
+        {"tipo": "lagrange", "puntos": [[0, 1], [1, 3]], "x": 0.5},
+        {"tipo": "regla-falsa", "funcion": "x**2 - 4", "a": 0},
+    ]
+    entrada.write_text("".join(json.dumps(t) + "\n" for t in trabajos) + "{no es json\n")
+
+    resumen = lotes.ejecutar_lote(str(entrada), str(salida), procesos=1, usar_cache=False)
+
+    lineas = [json.loads(linea) for linea in salida.read_text().splitlines()]
+    assert [linea["linea"] for linea in lineas] == [1, 2, 3, 4]
+    assert resumen["procesadas"] == 4 and resumen["errores"] == 3
+    assert "dos columnas" in lineas[0]["error"]
+    assert lineas[1]["resultado"]["valores"] == 2.0
+    assert "error" in lineas[2] and "error" in lineas[3]
+
+
+def test_cualquier_excepcion_de_un_trabajo_queda_en_su_linea(monkeypatch):
+    def fallar(trabajo):
+        raise IndexError("índice fuera de rango")
+
+    monkeypatch.setattr(lotes, "ejecutar_trabajo", fallar)
+    texto, errores = lotes._ejecutar_bloque([(1, '{"tipo": "lagrange"}')], usar_cache=False)
+    assert errores == 1
+    assert json.loads(texto) == {"linea": 1, "error": "IndexError: índice fuera de rango"}
+
+
+def test_reanudar_continua_despues_de_la_ultima_linea_completa(tmp_path):
+    entrada = tmp_path / "trabajos.jsonl"
+    trabajos = [
+        {"tipo": "lagrange", "puntos": [[0, 1], [1, 3], [2, 7]], "x": i / 4}
+        for i in range(10)
+    ]
+    entrada.write_text("".join(json.dumps(t) + "\n" for t in trabajos))
+    opciones = {"procesos": 2, "tamano_bloque": 3, "usar_cache": False}
+
+    completa = tmp_path / "completa.jsonl"
+    resumen = lotes.ejecutar_lote(str(entrada), str(completa), **opciones)
+    assert resumen == {"procesadas": 10, "omitidas": 0, "errores": 0}
+    esperado = completa.read_text().splitlines()
+
+    # Una ejecución anterior que se cortó a mitad de la quinta línea
+    salida = tmp_path / "resultados.jsonl"
+    salida.write_text("\n".join(esperado[:4]) + "\n" + esperado[4][:10])
+    resumen = lotes.ejecutar_lote(str(entrada), str(salida), **opciones)
+    assert resumen == {"procesadas": 6, "omitidas": 4, "errores": 0}
+    assert salida.read_text().splitlines() == esperado
+
+    # Ya terminada, reanudar no hace nada; sin reanudar se rehace todo
+    resumen = lotes.ejecutar_lote(str(entrada), str(salida), **opciones)
+    assert resumen == {"procesadas": 0, "omitidas": 10, "errores": 0}
+    resumen = lotes.ejecutar_lote(str(entrada), str(salida), reanudar=False, **opciones)
+    assert resumen["procesadas"] == 10
+    assert salida.read_text().splitlines() == esperado
@@ -0,0 +1,84 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from metodos.expresiones import compilar_expresion
+from metodos.reglaFalsa import (
+    ContadorEvaluaciones,
+    regla_falsa,
+    regla_falsa_lote,
+    todas_las_raices,
+)
+
+
+def test_todas_las_raices_con_procesos_acepta_expresiones_compiladas():
+    f = compilar_expresion("sin(x)")
+    raices = todas_las_raices(f, 0.5, 10, tol=1e-10, paralelo="procesos", trabajadores=2)
+    np.testing.assert_allclose(raices, [np.pi, 2 * np.pi, 3 * np.pi], atol=1e-8)
+
+
+def test_lote_no_reporta_como_raiz_un_valor_no_finito():
+    # c = 1 en la primera iteración, donde f no está definida
+    f = lambda x: np.where(x == 1.0, np.nan, x - 1)
+    raices, _, estados = regla_falsa_lote(f, [0.0, 0.5], [2.0, 1.25])
+    assert list(estados) == ["no_finito", "no_finito"]
+    assert np.isnan(raices).all()
+
+
+def test_lote_sin_avance_tiene_su_propio_estado():
+    # Con tol tan chica el intervalo se agota antes de llegar a la tolerancia
+    raices, _, estados = regla_falsa_lote(
+        lambda x: x**3 - 2, [0.0, 0.0], [2.0, 3.0], tol=1e-300, max_iter=5000, metodo="clasica"
+    )
+    assert list(estados) == ["sin_avance", "sin_avance"]
+    np.testing.assert_allclose(raices, 2 ** (1 / 3))
+
+
+def test_lote_rechaza_max_iter_no_positivo():
+    with pytest.raises(ValueError, match="max_iter"):
+        regla_falsa_lote(lambda x: x, [-1.0], [1.0], max_iter=0)
+
+
+@pytest.mark.parametrize("texto, a, b", [("exp(x) - 10", 0, 5), ("x**10 - 1", 0, 1.3)])
+def test_variantes_modificadas_evaluan_mucho_menos_que_la_clasica(texto, a, b):
+    evaluaciones = {}
+    for metodo in ("clasica", "illinois", "anderson-bjorck", "brent"):
+        f = ContadorEvaluaciones(compilar_expresion(texto))
+        c, estado = regla_falsa(f, a, b, 1e-10, 10_000, metodo=metodo, retornar_estado=True)
+        assert estado.convergio
+        assert abs(f.f(c)) < 1e-10
+        # El estado cuenta exactamente las evaluaciones hechas
+        assert estado.evaluaciones == f.evaluaciones
+        assert estado.evaluaciones <= estado.iteraciones + 3
+        evaluaciones[metodo] = estado.evaluaciones
+
+    for metodo in ("illinois", "anderson-bjorck", "brent"):
+        assert evaluaciones[metodo] <= 30
+        assert 3 * evaluaciones[metodo] < evaluaciones["clasica"]
+
+
+def test_procesos_despues_de_gauss_seidel_multicolor_no_cuelgan_al_salir():
+    # Con los hilos de Numba ya creados, un fork dejaba el proceso colgado
+    # al terminar
+    codigo = (
+        "import numpy as np\n"
+        "from benchmarks.casos import laplaciano\n"
+        "from metodos.expresiones import compilar_expresion\n"
+        "from metodos.gaussSeidel import gauss_seidel\n"
+        "from metodos.reglaFalsa import todas_las_raices\n"
+        "gauss_seidel(laplaciano(12), np.ones(144), 1e-10, 5000, multicolor=True)\n"
+        "f = compilar_expresion('sin(x)')\n"
+        "print(len(todas_las_raices(f, 0.5, 10, paralelo='procesos', trabajadores=2)))\n"
+    )
+    resultado = subprocess.run(
+        [sys.executable, "-c", codigo],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert resultado.returncode == 0, resultado.stderr
+    assert resultado.stdout.strip() == "3"
@@ -0,0 +1,76 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from metodos.expresiones import compilar_expresion
+from metodos.resultados import CacheResultados
+
+
+def resolver(f, a):
+    return f(a)
+
+
+llamadas = []
+
+
+def sumar(x, estado="convergio", callback=None):
+    llamadas.append(x)
+    return np.sum(x), SimpleNamespace(estado=estado)
+
+
+def test_la_clave_distingue_el_backend_de_la_funcion():
+    cache = CacheResultados()
+    f_numpy = compilar_expresion("x**2 - 2", backend="numpy")
+    f_math = compilar_expresion("x**2 - 2", backend="math")
+    assert cache.clave(resolver, f_numpy, 1.0) != cache.clave(resolver, f_math, 1.0)
+    assert cache.clave(resolver, f_numpy, 1.0) == cache.clave(
+        resolver, compilar_expresion("x**2 - 2"), 1.0
+    )
+
+
+def test_aciertos_y_fallos_en_memoria():
+    llamadas.clear()
+    cache = CacheResultados(capacidad=2)
+    x = np.arange(5.0)
+    total, _ = cache.resolver(sumar, x, callback=print)
+    # El callback no forma parte de la clave; arreglos iguales sí comparten
+    assert cache.resolver(sumar, x.copy())[0] == total == 10.0
+    assert len(llamadas) == 1
+    assert cache.estadisticas()["aciertos"] == 1
+    assert cache.estadisticas()["fallos"] == 1
+
+    # Los resultados cancelados no se guardan
+    cache.resolver(sumar, x, estado="cancelado")
+    cache.resolver(sumar, x, estado="cancelado")
+    assert len(llamadas) == 3
+
+    # Un argumento sin clave (función de Python) no usa la cache
+    cache.resolver(resolver, lambda a: a, 1.0)
+    assert cache.estadisticas()["fallos"] == 3
+
+
+def test_nivel_en_disco_sobrevive_a_otra_cache(tmp_path):
+    llamadas.clear()
+    archivo = tmp_path / "resultados.sqlite"
+    CacheResultados(archivo=str(archivo)).resolver(sumar, [1.0, 2.0])
+
+    segunda = CacheResultados(archivo=str(archivo))
+    assert segunda.resolver(sumar, [1.0, 2.0])[0] == 3.0
+    assert len(llamadas) == 1
+    estadisticas = segunda.estadisticas()
+    assert estadisticas["aciertos_disco"] == 1
+    assert estadisticas["en_disco"] == 1
+
+    segunda.limpiar(disco=True)
+    assert segunda.estadisticas()["en_disco"] == 0
+    segunda.resolver(sumar, [1.0, 2.0])
+    assert len(llamadas) == 2
+
+
+def test_disco_se_limita_por_tamano(tmp_path):
+    cache = CacheResultados(archivo=str(tmp_path / "r.sqlite"), max_bytes_disco=600)
+    for i in range(10):
+        cache.resolver(sumar, np.full(50, float(i)))
+    estadisticas = cache.estadisticas()
+    assert 0 < estadisticas["bytes_disco"] <= 600
+    assert estadisticas["en_disco"] < 10